@@ -0,0 +1,61 @@
+"""Замер разбора ответа сервера: время и пик памяти для json.loads в словари против json_codec.loads и записей.
+
+Запуск: python benchmarks/bench_decode.py [число записей]
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic import json_codec  # noqa: E402
+from logic.records import Computer, parse_records  # noqa: E402
+
+STATUSES = ("available", "rented", "maintenance")
+
+
+def make_payload(count):
+    return json.dumps([{"id": key, "name": f"PC-{key}", "configuration": "Ryzen 5 / RTX 3060 / 16 ГБ",
+                        "status": STATUSES[key % len(STATUSES)],
+                        "rental_end_time": "2026-05-01T12:30:15.123456" if key % 3 == 1 else None}
+                       for key in range(count)], ensure_ascii=False).encode()
+
+
+def measure(func, repeat=20):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def retained(func):
+    """Пик памяти при разборе и объем, который занимает результат, в КБ."""
+    tracemalloc.start()
+    result = func()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / 1024, size / 1024
+
+
+def main(count):
+    payload = make_payload(count)
+    codec = "orjson" if json_codec.orjson is not None else "json"
+    rows = (("json.loads, словари", lambda: json.loads(payload)),
+            (f"json_codec.loads ({codec})", lambda: json_codec.loads(payload)),
+            ("json_codec + Computer", lambda: parse_records(Computer, json_codec.loads(payload))))
+    print(f"{count} записей, ответ {len(payload) / 1024:.0f} КБ")
+    print(f"{'':<28}{'p50, мс':>10}{'пик, КБ':>12}{'итог, КБ':>12}")
+    for name, func in rows:
+        elapsed = measure(func)
+        peak, size = retained(func)
+        print(f"{name:<28}{elapsed:>10.2f}{peak:>12.0f}{size:>12.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
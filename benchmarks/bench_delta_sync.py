@@ -0,0 +1,93 @@
+"""Замер синхронизации коллекции компьютеров: полный список на каждый опрос против дельты since=<версия>.
+
+Локальный сервер хранит 500 компьютеров и перед каждым опросом меняет статус нескольких из них. Показывает байт
+ответа на опрос (по метрике received NetworkLayer) и время sync_collection с разбором и слиянием в хранилище.
+
+Запуск: python benchmarks/bench_delta_sync.py [число опросов] [изменений на опрос]
+"""
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from logic.business_logic import BusinessLogic  # noqa: E402
+from logic.local_cache import LocalCache  # noqa: E402
+from logic.network_layer import NetworkLayer  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+COUNT = 500
+LOGIN = {"access_token": "token", "role": "admin", "expires_in": 1800}
+
+
+class ComputersServer:
+    """Коллекция на сервере с версиями изменений; отвечает дельтой или, если delta=False, полным списком."""
+
+    def __init__(self, delta):
+        self.delta = delta
+        self.version = 1
+        self.computers = {key: {"id": key, "name": f"PC-{key}", "configuration": "Ryzen 5 / RTX 3060",
+                                "status": "available", "rental_end_time": None, "version": 1}
+                          for key in range(1, COUNT + 1)}
+
+    def change(self, count):
+        self.version += 1
+        for key in random.sample(sorted(self.computers), count):
+            busy = self.computers[key]["status"] == "available"
+            self.computers[key] = dict(self.computers[key], status="busy" if busy else "available",
+                                       rental_end_time="2026-10-18T21:00:00" if busy else None,
+                                       version=self.version)
+
+    def handle(self, request):
+        rows = [{field: value for field, value in row.items() if field != "version"}
+                for row in self.computers.values()]
+        if not self.delta:
+            return 200, rows, None
+        since = int(request.params.get("since", 0))
+        upserts = [row for row, source in zip(rows, self.computers.values()) if source["version"] > since]
+        return 200, {"version": self.version, "upserts": upserts, "deleted": [], "full": since == 0}, None
+
+
+def measure(delta, polls, changes):
+    """Возвращает байт ответа на опрос и время опроса p50/p99 в мс (без первой полной загрузки)."""
+    computers = ComputersServer(delta)
+    with StubServer() as server:
+        server.reply("POST", "/auth/login", body=LOGIN)
+        server.route("GET", "/computers", computers.handle)
+        network_layer = NetworkLayer(base_url=server.url)
+        logic = BusinessLogic(network_layer, LocalCache(":memory:"))
+        logic.authenticate_user("admin", "secret")
+        logic.sync_collection("computers")
+        received = bytes_received(network_layer)
+        samples = []
+        for _ in range(polls):
+            computers.change(changes)
+            started = time.perf_counter()
+            logic.sync_collection("computers")
+            samples.append(time.perf_counter() - started)
+        received = bytes_received(network_layer) - received
+        assert len(logic.computer_store.records()) == COUNT
+        logic.close()
+        network_layer.close()
+    samples.sort()
+    return received / polls, samples[len(samples) // 2] * 1000, samples[int(len(samples) * 0.99)] * 1000
+
+
+def bytes_received(network_layer):
+    return sum(entry["received"] for entry in network_layer.metrics.snapshot()["requests"]
+               if entry["method"] == "GET")
+
+
+def main(polls, changes):
+    print(f"{polls} опросов GET /computers, {COUNT} записей, {changes} изменений на опрос")
+    print(f"{'':<16}{'байт/опрос':>12}{'p50, мс':>10}{'p99, мс':>10}")
+    for name, delta in (("полный список", False), ("дельта", True)):
+        size, median, p99 = measure(delta, polls, changes)
+        print(f"{name:<16}{size:>12.0f}{median:>10.2f}{p99:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200, int(sys.argv[2]) if len(sys.argv) > 2 else 5)
@@ -0,0 +1,61 @@
+"""Замер HTTP-клиента на локальном сервере: новое соединение на каждый запрос против общего клиента NetworkLayer.
+
+Показывает число запросов в секунду и задержки p50/p99 при последовательных и параллельных запросах.
+
+Запуск: python benchmarks/bench_http_client.py [число запросов]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from logic.network_layer import NetworkLayer  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+COMPUTERS = [{"id": key, "name": f"PC-{key}", "configuration": "Ryzen 5 / RTX 3060", "status": "available",
+              "rental_end_time": None} for key in range(50)]
+
+
+def old_get(url):
+    """Прежний путь: httpx.get открывает и закрывает соединение на каждый запрос."""
+    response = httpx.get(url + "/computers", timeout=10)
+    return response.json()
+
+
+def run(request, count, workers):
+    """Выполняет count запросов в workers потоков; возвращает запросов в секунду и задержки p50/p99 в мс."""
+    def timed(_):
+        started = time.perf_counter()
+        request()
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        samples = sorted(pool.map(timed, range(count)))
+    elapsed = time.perf_counter() - started
+    return count / elapsed, samples[len(samples) // 2] * 1000, samples[int(len(samples) * 0.99)] * 1000
+
+
+def main(count):
+    with StubServer() as server:
+        server.reply("GET", "/computers", body=COMPUTERS)
+        network_layer = NetworkLayer(base_url=server.url)
+        rows = (("httpx.get на запрос", lambda: old_get(server.url)),
+                ("NetworkLayer (пул)", lambda: network_layer.request("GET", "/computers")))
+        print(f"{count} запросов GET /computers ({len(COMPUTERS)} записей)")
+        print(f"{'':<22}{'потоков':>9}{'запр./с':>10}{'p50, мс':>10}{'p99, мс':>10}")
+        for workers in (1, 8):
+            for name, request in rows:
+                rps, median, p99 = run(request, count, workers)
+                print(f"{name:<22}{workers:>9}{rps:>10.0f}{median:>10.2f}{p99:>10.2f}")
+        network_layer.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
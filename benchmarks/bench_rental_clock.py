@@ -0,0 +1,53 @@
+"""Замер обратного отсчета аренды: тик RentalDeadlines против прежнего разбора strptime на каждом тике.
+
+Запуск: python benchmarks/bench_rental_clock.py [число аренд]
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.rental_clock import RentalDeadlines  # noqa: E402
+
+
+def make_rentals(count):
+    start = datetime.now()
+    return [(key, (start + timedelta(seconds=60 + key)).strftime("%Y-%m-%dT%H:%M:%S.%f")) for key in range(count)]
+
+
+def strptime_tick(rentals):
+    """Прежний путь: каждую секунду каждая строка времени разбиралась заново."""
+    now = datetime.now()
+    return {key: max(datetime.strptime(end_time, "%Y-%m-%dT%H:%M:%S.%f") - now, timedelta(0))
+            for key, end_time in rentals}
+
+
+def measure(func, repeat=50):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000, samples[int(len(samples) * 0.99)] * 1000
+
+
+def main(count):
+    rentals = make_rentals(count)
+    deadlines = RentalDeadlines()
+    started = time.perf_counter()
+    deadlines.update(rentals)
+    print(f"{count} аренд: первичный разбор {(time.perf_counter() - started) * 1000:.2f} мс")
+    rows = (("strptime на каждом тике", lambda: strptime_tick(rentals)),
+            ("RentalDeadlines.tick", deadlines.tick),
+            ("update без изменений", lambda: deadlines.update(rentals)))
+    print(f"{'':<26}{'p50, мс':>10}{'p99, мс':>10}")
+    for name, func in rows:
+        median, p99 = measure(func)
+        print(f"{name:<26}{median:>10.3f}{p99:>10.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
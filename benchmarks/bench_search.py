@@ -0,0 +1,68 @@
+"""Замер поиска в таблице: построение индекса, поиск по нажатию клавиши и применение фильтра к модели.
+
+Запуск: python benchmarks/bench_search.py [число записей]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from logic.records import Staff  # noqa: E402
+from logic.search_index import SearchIndex  # noqa: E402
+from ui.table_models import Column, RecordTableModel, RecordTableView  # noqa: E402
+
+NAMES = ("Иван", "Пётр", "Алёна", "Ольга", "Дмитрий", "sergey", "anna")
+QUERIES = ("п", "пе", "пет", "петр", "петр1", "петр12", "mail", "club.ru", "+7900")
+
+
+def make_staff(count):
+    return [Staff.from_dict({"id": key, "login": f"{NAMES[key % len(NAMES)]}{key}",
+                             "email": f"user{key}@{'mail.com' if key % 2 else 'club.ru'}",
+                             "phone": f"+7900{key:07d}"}) for key in range(count)]
+
+
+def measure(func, repeat=50):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000, samples[int(len(samples) * 0.99)] * 1000
+
+
+def main(count):
+    app = QApplication.instance() or QApplication([])
+    staff = make_staff(count)
+
+    index = SearchIndex(("id", "login", "email", "phone"))
+    started = time.perf_counter()
+    index.update(staff)
+    print(f"{count} записей: построение индекса {(time.perf_counter() - started) * 1000:.0f} мс")
+    changed = staff[:-10] + [Staff.from_dict(dict(record.to_dict(), login="Новый")) for record in staff[-10:]]
+    started = time.perf_counter()
+    index.update(changed)
+    print(f"обновление 10 записей: {(time.perf_counter() - started) * 1000:.1f} мс")
+    index.update(staff)
+
+    model = RecordTableModel([Column("ID", "id"), Column("Логин", "login"), Column("Email", "email")],
+                             batch_size=100)
+    view = RecordTableView(model)
+    model.set_records(staff)
+    print(f"{'запрос':<10}{'найдено':>9}{'поиск p50/p99, мс':>22}{'фильтр p50/p99, мс':>22}")
+    for query in QUERIES:
+        keys = index.search(query)
+        search = measure(lambda: index.search(query))
+        table = measure(lambda: (model.set_filter(None), model.set_filter(keys)))
+        print(f"{query:<10}{len(keys):>9}{search[0]:>11.3f} / {search[1]:.3f}"
+              f"{table[0] / 2:>11.3f} / {table[1] / 2:.3f}")
+    view.deleteLater()
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,103 @@
+"""Замер заполнения таблицы: прежние QTableWidget с кнопками-виджетами в строках против RecordTableModel с делегатом.
+
+Для 100, 1 000 и 10 000 строк показывает время заполнения (вместе с отрисовкой) и прирост RSS процесса. Каждый
+замер выполняется в отдельном процессе, чтобы память одного варианта не влияла на другой.
+
+Запуск: python benchmarks/bench_table_populate.py [число строк ...]
+"""
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+SIZES = (100, 1000, 10000)
+
+
+def rss_kb():
+    """Текущий RSS процесса в КБ; вне Linux — пиковый."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def make_computers(count):
+    return [{"id": key, "name": f"PC-{key}", "configuration": "Ryzen 5 / RTX 3060 / 16 ГБ", "status": "available",
+             "rental_end_time": None} for key in range(count)]
+
+
+def populate_widget(table, computers):
+    """Прежний путь: элемент на каждую ячейку и QWidget с двумя QPushButton в каждой строке."""
+    from PyQt6.QtWidgets import QPushButton, QTableWidgetItem, QVBoxLayout, QWidget
+
+    table.setRowCount(len(computers))
+    for row, computer in enumerate(computers):
+        table.setItem(row, 0, QTableWidgetItem(str(computer["id"])))
+        table.setItem(row, 1, QTableWidgetItem(computer["name"]))
+        table.setItem(row, 2, QTableWidgetItem(computer["configuration"]))
+        button_layout = QVBoxLayout()
+        button_layout.addWidget(QPushButton("Редактировать"))
+        button_layout.addWidget(QPushButton("Удалить"))
+        button_widget = QWidget()
+        button_widget.setLayout(button_layout)
+        table.setCellWidget(row, 3, button_widget)
+        table.setRowHeight(row, 80)
+    table.resizeColumnsToContents()
+
+
+def measure(variant, count):
+    """Заполняет таблицу в текущем процессе; возвращает время в мс и прирост RSS в КБ."""
+    from PyQt6.QtWidgets import QApplication, QTableWidget
+
+    from logic.records import Computer
+    from ui.computer_window import computer_actions
+    from ui.table_models import Column, RecordTableModel, RecordTableView
+
+    app = QApplication([])
+    if variant == "widget":
+        computers = make_computers(count)
+        view = QTableWidget(0, 4)
+        populate = lambda: populate_widget(view, computers)  # noqa: E731
+    else:
+        computers = [Computer.from_dict(data) for data in make_computers(count)]
+        model = RecordTableModel([Column("ID", "id"), Column("Название", "name"),
+                                  Column("Конфигурация", "configuration"),
+                                  Column("Статус/Действие", "status", actions=computer_actions)])
+        view = RecordTableView(model, action_column=3, row_height=80)
+        populate = lambda: (model.set_records(computers), view.resizeColumnsToContents())  # noqa: E731
+    view.resize(1000, 700)
+    view.show()
+    app.processEvents()
+    before = rss_kb()
+    started = time.perf_counter()
+    populate()
+    app.processEvents()
+    elapsed = (time.perf_counter() - started) * 1000
+    return elapsed, rss_kb() - before
+
+
+def main(sizes):
+    print(f"{'строк':>7}{'QTableWidget, мс':>18}{'RSS, КБ':>10}{'RecordTableModel, мс':>22}{'RSS, КБ':>10}")
+    for count in sizes:
+        row = [f"{count:>7}"]
+        for variant, width in (("widget", 18), ("model", 22)):
+            output = subprocess.run([sys.executable, __file__, "--case", variant, str(count)],
+                                    capture_output=True, text=True, check=True).stdout.split()
+            row.append(f"{float(output[0]):>{width}.1f}{int(output[1]):>10}")
+        print("".join(row))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--case"]:
+        print(*measure(sys.argv[2], int(sys.argv[3])))
+    else:
+        main([int(size) for size in sys.argv[1:]] or SIZES)
@@ -0,0 +1,76 @@
+"""Замер обновления таблицы компьютеров: точечное обновление RecordTableModel.set_records против сброса модели.
+
+Запуск: python benchmarks/bench_table_update.py [число компьютеров]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from logic.records import Computer  # noqa: E402
+from ui.computer_window import computer_actions  # noqa: E402
+from ui.table_models import Column, RecordTableModel, RecordTableView  # noqa: E402
+
+STATUSES = ("available", "rented", "maintenance")
+
+
+def make_computers(count, version=0):
+    """Компьютеры, у которых в версии version сменился статус каждого пятидесятого."""
+    return [Computer.from_dict({"id": key, "name": f"PC-{key}", "configuration": "Ryzen 5 / RTX 3060",
+                                "status": STATUSES[(key + (version if key % 50 == 0 else 0)) % len(STATUSES)]})
+            for key in range(count)]
+
+
+def make_view():
+    model = RecordTableModel([Column("ID", "id"), Column("Название", "name"),
+                              Column("Конфигурация", "configuration"),
+                              Column("Статус/Действие", "status", actions=computer_actions)])
+    view = RecordTableView(model, action_column=3, row_height=80)
+    view.resize(1000, 700)
+    view.show()
+    return model, view
+
+
+def reset(model, records):
+    """Прежний путь: модель целиком сбрасывается на каждый ответ сервера."""
+    model.beginResetModel()
+    model._all_records = records
+    model._records = list(records)
+    model._reindex()
+    model.endResetModel()
+
+
+def measure(app, update, versions, repeat=30):
+    samples = []
+    for number in range(repeat):
+        records = versions[number % len(versions)]
+        started = time.perf_counter()
+        update(records)
+        app.processEvents()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000, samples[int(len(samples) * 0.99)] * 1000
+
+
+def main(count):
+    app = QApplication.instance() or QApplication([])
+    versions = [make_computers(count, version) for version in range(3)]
+    print(f"{count} компьютеров, меняется статус {len(range(0, count, 50))} из них")
+    print(f"{'':<22}{'p50, мс':>10}{'p99, мс':>10}")
+    for name, update in (("set_records", RecordTableModel.set_records), ("сброс модели", reset)):
+        model, view = make_view()
+        model.set_records(versions[0])
+        app.processEvents()
+        median, p99 = measure(app, lambda records: update(model, records), versions)
+        print(f"{name:<22}{median:>10.2f}{p99:>10.2f}")
+        view.close()
+        view.deleteLater()
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,91 @@
+"""Замер форматов ответа: байт в сети и время разбора для JSON, JSON со сжатием gzip и MessagePack.
+
+Набор ответов — типичные для экранов коллекции (компьютеры, заказы с позициями, меню, статистика) или записанные
+ответы сервера: файлы *.json из каталога, переданного аргументом. MessagePack замеряется, если установлен msgpack.
+
+Запуск: python benchmarks/bench_wire_format.py [каталог с записанными ответами]
+"""
+import gzip
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.content_decoders import ContentDecoders, msgpack  # noqa: E402
+
+STATUSES = ("available", "rented", "maintenance")
+DISHES = ("Чай", "Кофе", "Пицца", "Бургер", "Картофель фри", "Кола")
+
+
+def generated_payloads():
+    """Ответы размером с реальную смену клуба."""
+    return {
+        "computers": [{"id": key, "name": f"PC-{key}", "configuration": "Ryzen 5 / RTX 3060 / 16 ГБ",
+                       "status": STATUSES[key % 3],
+                       "rental_end_time": "2026-10-18T21:30:00" if key % 3 == 1 else None}
+                      for key in range(1, 201)],
+        "orders": [{"id": key, "user_id": 1000 + key % 97, "status": "pending",
+                    "items": [{"name": DISHES[(key + item) % len(DISHES)], "quantity": 1 + item % 3}
+                              for item in range(1 + key % 4)]}
+                   for key in range(1, 501)],
+        "menu": [{"id": key, "name": f"{DISHES[key % len(DISHES)]} {key}", "price": 90.0 + key % 7 * 30}
+                 for key in range(1, 151)],
+        "statistics": {"computers": [{"computer_name": f"PC-{key}", "rental_count": key * 3,
+                                      "total_rental_hours": key * 4.5} for key in range(1, 201)],
+                       "food": [{"name": dish, "order_count": 40 + index, "total_revenue": 5400.0 * (index + 1)}
+                                for index, dish in enumerate(DISHES)]},
+    }
+
+
+def recorded_payloads(directory):
+    payloads = {}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), "rb") as file:
+                payloads[name[:-5]] = json.loads(file.read())
+    return payloads
+
+
+def measure(func, repeat=50):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def formats(data, decoders):
+    """(формат, тело в сети, разбор тела) для одного ответа."""
+    body = json.dumps(data, ensure_ascii=False).encode()
+    rows = [("JSON", body, lambda: decoders.decode(body, ContentDecoders.JSON))]
+    packed = gzip.compress(body)
+    rows.append(("JSON + gzip", packed, lambda: decoders.decode(gzip.decompress(packed), ContentDecoders.JSON)))
+    if msgpack is not None:
+        binary = msgpack.packb(data)
+        rows.append(("MessagePack", binary, lambda: decoders.decode(binary, "application/msgpack")))
+    return rows
+
+
+def main(directory=None):
+    payloads = recorded_payloads(directory) if directory else generated_payloads()
+    decoders = ContentDecoders()
+    if msgpack is None:
+        print("msgpack не установлен: MessagePack не замеряется")
+    print(f"{'ответ':<14}{'формат':<14}{'байт':>10}{'разбор p50, мс':>16}")
+    totals = {}
+    for name, data in payloads.items():
+        for kind, body, decode in formats(data, decoders):
+            elapsed = measure(decode)
+            size, total = totals.get(kind, (0, 0.0))
+            totals[kind] = (size + len(body), total + elapsed)
+            print(f"{name:<14}{kind:<14}{len(body):>10}{elapsed:>16.3f}")
+    for kind, (size, elapsed) in totals.items():
+        print(f"{'итого':<14}{kind:<14}{size:>10}{elapsed:>16.3f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
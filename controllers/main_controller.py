@@ -1,30 +1,111 @@
+from PyQt6.QtCore import QThreadPool, QTimer
 from PyQt6.QtWidgets import QApplication
 from ui.auth_window import AuthWindow
-from ui.main_window import MainWindow
+from ui.poll_scheduler import PollScheduler
+from ui.request_executor import EventLoopMonitor, RequestExecutor
 from logic.business_logic import BusinessLogic
 from logic.network_layer import NetworkLayer
+from datetime import datetime
+import os
 import sys
+import time
 
 
 class MainController:
-    def __init__(self):
+    def __init__(self, started_at=None):
+        self.started_at = started_at or time.perf_counter()
+        self.startup_time_ms = None
+        self.first_table_ms = None
         self.app = QApplication(sys.argv)
         self.network_layer = NetworkLayer()
         self.business_logic = BusinessLogic(self.network_layer)
         self.auth_window = AuthWindow(self)
-        self.main_window = MainWindow(self.business_logic)
+        self.main_window = None
+        self.event_loop_monitor = EventLoopMonitor(metrics=self.network_layer.metrics)
+        self.prefetch_executor = RequestExecutor()
+        self.scheduler = PollScheduler(self.main_window_shown)
+        self.event_loop_monitor.stalled.connect(self.scheduler.report_stall)
 
     def show_auth_window(self):
-        """Показывает окно авторизации."""
-        self.main_window.hide()
+        """Показывает окно авторизации; незавершенный прогрев данных прошлой сессии отменяется."""
+        self.business_logic.cancel_prefetch()
+        if self.main_window is not None:
+            self.main_window.hide()
         self.auth_window.show()
 
     def show_main_window(self):
-        """Показывает главное окно после успешного входа."""
+        """Показывает главное окно после успешного входа; окно создается при первом входе."""
+        self.start_prefetch()
+        if self.main_window is None:
+            shown_at = time.perf_counter()
+            from ui.main_window import MainWindow
+            self.main_window = MainWindow(self.business_logic, self.scheduler)
+            self.watch_first_table(shown_at)
+            self.scheduler.start()
         self.auth_window.hide()
         self.main_window.show()
 
+    def main_window_shown(self):
+        """Периодические обновления выполняются, только пока главное окно на экране."""
+        return self.main_window is not None and self.main_window.is_shown()
+
+    def start_prefetch(self):
+        """Параллельно загружает коллекции всех экранов в фоне, пока создается главное окно."""
+        started_at = time.perf_counter()
+        self.prefetch_executor.submit(
+            self.business_logic.prefetch,
+            lambda results: self.write_timing("prefetch", (time.perf_counter() - started_at) * 1000),
+            key="prefetch"
+        )
+
+    def watch_first_table(self, shown_at):
+        """Замеряет время от входа до появления первых строк в таблице открытого экрана.
+
+        Старт считается теплым, если при входе коллекции были восстановлены из локальной базы (load_local_cache),
+        а не по тому, успел ли прогрев заполнить хранилища к моменту показа экрана.
+        """
+        model = self.main_window.content_stack.currentWidget().model
+        source = "warm" if self.business_logic.restored_collections else "cold"
+
+        def record(*args):
+            if self.first_table_ms is not None or not model.rowCount():
+                return
+            self.first_table_ms = (time.perf_counter() - shown_at) * 1000
+            self.write_timing(f"first_table_{source}", self.first_table_ms)
+
+        record()
+        if self.first_table_ms is None:
+            model.modelReset.connect(record)
+            model.rowsInserted.connect(record)
+
     def run(self):
         """Запуск приложения."""
         self.auth_window.show()
-        sys.exit(self.app.exec())
+        QTimer.singleShot(0, self.record_startup_time)
+        self.event_loop_monitor.start()
+        exit_code = self.app.exec()
+        self.shutdown()
+        sys.exit(exit_code)
+
+    def record_startup_time(self):
+        """Запоминает время от запуска процесса до показа окна авторизации."""
+        self.startup_time_ms = (time.perf_counter() - self.started_at) * 1000
+        self.write_timing("login_window", self.startup_time_ms)
+
+    @staticmethod
+    def write_timing(name, milliseconds):
+        """Дописывает замер в файл из переменной окружения CLUBSTAFF_STARTUP_LOG, если она задана."""
+        log_path = os.environ.get("CLUBSTAFF_STARTUP_LOG")
+        if log_path:
+            with open(log_path, "a", encoding="utf-8") as log_file:
+                log_file.write(f"{datetime.now().isoformat(timespec='seconds')}\t{name}\t{milliseconds:.1f}\n")
+
+    def shutdown(self):
+        """Освобождает сетевые ресурсы перед выходом; наибольшая задержка цикла событий попадает в журнал запуска."""
+        self.event_loop_monitor.stop()
+        self.write_timing("event_loop_max_lag", self.event_loop_monitor.max_lag)
+        self.scheduler.stop()
+        self.business_logic.cancel_prefetch()
+        QThreadPool.globalInstance().waitForDone()
+        self.business_logic.close()
+        self.network_layer.close()
@@ -1,55 +1,507 @@
-from datetime import datetime, timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+
+from logic.entity_store import EntityStore
+from logic.local_cache import LocalCache
+from logic.metrics import endpoint_label
+from logic.records import RecordError, Staff, Computer, Order, MenuItem, ComputerUsageStat, FoodStat
+from logic.statistics_cache import StatisticsCache, day_rows, days_between, merge_statistics, period_bucket
+from logic.token_manager import TokenManager
 
 
 class BusinessLogic:
-    def __init__(self, network_layer):
+    PAGE_SIZE = 100
+    PREFETCH_BUDGET = 5.0
+    # Коллекции, которые экраны загружают постранично: при прогреве запрашивается их первая страница.
+    PAGED_COLLECTIONS = {"staff", "menu"}
+    QUEUED_MESSAGE = "Нет связи с сервером: изменение сохранено и будет отправлено после ее восстановления."
+    INVALID_OFFLINE_LOGIN_MESSAGE = "Нет связи с сервером, а логин или пароль не совпадают с последним входом."
+    UNSUPPORTED_RANGE_MESSAGE = "Сервер не поддерживает статистику за произвольный период."
+    COLLECTION_TITLES = {"staff": "Сотрудник", "computers": "Компьютер", "orders": "Заказ", "menu": "Блюдо"}
+
+    def __init__(self, network_layer, local_cache=None):
         self.network_layer = network_layer
+        self.metrics = network_layer.metrics
         self.token = None
         self.user_role = None
-        self.token_expiry = None
         self.login = None
         self.password = None
+        self.token_manager = TokenManager(self._refresh_login)
+        self.staff_store = EntityStore()
+        self.computer_store = EntityStore()
+        self.order_store = EntityStore()
+        self.menu_store = EntityStore()
+        self.statistics_cache = StatisticsCache()
+        self.unsupported_statistics_ranges = set()
+        self.collections = {
+            "staff": ("/users/staffs", self.staff_store, Staff),
+            "computers": ("/computers", self.computer_store, Computer),
+            "orders": ("/orders/pending", self.order_store, Order),
+            "menu": ("/menu", self.menu_store, MenuItem),
+        }
+        self.local_cache = local_cache or LocalCache()
+        self.restored_collections = []
+        for name, (_, store, _) in self.collections.items():
+            store.subscribe(lambda records, name=name: self.local_cache.save_later(name, records))
+        self._replay_lock = threading.Lock()
+        self._sync_versions = {}
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_cancelled = threading.Event()
 
     def authenticate_user(self, login, password):
+        """Вход по логину и паролю. Если сервер недоступен, вход проверяется по данным последнего успешного входа."""
         if not self.login or not self.password:
             self.login = login
             self.password = password
+        response = self._request_token(login, password)
+        if response["status"] == 200:
+            self.local_cache.remember_login(login, password, self.user_role)
+            self.restored_collections = self.load_local_cache()
+            return {"success": True}
+        if response["status"] == 0:
+            role = self.local_cache.check_login(login, password)
+            if role is False:
+                return {"success": False, "error": self.INVALID_OFFLINE_LOGIN_MESSAGE}
+            if role is not None:
+                self.user_role = role
+                self.restored_collections = self.load_local_cache()
+                return {"success": True, "offline": True}
+        return {"success": False, "error": response["detail"]}
+
+    def _refresh_login(self):
+        """Обновляет токен по сохраненным учетным данным; без связи с сервером обновление не удается."""
+        response = self._request_token(self.login, self.password)
+        if response["status"] == 200:
+            return {"success": True}
+        return {"success": False, "error": response["detail"]}
+
+    def _request_token(self, login, password):
         response = self.network_layer.post(
             "/auth/login",
             json={"login_or_email": login, "password": password}
         )
         if response["status"] == 200:
             self.token = response["data"]["access_token"]
-            self.token_expiry = datetime.now() + timedelta(minutes=30)
             self.user_role = response["data"]["role"]
             self.network_layer.set_token(self.token)
-            return {"success": True}
-        return {"success": False, "error": response["detail"]}
+            self.token_manager.update(response["data"])
+        return response
+
+    def load_local_cache(self):
+        """Заполняет еще не загруженные хранилища последними сохраненными данными (теплый старт).
+
+        Возвращает имена коллекций, восстановленных из локальной базы.
+        """
+        restored = []
+        for name, (_, store, model) in self.collections.items():
+            if not store.loaded:
+                records = self.local_cache.load(name)
+                try:
+                    if records is not None:
+                        store.replace_all(model.from_list(records))
+                        restored.append(name)
+                except RecordError:
+                    pass
+        return restored
+
+    def prefetch(self, budget=None):
+        """Параллельно загружает основные коллекции в хранилища сразу после входа, чтобы экраны открывались готовыми.
+
+        Ждет не дольше budget секунд; ответы, пришедшие позже, все равно попадают в хранилища, если прогрев не
+        отменен через cancel_prefetch. Возвращает состояние по коллекциям: "ok", "timeout", "cancelled" или текст
+        ошибки.
+        """
+        budget = self.PREFETCH_BUDGET if budget is None else budget
+        with self._prefetch_lock:
+            self._prefetch_cancelled.set()
+            cancelled = self._prefetch_cancelled = threading.Event()
+
+        pool = ThreadPoolExecutor(max_workers=len(self.collections))
+        futures = {pool.submit(self._prefetch_collection, name, cancelled): name for name in self.collections}
+        pool.shutdown(wait=False)
+        deadline = time.monotonic() + budget
+        pending = set(futures)
+        while pending and not cancelled.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            _, pending = wait(pending, timeout=min(remaining, 0.1))
+
+        results = {}
+        for future, name in futures.items():
+            if not future.done():
+                results[name] = "cancelled" if cancelled.is_set() else "timeout"
+            elif future.exception() is not None:
+                results[name] = str(future.exception())
+            else:
+                results[name] = future.result()
+        return results
+
+    def _prefetch_collection(self, name, cancelled):
+        endpoint, store, model = self.collections[name]
+        params = {"offset": 0, "limit": self.PAGE_SIZE} if name in self.PAGED_COLLECTIONS else None
+        started = time.perf_counter()
+        response = self._get(endpoint, params=params, model=model, priority=self.network_layer.PRIORITY_BACKGROUND)
+        self.metrics.record_timing("prefetch", name, time.perf_counter() - started)
+        if response["status"] != 200:
+            return response["detail"]
+        data = response["data"]
+        with self._prefetch_lock:
+            if cancelled.is_set():
+                return "cancelled"
+            store.replace_all(data["items"] if isinstance(data, dict) else data)
+        return "ok"
+
+    def cancel_prefetch(self):
+        """Отменяет прогрев: незавершенные ответы больше не попадут в хранилища."""
+        with self._prefetch_lock:
+            self._prefetch_cancelled.set()
 
     def refresh_token(self):
         """Перезапрашивает токен, используя сохраненные учетные данные."""
         if not self.login or not self.password:
             raise Exception("Необходим повторный вход: учетные данные отсутствуют.")
 
-        if self.is_token_expired:
-            self.authenticate_user(self.login, self.password)
+        result = self.token_manager.ensure_valid()
+        if not result["success"]:
+            raise Exception(result["error"])
 
     def is_token_expired(self):
         """Проверяет, истек ли токен."""
-        return self.token_expiry is None or datetime.now() > self.token_expiry - timedelta(seconds=60)
+        return self.token_manager.is_expired()
+
+    def close(self):
+        """Останавливает прогрев и фоновое обновление токена и закрывает локальную базу."""
+        self.cancel_prefetch()
+        self.token_manager.stop()
+        self.local_cache.close()
+
+    def get_auth_headers(self):
+        """Возвращает заголовки авторизации, при необходимости обновив токен."""
+        self.refresh_token()
+        return self.network_layer.get_headers()
+
+    def sync_collection(self, name, priority=None):
+        """Синхронизирует коллекцию с сервером по дельте и сливает изменения в хранилище.
+
+        Запрос отправляется с since=<последняя версия> (0 при первой синхронизации). Сервер с поддержкой дельт
+        отвечает {"version", "upserts", "deleted", "full"}: upserts — новые и измененные записи, deleted — id
+        удаленных записей (tombstones), full — upserts содержит всю коллекцию (например, версия устарела).
+        Если сервер вернул обычный список, endpoint запоминается как не поддерживающий дельты и дальше
+        запрашивается целиком условным GET, а хранилище меняется только при реальных отличиях.
+        Возвращает ответ NetworkLayer, где вместо data — флаг changed.
+        """
+        endpoint, store, model = self.collections[name]
+        delta = endpoint not in self.network_layer.unsupported_deltas
+        params = {"since": self._sync_versions.get(name, 0)} if delta else None
+        response = self._get(endpoint, params=params, use_cache=not delta, model=model, priority=priority)
+        if response["status"] != 200:
+            return response
+        data = response["data"]
+        if isinstance(data, dict) and "upserts" in data:
+            if data.get("full"):
+                changed = store.sync_all(data["upserts"])
+            else:
+                changed = store.apply_changes(data["upserts"], data.get("deleted") or [])
+            self._sync_versions[name] = data.get("version", 0)
+        else:
+            if delta:
+                self.network_layer.unsupported_deltas.add(endpoint)
+            changed = store.sync_all(data)
+        return {"status": 200, "changed": changed}
+
+    def _get(self, endpoint, params=None, use_cache=True, model=None, priority=None):
+        """GET с заголовками авторизации; если сервер недоступен даже для обновления токена, возвращает статус 0.
+
+        На ответ 401 (токен отозван или истек раньше срока) токен обновляется и запрос повторяется один раз.
+        """
+        try:
+            headers = self.get_auth_headers()
+        except Exception as e:
+            if not self.network_layer.offline:
+                raise
+            return {"status": 0, "detail": str(e)}
+        token = self.token
+        with self.metrics.timed("load", endpoint_label(endpoint)):
+            response = self.network_layer.get(endpoint, headers=headers, params=params, use_cache=use_cache,
+                                              model=model, priority=priority)
+            if response["status"] != 401:
+                return response
+            if self.token == token:
+                result = self.token_manager.refresh()
+                if not result["success"]:
+                    return response
+            return self.network_layer.get(endpoint, headers=self.network_layer.get_headers(), params=params,
+                                          use_cache=use_cache, model=model, priority=priority)
+
+    def _send_mutation(self, store, collection, key, undo, method, endpoint, fields=None, checked=None,
+                       params=None, json=None):
+        """Отправляет изменение, уже примененное к хранилищу.
+
+        fields — новые значения полей (None, если запись удаляется), checked — поля, по которым при повторной
+        отправке определяется конфликт (по умолчанию поля из fields). Если сервер недоступен или в журнале уже
+        есть неотправленные изменения, изменение остается примененным локально и записывается в журнал.
+        Возвращает True, если изменение отправлено, и False, если оно ждет восстановления связи.
+        """
+        _, previous, _ = undo
+        checked = list(fields or {}) if checked is None else checked
+        entry = {
+            "collection": collection, "key": key, "method": method, "endpoint": endpoint, "params": params,
+            "json": json, "fields": fields,
+            "base": {field: previous.get(field) for field in checked} if previous and checked else None,
+        }
+        if not self.local_cache.journal_size():
+            try:
+                headers = self.get_auth_headers()
+            except Exception:
+                if not self.network_layer.offline:
+                    store.revert(undo)
+                    raise
+            else:
+                response = self.network_layer.request(method, endpoint, headers=headers, json=json, params=params,
+                                                      default_detail="Неизвестная ошибка")
+                if response["status"] == 200:
+                    return True
+                if response["status"] != 0:
+                    store.revert(undo)
+                    raise Exception(response["detail"])
+        self.local_cache.append_journal(entry)
+        return False
+
+    def pending_changes(self):
+        """Количество изменений в журнале, ожидающих отправки."""
+        return self.local_cache.journal_size()
+
+    def replay_journal(self):
+        """Отправляет по порядку изменения, сделанные без связи с сервером.
+
+        Перед отправкой затронутые коллекции перечитываются с сервера целиком, по всем страницам. Если запись с тех
+        пор изменили или удалили на сервере, изменение не отправляется и попадает в конфликты. Возвращает словарь с
+        количеством отправленных и оставшихся изменений и списками конфликтов и ошибок.
+        """
+        result = {"sent": 0, "pending": 0, "conflicts": [], "errors": []}
+        if not self._replay_lock.acquire(blocking=False):
+            result["pending"] = self.local_cache.journal_size()
+            return result
+        try:
+            entries = self.local_cache.journal()
+            for collection in dict.fromkeys(entry["collection"] for entry in entries):
+                endpoint, store, model = self.collections[collection]
+                try:
+                    for _ in self.iter_pages(endpoint, store, use_cache=False, model=model):
+                        pass
+                except Exception:
+                    if not self.network_layer.offline:
+                        raise
+                if self.network_layer.offline:
+                    result["pending"] = len(entries)
+                    return result
+
+            for number, entry in enumerate(entries):
+                title = f"{self.COLLECTION_TITLES[entry['collection']]} #{entry['key']}"
+                _, store, _ = self.collections[entry["collection"]]
+                current = store.get(entry["key"])
+                if entry["base"] is not None and current is None:
+                    result["conflicts"].append(f"{title}: удален на сервере")
+                    self.local_cache.remove_journal_entry(entry["id"])
+                    continue
+                if entry["base"] is not None and any(current.get(f) != v for f, v in entry["base"].items()):
+                    result["conflicts"].append(f"{title}: изменен на сервере")
+                    self.local_cache.remove_journal_entry(entry["id"])
+                    continue
+                if current is None and entry["fields"] is None and entry["method"] == "DELETE":
+                    self.local_cache.remove_journal_entry(entry["id"])
+                    continue
+
+                try:
+                    headers = self.get_auth_headers()
+                except Exception:
+                    if not self.network_layer.offline:
+                        raise
+                    response = {"status": 0}
+                else:
+                    response = self.network_layer.request(
+                        entry["method"], entry["endpoint"], headers=headers, json=entry["json"],
+                        params=entry["params"], default_detail="Неизвестная ошибка"
+                    )
+                if response["status"] == 0:
+                    result["pending"] = len(entries) - number
+                    break
+                self.local_cache.remove_journal_entry(entry["id"])
+                if response["status"] != 200:
+                    result["errors"].append(f"{title}: {response['detail']}")
+                elif entry["fields"] is None:
+                    store.remove(entry["key"])
+                    result["sent"] += 1
+                else:
+                    store.patch(entry["key"], **entry["fields"])
+                    result["sent"] += 1
+            return result
+        finally:
+            self._replay_lock.release()
+
+    def iter_pages(self, endpoint, store, page_size=None, params=None, use_cache=True, model=None):
+        """Генератор страниц коллекции.
+
+        Поддерживает курсорную пагинацию (ответ вида {"items": [...], "next_cursor": ...}) и offset/limit.
+        Первая страница заменяет содержимое хранилища, следующие дополняют его; без хранилища страницы только
+        возвращаются. Если сервер не поддерживает пагинацию и вернул всю коллекцию, она будет единственной страницей.
+        Ответ без конверта (обычный список) запрашивается дальше, только пока приходят полные страницы; страница с
+        теми же записями, что и предыдущая, значит, что сервер не учитывает offset или курсор, и загрузка
+        останавливается, не добавляя ее повторно.
+        """
+        page_size = page_size or self.PAGE_SIZE
+        key = store.key if store is not None else "id"
+        page_params = dict(params or {}, offset=0, limit=page_size)
+        previous_keys = None
+        first = True
+        while True:
+            response = self._get(endpoint, params=page_params, use_cache=use_cache, model=model)
+            if response["status"] == 0 and first and store is not None and store.loaded:
+                yield store.records()
+                return
+            if response["status"] != 200:
+                raise Exception(response["detail"])
+
+            data = response["data"]
+            page = data["items"] if isinstance(data, dict) else data
+            keys = [record[key] for record in page]
+            if keys == previous_keys:
+                return
+            previous_keys = keys
+            if store is not None and first:
+                store.replace_all(page)
+            elif store is not None:
+                store.upsert_many(page)
+            first = False
+            yield page
+
+            if isinstance(data, dict):
+                if not data.get("next_cursor"):
+                    return
+                page_params = dict(params or {}, cursor=data["next_cursor"], limit=page_size)
+            elif len(page) != page_size:
+                return
+            else:
+                page_params["offset"] += page_size
+
+    def refresh_loaded_pages(self, endpoint, store, model=None):
+        """Одним запросом перечитывает все уже загруженные записи коллекции; без связи оставляет их как есть."""
+        limit = max(len(store.records()), self.PAGE_SIZE)
+        response = self._get(endpoint, params={"offset": 0, "limit": limit}, model=model,
+                             priority=self.network_layer.PRIORITY_BACKGROUND)
+        if response["status"] == 0 and store.loaded:
+            return
+        if response["status"] != 200:
+            raise Exception(response["detail"])
+        data = response["data"]
+        store.replace_all(data["items"] if isinstance(data, dict) else data)
+
+    @staticmethod
+    def _store_created(store, model, data, reload):
+        """Добавляет созданную запись в хранилище; если сервер ее не вернул, перечитывает коллекцию."""
+        try:
+            record = model.from_dict(data)
+        except RecordError:
+            reload()
+        else:
+            store.upsert(record)
+
+    def run_batch(self, store, batch_endpoint, field, changes, optimistic, send_one, reload=None):
+        """Выполняет пакет изменений и возвращает результат по каждой записи.
+
+        changes — список пар (id, новое значение). Изменения сразу применяются к хранилищу одним уведомлением.
+        Пакет отправляется одним запросом на batch_endpoint, а если сервер его не поддерживает, — параллельными
+        запросами через общий пул соединений. Неудачные изменения откатываются в конце, тоже одним уведомлением.
+        Затем коллекция один раз перечитывается функцией reload, чтобы хранилище совпало с данными сервера.
+        Пока в журнале есть изменения, сделанные без связи, пакет не отправляется, чтобы не нарушить их порядок.
+        Если отправка прервалась исключением, откатываются все изменения пакета, и исключение передается дальше.
+        """
+        if self.local_cache.journal_size():
+            raise Exception("Сначала должны быть отправлены изменения, сделанные без связи с сервером.")
+        self.refresh_token()
+        headers = self.network_layer.get_headers()
+        undo = {}
+        try:
+            with store.batch():
+                for key, value in changes:
+                    undo[key] = optimistic(key, value)
+            results = None
+            if batch_endpoint not in self.network_layer.unsupported_batches:
+                results = self._send_batch(batch_endpoint, field, changes, headers)
+            if results is None:
+                results = self._send_concurrently(changes, headers, send_one)
+        except Exception:
+            with store.batch():
+                for key in reversed(list(undo)):
+                    store.revert(undo[key])
+            raise
+
+        with store.batch():
+            for key, result in results.items():
+                if not result["success"]:
+                    store.revert(undo[key])
+        if reload is not None:
+            try:
+                reload()
+            except Exception:
+                # Результаты пакета уже известны; если перечитать не удалось, в хранилище остаются его значения.
+                pass
+        return results
+
+    def _send_batch(self, endpoint, field, changes, headers):
+        """Отправляет пакет одним запросом. Возвращает None, если сервер не знает такого адреса."""
+        response = self.network_layer.put(endpoint, headers=headers,
+                                          json=[{"id": key, field: value} for key, value in changes])
+        if response["status"] in (404, 405):
+            self.network_layer.unsupported_batches.add(endpoint)
+            return None
+        if response["status"] != 200:
+            return {key: {"success": False, "error": response["detail"]} for key, _ in changes}
+
+        data = response["data"]
+        if not isinstance(data, list) or not all(isinstance(item, dict) and "id" in item for item in data):
+            return {key: {"success": False, "error": "Некорректный ответ сервера"} for key, _ in changes}
+        items = {item["id"]: item for item in data}
+        results = {}
+        for key, _ in changes:
+            item = items.get(key)
+            if item is None:
+                results[key] = {"success": False, "error": "Сервер не вернул результат"}
+            elif item.get("status", 200) == 200:
+                results[key] = {"success": True}
+            else:
+                results[key] = {"success": False, "error": item.get("detail", "Ошибка")}
+        return results
+
+    def _send_concurrently(self, changes, headers, send_one):
+        """Отправляет изменения по одному, но параллельно, не больше числа соединений пула."""
+        workers = max(1, min(len(changes), self.network_layer.max_connections))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            responses = list(pool.map(lambda change: send_one(change[0], change[1], headers), changes))
+        return {
+            key: {"success": True} if response["status"] == 200 else {"success": False, "error": response["detail"]}
+            for (key, _), response in zip(changes, responses)
+        }
 
     def is_my_login(self, login):
         return self.login == login
 
     def get_staffs(self):
-        """Получает список сотрудников."""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.get("/users/staffs", headers=headers)
+        """Получает список сотрудников; без связи с сервером возвращает последние сохраненные данные."""
+        response = self._get("/users/staffs", model=Staff)
         if response["status"] == 200:
+            self.staff_store.replace_all(response["data"])
             return response["data"]
-        else:
-            raise Exception(response["detail"])
+        if response["status"] == 0 and self.staff_store.loaded:
+            return self.staff_store.records()
+        raise Exception(response["detail"])
+
+    def iter_staffs(self):
+        """Постранично загружает список сотрудников."""
+        return self.iter_pages("/users/staffs", self.staff_store, model=Staff)
 
     def add_staff(self, data):
         """Добавляет нового сотрудника."""
@@ -57,19 +509,19 @@ class BusinessLogic:
         headers = self.network_layer.get_headers()
         response = self.network_layer.post("/users/register", headers=headers, json=data)
         if response["status"] == 200:
+            self._store_created(self.staff_store, Staff, response["data"], self.get_staffs)
             return {"success": True, "message": "Сотрудник успешно добавлен."}
         else:
             return {"success": False, "error": response["detail"]}
 
     def delete_staff(self, staff_id):
         """Удаляет сотрудника."""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.delete(f"/users/{staff_id}", headers=headers)
-        if response["status"] == 200:
-            return {"success": True, "message": "Сотрудник успешно удален."}
-        else:
-            return {"success": False, "error": response["detail"]}
+        undo = self.staff_store.remove(staff_id)
+        try:
+            sent = self._send_mutation(self.staff_store, "staff", staff_id, undo, "DELETE", f"/users/{staff_id}")
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        return {"success": True, "message": "Сотрудник успешно удален." if sent else self.QUEUED_MESSAGE}
 
     def change_password(self, staff_id, new_password):
         """Меняет пароль для текущего пользователя."""
@@ -84,14 +536,19 @@ class BusinessLogic:
             return {"success": False, "error": response["detail"]}
 
     def get_computers(self):
-        """Получает список компьютеров."""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.get("/computers", headers=headers)
-        if response["status"] == 200:
-            return response["data"]
-        else:
-            raise Exception(response["detail"])
+        """Получает список компьютеров; без связи с сервером возвращает последние сохраненные данные."""
+        response = self.sync_collection("computers")
+        if response["status"] == 200 or response["status"] == 0 and self.computer_store.loaded:
+            return self.computer_store.records()
+        raise Exception(response["detail"])
+
+    def subscribe_computers(self, on_error=None, gate=None):
+        """Подписывается на изменения списка компьютеров; данные попадают в computer_store."""
+        return self.network_layer.subscribe("/computers", self.computer_store.sync_all, on_error,
+                                            headers_factory=self.get_auth_headers, min_interval=1, max_interval=5,
+                                            model=Computer, gate=gate,
+                                            fetch=partial(self.sync_collection, "computers",
+                                                          self.network_layer.PRIORITY_BACKGROUND))
 
     def add_computer(self, name, configuration):
         """Добавляет новый компьютер"""
@@ -101,52 +558,75 @@ class BusinessLogic:
                                            json={"name": name, "configuration": configuration})
         if response["status"] != 200:
             raise Exception(response["detail"])
+        self._store_created(self.computer_store, Computer, response["data"], self.get_computers)
 
     def delete_computer(self, computer_id):
         """Удаляет компьютер"""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.delete(f"/computers/{computer_id}", headers=headers)
-        if response["status"] != 200:
-            raise Exception(response["detail"])
+        undo = self.computer_store.remove(computer_id)
+        return self._send_mutation(self.computer_store, "computers", computer_id, undo,
+                                   "DELETE", f"/computers/{computer_id}")
 
     def update_computer_configuration(self, computer_id, configuration):
         """Изменяет конфигурацию компьютера"""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.put(f"/computers/{computer_id}", headers=headers,
-                                          json={"configuration": configuration})
-        if response["status"] != 200:
-            raise Exception(response["detail"])
+        undo = self.computer_store.patch(computer_id, configuration=configuration)
+        return self._send_mutation(self.computer_store, "computers", computer_id, undo,
+                                   "PUT", f"/computers/{computer_id}", fields={"configuration": configuration},
+                                   json={"configuration": configuration})
 
-    def get_pending_orders(self):
-        """Получает список незавершенных заказов."""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.get("/orders/pending", headers=headers)
-        print(response)
-        if response["status"] == 200:
-            return response["data"]
-        raise Exception(response["detail"])
+    def iter_order_history(self):
+        """Постранично загружает историю заказов, не сохраняя ее в памяти (для экспорта)."""
+        return self.iter_pages("/orders", None, use_cache=False, model=Order)
+
+    def subscribe_pending_orders(self, on_error=None, gate=None):
+        """Подписывается на изменения списка незавершенных заказов; данные попадают в order_store."""
+        return self.network_layer.subscribe("/orders/pending", self.order_store.sync_all, on_error,
+                                            headers_factory=self.get_auth_headers, min_interval=2, max_interval=10,
+                                            model=Order, gate=gate,
+                                            fetch=partial(self.sync_collection, "orders",
+                                                          self.network_layer.PRIORITY_BACKGROUND))
 
     def update_order_status(self, order_id, new_status):
         """Обновляет статус заказа."""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.put(f"/orders/{order_id}/status", headers=headers,
-                                          params={"new_status": new_status})
-        if response["status"] != 200:
-            raise Exception(response["detail"])
+        if new_status == "delivered":
+            undo = self.order_store.remove(order_id)
+            fields = None
+        else:
+            undo = self.order_store.patch(order_id, status=new_status)
+            fields = {"status": new_status}
+        return self._send_mutation(self.order_store, "orders", order_id, undo, "PUT", f"/orders/{order_id}/status",
+                                   fields=fields, checked=["status"], params={"new_status": new_status})
+
+    def update_orders_status(self, changes):
+        """Переводит несколько заказов в новые статусы; changes — список пар (id заказа, статус)."""
+        def optimistic(order_id, new_status):
+            if new_status == "delivered":
+                return self.order_store.remove(order_id)
+            return self.order_store.patch(order_id, status=new_status)
+
+        return self.run_batch(
+            self.order_store, "/orders/status/batch", "new_status", changes, optimistic,
+            lambda order_id, new_status, headers: self.network_layer.put(
+                f"/orders/{order_id}/status", headers=headers, params={"new_status": new_status}),
+            reload=partial(self.sync_collection, "orders")
+        )
 
     def get_menu(self):
-        """Получает список всех блюд в меню."""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.get("/menu", headers=headers)
+        """Получает список всех блюд в меню; без связи с сервером возвращает последние сохраненные данные."""
+        response = self._get("/menu", model=MenuItem)
         if response["status"] == 200:
+            self.menu_store.replace_all(response["data"])
             return response["data"]
-        else:
-            raise Exception(response["detail"])
+        if response["status"] == 0 and self.menu_store.loaded:
+            return self.menu_store.records()
+        raise Exception(response["detail"])
+
+    def iter_menu(self):
+        """Постранично загружает меню."""
+        return self.iter_pages("/menu", self.menu_store, model=MenuItem)
+
+    def refresh_menu(self):
+        """Перечитывает уже загруженные страницы меню."""
+        self.refresh_loaded_pages("/menu", self.menu_store, model=MenuItem)
 
     def add_menu_item(self, name, price):
         """Добавляет новое блюдо в меню."""
@@ -155,41 +635,88 @@ class BusinessLogic:
         response = self.network_layer.post("/menu", headers=headers, json={"name": name, "price": price})
         if response["status"] != 200:
             raise Exception(response["detail"])
+        self._store_created(self.menu_store, MenuItem, response["data"], self.get_menu)
 
     def update_menu_price(self, item_id, new_price):
         """Обновляет цену существующего блюда."""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.put(
-            f"/menu/{item_id}/price", headers=headers, params={"new_price": new_price}
+        undo = self.menu_store.patch(item_id, price=new_price)
+        return self._send_mutation(self.menu_store, "menu", item_id, undo, "PUT", f"/menu/{item_id}/price",
+                                   fields={"price": new_price}, params={"new_price": new_price})
+
+    def update_menu_prices(self, changes):
+        """Обновляет цены нескольких блюд; changes — список пар (id блюда, цена)."""
+        return self.run_batch(
+            self.menu_store, "/menu/price/batch", "new_price", changes,
+            lambda item_id, new_price: self.menu_store.patch(item_id, price=new_price),
+            lambda item_id, new_price, headers: self.network_layer.put(
+                f"/menu/{item_id}/price", headers=headers, params={"new_price": new_price}),
+            reload=self.refresh_menu
         )
-        if response["status"] != 200:
-            raise Exception(response["detail"])
 
     def delete_menu_item(self, item_id):
         """Удаляет блюдо из меню."""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.delete(f"/menu/{item_id}", headers=headers)
-        if response["status"] != 200:
-            raise Exception(response["detail"])
+        undo = self.menu_store.remove(item_id)
+        return self._send_mutation(self.menu_store, "menu", item_id, undo, "DELETE", f"/menu/{item_id}")
 
-    def get_computer_usage_statistics(self, period):
-        """Получает статистику использования компьютеров."""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.get(f"/statistics/computer_usage", headers=headers, params={"period": period})
+    def get_statistics(self, endpoint, period, model=None):
+        """Получает статистику за текущий день, месяц или год; закрытые периоды берутся из кэша."""
+        bucket = period_bucket(period, self.statistics_cache.today())
+        data = self.statistics_cache.get(endpoint, bucket)
+        if data is not None:
+            return data
+
+        response = self._get(endpoint, params={"period": period}, model=model)
         if response["status"] == 200:
+            self.statistics_cache.store(endpoint, bucket, response["data"])
             return response["data"]
         else:
             raise Exception(response["detail"])
 
+    def get_statistics_range(self, endpoint, key, date_from, date_to, model=None):
+        """Получает статистику за произвольный диапазон дат, складывая дневные данные.
+
+        Недостающие дни запрашиваются параллельно через общий пул соединений, остальные берутся из кэша.
+        Сервер должен подтвердить день ответом {"date", "items"}: если он вернул обычный список или другой день
+        (параметр date не поддерживается), диапазон для endpoint отключается, а не складывается из чужих данных.
+        """
+        if date_from > date_to:
+            raise Exception("Дата начала периода позже даты окончания.")
+        if endpoint in self.unsupported_statistics_ranges:
+            raise Exception(self.UNSUPPORTED_RANGE_MESSAGE)
+        days = days_between(date_from, min(date_to, self.statistics_cache.today()))
+        buckets = {day: self.statistics_cache.get(endpoint, ("day", day)) for day in days}
+        missing = [day for day, data in buckets.items() if data is None]
+        if missing:
+            workers = min(len(missing), self.network_layer.max_connections)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                responses = pool.map(
+                    lambda day: self._get(endpoint, params={"period": "day", "date": day.isoformat()}),
+                    missing
+                )
+                for day, response in zip(missing, responses):
+                    if response["status"] != 200:
+                        raise Exception(response["detail"])
+                    rows = day_rows(response["data"], day)
+                    if rows is None:
+                        self.unsupported_statistics_ranges.add(endpoint)
+                        raise Exception(self.UNSUPPORTED_RANGE_MESSAGE)
+                    self.statistics_cache.store(endpoint, ("day", day), rows)
+                    buckets[day] = rows
+        return merge_statistics(buckets.values(), key, model)
+
+    def get_computer_usage_statistics(self, period):
+        """Получает статистику использования компьютеров."""
+        return self.get_statistics("/statistics/computer_usage", period, ComputerUsageStat)
+
+    def get_computer_usage_statistics_range(self, date_from, date_to):
+        """Получает статистику использования компьютеров за диапазон дат."""
+        return self.get_statistics_range("/statistics/computer_usage", "computer_name", date_from, date_to,
+                                         ComputerUsageStat)
+
     def get_food_statistics(self, period):
         """Получает статистику заказов еды."""
-        self.refresh_token()
-        headers = self.network_layer.get_headers()
-        response = self.network_layer.get(f"/statistics/food_statistics", headers=headers, params={"period": period})
-        if response["status"] == 200:
-            return response["data"]
-        else:
-            raise Exception(response["detail"])
\ No newline at end of file
+        return self.get_statistics("/statistics/food_statistics", period, FoodStat)
+
+    def get_food_statistics_range(self, date_from, date_to):
+        """Получает статистику заказов еды за диапазон дат."""
+        return self.get_statistics_range("/statistics/food_statistics", "name", date_from, date_to, FoodStat)
\ No newline at end of file
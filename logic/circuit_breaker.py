@@ -0,0 +1,87 @@
+import threading
+import time
+
+
+class CircuitOpenError(Exception):
+    """Запрос не отправлен: сервер считается недоступным."""
+
+
+class CircuitBreaker:
+    """Размыкает цепь после серии сбоев подряд и быстро отклоняет запросы, пока сервер недоступен.
+
+    Через reset_timeout секунд пропускается один пробный запрос. Если он тоже не удался, время ожидания
+    удваивается до max_reset_timeout.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=5.0, max_reset_timeout=60.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._timeout = reset_timeout
+        self._opened_at = None
+        self._trial_running = False
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener):
+        """Добавляет обработчик смены состояния; вызывается с новым состоянием."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def retry_after(self):
+        """Сколько секунд осталось до пробного запроса (0, если цепь замкнута)."""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self._timeout - self.clock())
+
+    def allow(self):
+        """Проверяет, можно ли отправить запрос; в полуоткрытом состоянии пропускает только один."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self.clock() - self._opened_at < self._timeout:
+                return False
+            if self._trial_running:
+                return False
+            self._trial_running = True
+            changed = self._set_state(self.HALF_OPEN)
+        self._notify(changed)
+        return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._timeout = self.reset_timeout
+            self._trial_running = False
+            changed = self._set_state(self.CLOSED)
+        self._notify(changed)
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN:
+                self._timeout = min(self._timeout * 2, self.max_reset_timeout)
+            elif self.failures < self.failure_threshold or self.state == self.OPEN:
+                return
+            self._trial_running = False
+            self._opened_at = self.clock()
+            changed = self._set_state(self.OPEN)
+        self._notify(changed)
+
+    def _set_state(self, state):
+        changed = self.state != state
+        self.state = state
+        return changed
+
+    def _notify(self, changed):
+        if changed:
+            for listener in list(self._listeners):
+                listener(self.state)
@@ -0,0 +1,43 @@
+from functools import partial
+
+from logic import json_codec
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class ContentDecoders:
+    """Декодеры тел ответов по Content-Type.
+
+    JSON поддерживается всегда; MessagePack — если установлен пакет msgpack. Ответ неизвестного типа
+    разбирается как JSON. Дополнительные форматы подключаются через register.
+    """
+
+    JSON = "application/json"
+
+    def __init__(self):
+        self._decoders = {}
+        self.register(self.JSON, json_codec.loads)
+        if msgpack is not None:
+            unpack = partial(msgpack.unpackb, raw=False)
+            self.register("application/msgpack", unpack)
+            self.register("application/x-msgpack", unpack, advertise=False)
+
+    def register(self, content_type, loads, advertise=True):
+        """Добавляет декодер; advertise=False — тип принимается, но не указывается в заголовке Accept."""
+        self._decoders[content_type] = (loads, advertise)
+        self._advertised = [name for name, (_, shown) in self._decoders.items() if shown]
+
+    def accept_header(self):
+        """Значение Accept: сначала компактные форматы, JSON — с меньшим весом, если есть другие."""
+        others = [content_type for content_type in self._advertised if content_type != self.JSON]
+        if not others:
+            return self.JSON
+        return ", ".join(others + [f"{self.JSON};q=0.9"])
+
+    def decode(self, content, content_type=None):
+        mime = (content_type or self.JSON).split(";", 1)[0].strip().lower()
+        loads, _ = self._decoders.get(mime, self._decoders[self.JSON])
+        return loads(content)
@@ -0,0 +1,174 @@
+import threading
+from contextlib import contextmanager
+
+from logic.record_diff import diff_records
+from logic.records import Record
+
+
+class EntityStore:
+    """Хранит записи коллекции по id и уведомляет представления об изменениях."""
+
+    def __init__(self, key="id"):
+        self.key = key
+        self.loaded = False
+        self._records = {}
+        self._source = None
+        self._listeners = []
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._version = 0
+        self._delivered = 0
+        self._delivery_lock = threading.RLock()
+
+    def subscribe(self, listener):
+        """Добавляет обработчик, получающий актуальный список записей после каждого изменения."""
+        self._listeners.append(listener)
+        if self.loaded:
+            listener(self.records())
+        return lambda: self._listeners.remove(listener)
+
+    def records(self):
+        with self._lock:
+            return list(self._records.values())
+
+    def get(self, key):
+        with self._lock:
+            return self._records.get(key)
+
+    def replace_all(self, records):
+        """Заменяет содержимое коллекции данными с сервера."""
+        with self._lock:
+            if records is self._source:
+                return
+            self._source = records
+            self._records = {record[self.key]: record for record in records}
+            self.loaded = True
+        self._notify()
+
+    def sync_all(self, records):
+        """Заменяет содержимое полным списком, но уведомляет представления, только если записи изменились.
+
+        Возвращает True, если содержимое изменилось.
+        """
+        with self._lock:
+            if records is self._source:
+                return False
+            diff = diff_records(self._records.values(), records, self.key)
+            changed = not self.loaded or any(diff.values())
+            self._source = records
+            if changed:
+                self._records = {record[self.key]: record for record in records}
+                self.loaded = True
+        if changed:
+            self._notify()
+        return changed
+
+    def apply_changes(self, upserts, deleted):
+        """Применяет дельту: добавляет или заменяет записи upserts и удаляет записи с ключами deleted.
+
+        Уведомляет один раз и только при реальных изменениях; возвращает True, если они были.
+        """
+        with self._lock:
+            changed = not self.loaded
+            for record in upserts:
+                key = record[self.key]
+                if self._records.get(key) != record:
+                    self._records[key] = record
+                    changed = True
+            for key in deleted:
+                if self._records.pop(key, None) is not None:
+                    changed = True
+            self.loaded = True
+        if changed:
+            self._notify()
+        return changed
+
+    def upsert(self, record):
+        """Добавляет или заменяет запись. Возвращает данные для отката."""
+        with self._lock:
+            undo = self._undo_for(record[self.key])
+            self._records[record[self.key]] = record
+        self._notify()
+        return undo
+
+    def upsert_many(self, records):
+        """Добавляет или заменяет несколько записей с одним уведомлением (например, страницу данных)."""
+        with self._lock:
+            for record in records:
+                self._records[record[self.key]] = record
+            self.loaded = True
+        self._notify()
+
+    def patch(self, key, **fields):
+        """Меняет поля записи, не изменяя исходную запись. Возвращает данные для отката."""
+        with self._lock:
+            undo = self._undo_for(key)
+            record = self._records.get(key)
+            if isinstance(record, Record):
+                self._records[key] = record.replace(**fields)
+            elif record is not None:
+                self._records[key] = dict(record, **fields)
+        self._notify()
+        return undo
+
+    def remove(self, key):
+        """Удаляет запись. Возвращает данные для отката."""
+        with self._lock:
+            undo = self._undo_for(key)
+            self._records.pop(key, None)
+        self._notify()
+        return undo
+
+    def revert(self, undo):
+        """Возвращает запись в состояние до оптимистичного изменения."""
+        key, previous, position = undo
+        with self._lock:
+            items = [(k, v) for k, v in self._records.items() if k != key]
+            if previous is not None:
+                items.insert(min(position, len(items)), (key, previous))
+            self._records = dict(items)
+        self._notify()
+
+    @contextmanager
+    def batch(self):
+        """Откладывает уведомления до конца блока, чтобы пакет изменений обновил представления один раз."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                dirty = self._batch_depth == 0 and self._batch_dirty
+                if dirty:
+                    self._batch_dirty = False
+            if dirty:
+                self._notify()
+
+    def _undo_for(self, key):
+        keys = list(self._records)
+        position = keys.index(key) if key in self._records else len(keys)
+        return key, self._records.get(key), position
+
+    def _notify(self):
+        """Рассылает снимок записей по порядку версий.
+
+        Снимок нумеруется под той же блокировкой, что и изменения; рассылки из разных потоков идут по одной, и
+        снимок старше уже разосланного отбрасывается, поэтому представления не откатываются к прежнему состоянию.
+        """
+        with self._lock:
+            if self._batch_depth:
+                self._batch_dirty = True
+                return
+            self._version += 1
+            version = self._version
+            records = list(self._records.values())
+        with self._delivery_lock:
+            if version < self._delivered:
+                return
+            self._delivered = version
+            for listener in list(self._listeners):
+                if self._delivered != version:
+                    return
+                listener(records)
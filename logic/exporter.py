@@ -0,0 +1,92 @@
+import csv
+import os
+
+
+PROGRESS_EVERY = 500
+
+
+def iter_records(pages):
+    """Разворачивает поток страниц в поток записей."""
+    for page in pages:
+        yield from page
+
+
+def iter_table(records, columns):
+    """Превращает записи в строки таблицы; columns — пары (заголовок, функция значения)."""
+    for record in records:
+        yield [value(record) for _, value in columns]
+
+
+def export_rows(make_records, columns, path, progress=None, cancelled=None):
+    """Потоково записывает записи в CSV или XLSX (по расширению файла).
+
+    make_records вызывается уже в фоновом потоке и может вернуть генератор, поэтому в памяти держится
+    только текущая страница. Файл пишется во временный и заменяет итоговый только после успешного
+    завершения. Возвращает число выгруженных строк или None, если экспорт отменен.
+    """
+    rows = iter_table(make_records(), columns)
+    header = [title for title, _ in columns]
+    writer = _write_xlsx if path.lower().endswith(".xlsx") else _write_csv
+    temp_path = f"{path}.part"
+    try:
+        count = writer(temp_path, header, _watch(rows, progress, cancelled))
+    except _Cancelled:
+        _remove_partial(temp_path)
+        return None
+    except Exception:
+        _remove_partial(temp_path)
+        raise
+    os.replace(temp_path, path)
+    return count
+
+
+class _Cancelled(Exception):
+    pass
+
+
+def _remove_partial(path):
+    """Удаляет недописанный файл; XLSX создается только при сохранении, поэтому файла может не быть."""
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _watch(rows, progress, cancelled):
+    """Сообщает о прогрессе каждые PROGRESS_EVERY строк и прерывает выгрузку по запросу отмены."""
+    count = 0
+    for row in rows:
+        if cancelled is not None and cancelled.is_set():
+            raise _Cancelled()
+        yield row
+        count += 1
+        if progress and count % PROGRESS_EVERY == 0:
+            progress(count)
+    if progress:
+        progress(count)
+
+
+def _write_csv(path, header, rows):
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8-sig") as file:
+        writer = csv.writer(file, delimiter=";")
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def _write_xlsx(path, header, rows):
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise Exception("Для экспорта в XLSX установите пакет openpyxl.")
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(header)
+    count = 0
+    for row in rows:
+        sheet.append(row)
+        count += 1
+    workbook.save(path)
+    return count
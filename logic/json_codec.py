@@ -0,0 +1,27 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value):
+    """Сериализует записи из logic.records как словари."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Объект типа {type(value).__name__} не сериализуется в JSON")
+
+
+def loads(content):
+    """Разбирает JSON (bytes или str); использует orjson, если он установлен."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps(data):
+    """Сериализует данные в строку JSON; записи превращаются в словари."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default).decode()
+    return json.dumps(data, ensure_ascii=False, default=_default)
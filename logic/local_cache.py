@@ -0,0 +1,147 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from logic.json_codec import dumps, loads
+
+
+class LocalCache:
+    """Локальная база SQLite: последние полученные коллекции и журнал изменений, сделанных без связи."""
+
+    SAVE_DELAY = 1.0
+
+    def __init__(self, path=None):
+        self.path = path or self.default_path()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._save_timer = None
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS collections (
+                    name TEXT PRIMARY KEY, data TEXT NOT NULL, saved_at REAL NOT NULL);
+                CREATE TABLE IF NOT EXISTS settings (
+                    name TEXT PRIMARY KEY, value TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS journal (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, collection TEXT NOT NULL, record_key TEXT NOT NULL,
+                    method TEXT NOT NULL, endpoint TEXT NOT NULL, params TEXT, body TEXT,
+                    fields TEXT, base TEXT, created_at REAL NOT NULL);
+            """)
+
+    @staticmethod
+    def default_path():
+        """Путь к базе: переменная окружения CLUBSTAFF_CACHE_PATH или ~/.clubstaff/cache.sqlite3."""
+        return os.environ.get("CLUBSTAFF_CACHE_PATH") or \
+            os.path.join(os.path.expanduser("~"), ".clubstaff", "cache.sqlite3")
+
+    def load(self, name):
+        """Возвращает сохраненную коллекцию или None."""
+        self.flush()
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM collections WHERE name = ?", (name,)).fetchone()
+        return loads(row[0]) if row else None
+
+    def save(self, name, records):
+        data = dumps(records)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO collections (name, data, saved_at) VALUES (?, ?, ?)",
+                (name, data, time.time())
+            )
+
+    def save_later(self, name, records):
+        """Запоминает снимок коллекции и записывает его в фоне через SAVE_DELAY секунд.
+
+        Снимки, пришедшие за это время, заменяют предыдущий, поэтому частые изменения хранилища не ждут
+        сериализации и записи в базу.
+        """
+        with self._pending_lock:
+            self._pending[name] = records
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self):
+        """Сразу записывает отложенные снимки коллекций."""
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+                self._save_timer = None
+            for name, records in pending.items():
+                self.save(name, records)
+
+    def remember_login(self, login, password, role):
+        """Сохраняет хэш учетных данных последнего входа, чтобы можно было войти без связи с сервером."""
+        salt = os.urandom(16)
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO settings (name, value) VALUES (?, ?)", [
+                ("login", login), ("role", role), ("salt", salt.hex()),
+                ("password_hash", self._hash(password, salt)),
+            ])
+
+    def check_login(self, login, password):
+        """Сверяет учетные данные с последним успешным входом.
+
+        Возвращает роль, если они совпадают, False при неверном пароле и None, если этот логин здесь не входил.
+        """
+        with self._lock:
+            settings = dict(self._connection.execute("SELECT name, value FROM settings").fetchall())
+        if settings.get("login") != login or "salt" not in settings:
+            return None
+        if self._hash(password, bytes.fromhex(settings["salt"])) != settings["password_hash"]:
+            return False
+        return settings["role"]
+
+    @staticmethod
+    def _hash(password, salt):
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, 100_000).hex()
+
+    def append_journal(self, entry):
+        """Добавляет изменение в конец журнала."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO journal "
+                "(collection, record_key, method, endpoint, params, body, fields, base, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (entry["collection"], dumps(entry["key"]), entry["method"], entry["endpoint"],
+                 dumps(entry.get("params")), dumps(entry.get("json")),
+                 dumps(entry.get("fields")), dumps(entry.get("base")), time.time())
+            )
+
+    def journal(self):
+        """Возвращает изменения журнала в порядке их совершения."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, collection, record_key, method, endpoint, params, body, fields, base "
+                "FROM journal ORDER BY id"
+            ).fetchall()
+        return [
+            {"id": row[0], "collection": row[1], "key": loads(row[2]), "method": row[3], "endpoint": row[4],
+             "params": loads(row[5]), "json": loads(row[6]), "fields": loads(row[7]),
+             "base": loads(row[8])}
+            for row in rows
+        ]
+
+    def journal_size(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM journal").fetchone()[0]
+
+    def remove_journal_entry(self, entry_id):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM journal WHERE id = ?", (entry_id,))
+
+    def close(self):
+        """Записывает отложенные снимки и закрывает базу."""
+        with self._pending_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+        self.flush()
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,174 @@
+import json
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_label(endpoint):
+    """Заменяет числовые id в пути на {id}, чтобы запросы к разным записям считались вместе."""
+    return _ID_SEGMENT.sub("/{id}", endpoint.split("?", 1)[0])
+
+
+class LatencyHistogram:
+    """Гистограмма длительностей в секундах с корзинами как в Prometheus и окном последних замеров для перцентилей."""
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, window=1024):
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, seconds):
+        self.counts[bisect_left(self.BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+
+    def percentile(self, fraction):
+        """Перцентиль по последним замерам; None, если замеров еще нет."""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": dict(zip([str(bound) for bound in self.BUCKETS] + ["+Inf"], self.counts)),
+        }
+
+
+class Metrics:
+    """Счетчики запросов по endpoint (количество, байты, коды ответа, задержки) и длительности операций интерфейса."""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._timings = {}
+        self.started_at = time.time()
+
+    def record_request(self, method, endpoint, status, seconds, received=0, sent=0):
+        """Учитывает один обмен с сервером; status 0 означает, что ответ не получен."""
+        with self._lock:
+            entry = self._entry(method, endpoint)
+            entry["statuses"][status] = entry["statuses"].get(status, 0) + 1
+            entry["received"] += received
+            entry["sent"] += sent
+            entry["latency"].observe(seconds)
+
+    def record_coalesced(self, method, endpoint):
+        """Учитывает запрос, не отправленный на сервер, потому что такой же уже выполнялся."""
+        with self._lock:
+            self._entry(method, endpoint)["coalesced"] += 1
+
+    def _entry(self, method, endpoint):
+        key = (method, endpoint_label(endpoint))
+        entry = self._requests.get(key)
+        if entry is None:
+            entry = self._requests[key] = {"statuses": {}, "received": 0, "sent": 0, "coalesced": 0,
+                                           "latency": LatencyHistogram()}
+        return entry
+
+    def record_timing(self, kind, name, seconds):
+        """Учитывает длительность операции, например populate_table экрана в потоке интерфейса."""
+        with self._lock:
+            histogram = self._timings.get((kind, name))
+            if histogram is None:
+                histogram = self._timings[(kind, name)] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timed(self, kind, name):
+        started = self.clock()
+        try:
+            yield
+        finally:
+            self.record_timing(kind, name, self.clock() - started)
+
+    def reset(self):
+        with self._lock:
+            self._requests.clear()
+            self._timings.clear()
+            self.started_at = time.time()
+
+    def snapshot(self):
+        """Возвращает все счетчики в виде словаря, пригодного для JSON."""
+        with self._lock:
+            requests = [
+                dict(method=method, endpoint=endpoint, count=entry["latency"].count,
+                     statuses={str(status): count for status, count in sorted(entry["statuses"].items())},
+                     received=entry["received"], sent=entry["sent"], coalesced=entry["coalesced"],
+                     latency=entry["latency"].snapshot())
+                for (method, endpoint), entry in sorted(self._requests.items())
+            ]
+            timings = [dict(kind=kind, name=name, **histogram.snapshot())
+                       for (kind, name), histogram in sorted(self._timings.items())]
+        return {"started_at": self.started_at, "requests": requests, "timings": timings}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self):
+        """Возвращает счетчики в текстовом формате Prometheus."""
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP clubstaff_requests_total Запросы к серверу по endpoint и коду ответа (0 - нет ответа).",
+            "# TYPE clubstaff_requests_total counter",
+        ]
+        for entry in snapshot["requests"]:
+            for status, count in entry["statuses"].items():
+                lines.append(f"clubstaff_requests_total{{{_labels(entry, status=status)}}} {count}")
+        for name, field, description in (("clubstaff_response_bytes_total", "received", "Получено байт тела ответа."),
+                                         ("clubstaff_request_bytes_total", "sent", "Отправлено байт тела запроса."),
+                                         ("clubstaff_coalesced_requests_total", "coalesced",
+                                          "Запросы, получившие ответ уже выполнявшегося такого же запроса.")):
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+            lines += [f"{name}{{{_labels(entry)}}} {entry[field]}" for entry in snapshot["requests"]]
+        lines += _histogram_lines("clubstaff_request_duration_seconds", "Длительность запросов к серверу.",
+                                  [(_labels(entry), entry["latency"]) for entry in snapshot["requests"]])
+        lines += _histogram_lines("clubstaff_operation_duration_seconds", "Длительность операций приложения.",
+                                  [(_labels(entry, keys=("kind", "name")), entry) for entry in snapshot["timings"]])
+        return "\n".join(lines) + "\n"
+
+
+def _labels(entry, keys=("method", "endpoint"), **extra):
+    values = [(key, entry[key]) for key in keys] + list(extra.items())
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in values)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name, description, series):
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+    for labels, histogram in series:
+        cumulative = 0
+        for bound, count in histogram["buckets"].items():
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {histogram['sum']}")
+        lines.append(f"{name}_count{{{labels}}} {histogram['count']}")
+    quantiles = [(labels, histogram) for labels, histogram in series if histogram["count"]]
+    if quantiles:
+        lines += [f"# HELP {name}_quantile Перцентили по последним замерам.", f"# TYPE {name}_quantile gauge"]
+        for labels, histogram in quantiles:
+            for quantile in ("p50", "p95", "p99"):
+                value = f"0.{quantile[1:]}"
+                lines.append(f'{name}_quantile{{{labels},quantile="{value}"}} {histogram[quantile]}')
+    return lines
@@ -1,12 +1,71 @@
+import importlib.util
+import random
+import threading
+import time
+from concurrent.futures import Future
+
 import httpx
 
+from logic.circuit_breaker import CircuitBreaker, CircuitOpenError
+from logic.content_decoders import ContentDecoders
+from logic.metrics import Metrics
+from logic.records import RecordError, parse_records
+from logic.request_queue import RequestQueue
+from logic.response_cache import ResponseCache
+from logic.subscription import Subscription
+
 
 class NetworkLayer:
     BASE_URL = "http://localhost:5321"
+    # DELETE не повторяется: если сервер выполнил первый запрос, а ответ не дошел, повтор получит 404, и
+    # удаление покажется неудачным.
+    RETRY_METHODS = {"GET", "HEAD", "OPTIONS", "PUT"}
+    RETRY_STATUSES = {502, 503, 504}
+    # Приоритеты очереди запросов: меньше — срочнее. По умолчанию изменения идут как действия пользователя,
+    # GET — как обычная загрузка экрана, а периодические обновления явно помечаются фоновыми.
+    PRIORITY_USER = 0
+    PRIORITY_NORMAL = 1
+    PRIORITY_BACKGROUND = 2
 
-    def __init__(self):
+    def __init__(self, max_connections=10, max_keepalive_connections=5, keepalive_expiry=30.0,
+                 timeout=10.0, connect_timeout=5.0, retries=2, backoff=0.25, max_backoff=2.0,
+                 failure_threshold=5, reset_timeout=5.0, max_concurrent_per_host=6, http2=None, base_url=None):
         self.token = None
+        self.offline = False
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker = CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=reset_timeout)
         self.app_source = "staff"
+        self.max_connections = max_connections
+        self.unsupported_streams = set()
+        self.unsupported_batches = set()
+        self.unsupported_deltas = set()
+        self.cache = ResponseCache()
+        self.metrics = Metrics()
+        self.decoders = ContentDecoders()
+        # HTTP/2 включается, если установлен пакет h2; httpx договаривается о нем через ALPN (для https).
+        self.http2 = importlib.util.find_spec("h2") is not None if http2 is None else http2
+        self.queue = RequestQueue(max_concurrent_per_host)
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+        # Сжатие gzip/deflate (и brotli/zstd, если установлены их пакеты) httpx запрашивает и распаковывает сам.
+        self.client = httpx.Client(
+            base_url=base_url or self.BASE_URL,
+            http2=self.http2,
+            headers={"Accept": self.decoders.accept_header()},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            timeout=httpx.Timeout(timeout, connect=connect_timeout)
+        )
+
+    def register_decoder(self, content_type, loads, advertise=True):
+        """Подключает декодер тел ответов и обновляет заголовок Accept."""
+        self.decoders.register(content_type, loads, advertise)
+        self.client.headers["Accept"] = self.decoders.accept_header()
 
     def set_token(self, token):
         self.token = token
@@ -19,59 +78,162 @@ class NetworkLayer:
             "X-App-Source": self.app_source
         }
 
-    def get(self, endpoint, headers=None, params=None):
+    def subscribe(self, endpoint, on_change, on_error=None, headers_factory=None, params=None,
+                  min_interval=1.0, max_interval=30.0, model=None, gate=None, fetch=None):
+        """Подписывается на изменения ресурса через поток событий {endpoint}/stream или опрос."""
+        return Subscription(
+            self, endpoint, on_change, on_error, headers_factory=headers_factory, params=params,
+            stream_endpoint=f"{endpoint}/stream", min_interval=min_interval, max_interval=max_interval, model=model,
+            gate=gate, fetch=fetch
+        ).start()
+
+    def close(self):
+        """Закрывает соединения пула."""
+        self.cache.clear()
+        self.client.close()
+
+    def backoff_delay(self, attempt):
+        """Пауза перед повтором: экспоненциальный рост с полным случайным разбросом."""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def send(self, method, endpoint, priority=None, **kwargs):
+        """Отправляет запрос через общий клиент.
+
+        Запрос ждет свободного слота хоста в очереди по приоритету. Запросы из RETRY_METHODS повторяются при
+        ошибке подключения или ответах 502/503/504. Пока сервер считается недоступным, запросы не отправляются и
+        сразу завершаются CircuitOpenError. Флаг offline показывает, закончился ли последний запрос без ответа.
+        """
+        if priority is None:
+            priority = self.PRIORITY_NORMAL if method == "GET" else self.PRIORITY_USER
+        host = self.client.base_url.host
+        attempts = self.retries + 1 if method in self.RETRY_METHODS else 1
+        for attempt in range(attempts):
+            if not self.breaker.allow():
+                self.offline = True
+                raise CircuitOpenError(
+                    f"Сервер недоступен, повтор через {self.breaker.retry_after():.0f} с")
+            queued = time.perf_counter()
+            try:
+                with self.queue.slot(host, priority):
+                    started = time.perf_counter()
+                    self.metrics.record_timing("queue_wait", f"priority {priority}", started - queued)
+                    response = self.client.request(method, endpoint, **kwargs)
+            except httpx.RequestError:
+                self.metrics.record_request(method, endpoint, 0, time.perf_counter() - started)
+                self.breaker.record_failure()
+                if attempt == attempts - 1:
+                    self.offline = True
+                    raise
+            else:
+                self.metrics.record_request(method, endpoint, response.status_code, time.perf_counter() - started,
+                                            received=response.num_bytes_downloaded,
+                                            sent=len(response.request.content))
+                self.offline = False
+                if response.status_code not in self.RETRY_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                if attempt == attempts - 1:
+                    return response
+            time.sleep(self.backoff_delay(attempt))
+
+    def error_detail(self, response, default_detail="Ошибка"):
+        """Текст ошибки из ответа сервера; ответ может быть не в JSON (например, от прокси)."""
         try:
-            response = httpx.get(
-                f"{self.BASE_URL}{endpoint}",
-                headers=headers,
-                params=params,
-                timeout=10
-            )
-            return {"status": response.status_code, "data": response.json()} if response.status_code == 200 else {"status": response.status_code, "detail": response.json().get("detail", "Ошибка")}
-        except httpx.RequestError as e:
-            return {"status": 0, "detail": f"Ошибка подключения: {str(e)}"}
+            data = self.decoders.decode(response.content, response.headers.get("content-type"))
+            return data.get("detail", default_detail)
+        except (ValueError, AttributeError):
+            return default_detail
 
-    def post(self, endpoint, headers=None, json=None, params=None):
+    def decode(self, response, model=None):
+        """Разбирает тело ответа по его Content-Type; если задан model (класс из logic.records), сразу проверяет
+        и строит записи."""
+        with self.metrics.timed("decode", model.__name__ if model is not None else "raw"):
+            data = self.decoders.decode(response.content, response.headers.get("content-type"))
+            return parse_records(model, data) if model is not None else data
+
+    def request(self, method, endpoint, headers=None, json=None, params=None, default_detail="Ошибка", model=None,
+                priority=None):
+        """Выполняет запрос через общий клиент с пулом соединений."""
         try:
-            response = httpx.post(
-                f"{self.BASE_URL}{endpoint}",
-                headers=headers,
-                json=json,
-                params=params,
-                timeout=10
-            )
-            return {"status": response.status_code, "data": response.json()} if response.status_code == 200 else {"status": response.status_code, "detail": response.json().get("detail", "Ошибка")}
+            response = self.send(method, endpoint, priority=priority, headers=headers, json=json, params=params)
+            if response.status_code == 200:
+                return {"status": 200, "data": self.decode(response, model)}
+            else:
+                return {"status": response.status_code, "detail": self.error_detail(response, default_detail)}
         except httpx.RequestError as e:
             return {"status": 0, "detail": f"Ошибка подключения: {str(e)}"}
+        except CircuitOpenError as e:
+            return {"status": 0, "detail": str(e)}
+        except RecordError as e:
+            return {"status": 502, "detail": f"Некорректный ответ сервера: {e}"}
 
-    def put(self, endpoint, headers=None, json=None, params=None):
-        """Выполняет PUT-запрос."""
+    def get(self, endpoint, headers=None, params=None, use_cache=True, model=None, priority=None):
+        """Выполняет условный GET-запрос; неизмененный ответ берется из кэша без разбора JSON.
+
+        Одинаковые GET-запросы, отправленные, пока первый еще выполняется, не уходят на сервер повторно:
+        все вызывающие получают ответ первого. Объединяются только запросы с одинаковым приоритетом, чтобы
+        срочный запрос не ждал в очереди за фоновым. С use_cache=False ответ не кэшируется (например, при потоковой
+        выгрузке большой коллекции).
+        """
+        if priority is None:
+            priority = self.PRIORITY_NORMAL
+        key = (ResponseCache.make_key(endpoint, params, model), use_cache, priority)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+        if not leader:
+            self.metrics.record_coalesced("GET", endpoint)
+            return future.result()
+        try:
+            result = self._get(endpoint, headers, params, use_cache, model, priority)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    def _get(self, endpoint, headers, params, use_cache, model, priority):
+        if not use_cache:
+            return self.request("GET", endpoint, headers=headers, params=params, model=model, priority=priority)
+        key = ResponseCache.make_key(endpoint, params, model)
+        entry = self.cache.get(key)
         try:
-            response = httpx.put(
-                f"{self.BASE_URL}{endpoint}",
-                headers=headers,
-                json=json,
-                params=params,
-                timeout=10
-            )
+            response = self.send("GET", endpoint, priority=priority,
+                                 headers=dict(headers or {}, **self.cache.conditional_headers(entry)), params=params)
+            if response.status_code == 304 and entry:
+                self.cache.record_hit(entry)
+                return {"status": 200, "data": entry["data"], "not_modified": True}
             if response.status_code == 200:
-                return {"status": 200, "data": response.json()}
-            else:
-                return {"status": response.status_code, "detail": response.json().get("detail", "Неизвестная ошибка")}
+                data = self.cache.lookup_body(entry, response.content)
+                if data is not None:
+                    return {"status": 200, "data": data, "not_modified": True}
+                data = self.decode(response, model)
+                self.cache.store(key, response, data)
+                return {"status": 200, "data": data}
+            return {"status": response.status_code, "detail": self.error_detail(response)}
         except httpx.RequestError as e:
             return {"status": 0, "detail": f"Ошибка подключения: {str(e)}"}
+        except CircuitOpenError as e:
+            return {"status": 0, "detail": str(e)}
+        except RecordError as e:
+            return {"status": 502, "detail": f"Некорректный ответ сервера: {e}"}
+
+    def post(self, endpoint, headers=None, json=None, params=None):
+        """Выполняет POST-запрос."""
+        return self.request("POST", endpoint, headers=headers, json=json, params=params)
+
+    def put(self, endpoint, headers=None, json=None, params=None):
+        """Выполняет PUT-запрос."""
+        return self.request("PUT", endpoint, headers=headers, json=json, params=params,
+                            default_detail="Неизвестная ошибка")
 
     def delete(self, endpoint, headers=None):
         """Выполняет DELETE-запрос."""
-        try:
-            response = httpx.delete(
-                f"{self.BASE_URL}{endpoint}",
-                headers=headers,
-                timeout=10
-            )
-            if response.status_code == 200:
-                return {"status": 200, "data": response.json()}
-            else:
-                return {"status": response.status_code, "detail": response.json().get("detail", "Неизвестная ошибка")}
-        except httpx.RequestError as e:
-            return {"status": 0, "detail": f"Ошибка подключения: {str(e)}"}
\ No newline at end of file
+        return self.request("DELETE", endpoint, headers=headers, default_detail="Неизвестная ошибка")
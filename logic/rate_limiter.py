@@ -0,0 +1,29 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Ограничивает число фоновых запросов в секунду (маркерное ведро); безопасен для вызова из разных потоков."""
+
+    def __init__(self, rate=4.0, burst=None, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst or rate
+        self.clock = clock
+        self.granted = 0
+        self.rejected = 0
+        self._tokens = self.burst
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """Забирает маркер, если он есть. Возвращает False, если лимит на текущий момент исчерпан."""
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.granted += 1
+                return True
+            self.rejected += 1
+            return False
@@ -0,0 +1,17 @@
+def diff_records(old_records, new_records, key="id"):
+    """Сравнивает два списка записей по ключу и возвращает добавленные, удаленные и измененные ключи."""
+    old_by_key = {record[key]: record for record in old_records}
+    new_by_key = {record[key]: record for record in new_records}
+    return {
+        "added": [k for k in new_by_key if k not in old_by_key],
+        "removed": [k for k in old_by_key if k not in new_by_key],
+        "changed": [k for k, record in new_by_key.items()
+                    if k in old_by_key and old_by_key[k] is not record and old_by_key[k] != record],
+    }
+
+
+def changed_fields(old_record, new_record):
+    """Возвращает имена полей, значения которых различаются."""
+    if old_record is None:
+        return set(new_record)
+    return {field for field in new_record if old_record.get(field) != new_record[field]}
@@ -0,0 +1,143 @@
+from collections.abc import Mapping
+
+
+class RecordError(ValueError):
+    """Данные сервера не соответствуют ожидаемой записи."""
+
+
+class Record(Mapping):
+    """Компактная запись со слотами вместо словаря.
+
+    Поля задаются в __slots__, их преобразования — в TYPES, обязательные поля — в REQUIRED. Данные
+    проверяются один раз при разборе ответа сервера. Для совместимости запись читается как словарь:
+    record["name"], record.get("name"), dict(record).
+    """
+
+    __slots__ = ()
+    TYPES = ()
+    REQUIRED = ()
+    _SCHEMA = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.FIELD_SET = frozenset(cls.__slots__)
+        cls._SCHEMA = tuple((field, convert, field in cls.REQUIRED)
+                            for field, convert in zip(cls.__slots__, cls.TYPES))
+
+    def __init__(self, **fields):
+        for field in self.__slots__:
+            setattr(self, field, fields.get(field))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Проверяет и преобразует словарь из ответа сервера в запись."""
+        if not isinstance(data, (dict, Mapping)):
+            raise RecordError(f"{cls.__name__}: ожидался объект, получено {type(data).__name__}")
+        record = cls.__new__(cls)
+        get = data.get
+        for field, convert, required in cls._SCHEMA:
+            value = get(field)
+            if value is None:
+                if required:
+                    raise RecordError(f"{cls.__name__}: отсутствует поле {field}")
+            elif convert is not None and type(value) is not convert:
+                try:
+                    value = convert(value)
+                except (TypeError, ValueError) as e:
+                    raise RecordError(f"{cls.__name__}: некорректное поле {field}: {e}")
+            setattr(record, field, value)
+        return record
+
+    @classmethod
+    def from_list(cls, items):
+        if not isinstance(items, list):
+            raise RecordError(f"{cls.__name__}: ожидался список, получено {type(items).__name__}")
+        return [cls.from_dict(item) for item in items]
+
+    def replace(self, **fields):
+        """Возвращает копию записи с измененными полями."""
+        record = self.__class__.__new__(self.__class__)
+        for field in self.__slots__:
+            setattr(record, field, fields[field] if field in fields else getattr(self, field))
+        return record
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __getitem__(self, field):
+        if field not in self.FIELD_SET:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+def parse_records(model, data):
+    """Преобразует данные ответа в записи: список, страницу {"items", "next_cursor"}, дельту {"upserts", ...}
+    или одну запись."""
+    if isinstance(data, list):
+        return model.from_list(data)
+    if isinstance(data, dict) and "next_cursor" in data:
+        return dict(data, items=model.from_list(data.get("items")))
+    if isinstance(data, dict) and "upserts" in data:
+        return dict(data, upserts=model.from_list(data.get("upserts") or []))
+    return model.from_dict(data)
+
+
+class Staff(Record):
+    __slots__ = ("id", "login", "email", "phone")
+    TYPES = (int, str, str, str)
+    REQUIRED = ("id", "login")
+
+
+class Computer(Record):
+    __slots__ = ("id", "name", "configuration", "status", "rental_end_time")
+    TYPES = (int, str, str, str, str)
+    REQUIRED = ("id", "name", "status")
+
+
+class OrderItem(Record):
+    __slots__ = ("name", "quantity")
+    TYPES = (str, int)
+    REQUIRED = ("name", "quantity")
+
+
+class Order(Record):
+    __slots__ = ("id", "user_id", "items", "status")
+    TYPES = (int, int, OrderItem.from_list, str)
+    REQUIRED = ("id", "items", "status")
+
+
+class MenuItem(Record):
+    __slots__ = ("id", "name", "price")
+    TYPES = (int, str, float)
+    REQUIRED = ("id", "name", "price")
+
+
+class ComputerUsageStat(Record):
+    __slots__ = ("computer_name", "rental_count", "total_rental_hours")
+    TYPES = (str, int, float)
+    REQUIRED = ("computer_name",)
+
+
+class FoodStat(Record):
+    __slots__ = ("name", "order_count", "total_revenue")
+    TYPES = (str, int, float)
+    REQUIRED = ("name",)
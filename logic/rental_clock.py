@@ -0,0 +1,70 @@
+import re
+import time
+from datetime import datetime
+
+_FRACTION = re.compile(r"\.(\d+)")
+_OFFSET = re.compile(r"([+-]\d{2})(\d{2})$")
+
+
+def parse_timestamp(value):
+    """Разбирает время ISO-8601 с любой точностью долей секунды, суффиксом Z или смещением.
+
+    Время без часового пояса считается местным. Возвращает datetime с часовым поясом или None.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    text = value.strip()
+    if text[-1] in "Zz":
+        text = text[:-1] + "+00:00"
+    text = _FRACTION.sub(lambda match: "." + match.group(1)[:6].ljust(6, "0"), text, count=1)
+    text = _OFFSET.sub(r"\1:\2", text)
+    try:
+        moment = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return moment.astimezone() if moment.tzinfo is None else moment
+
+
+class RentalDeadlines:
+    """Сроки окончания аренды по id компьютера в виде отметок монотонных часов.
+
+    Строка времени разбирается один раз при получении данных и повторно — только если сервер ее изменил;
+    отсчет для всех арендованных компьютеров считается за один проход с одним чтением часов.
+    """
+
+    def __init__(self, clock=time.monotonic, wall_clock=None):
+        self.clock = clock
+        self.wall_clock = wall_clock or (lambda: datetime.now().astimezone())
+        self._sources = {}
+        self._deadlines = {}
+        self._remaining = {}
+
+    def update(self, rentals):
+        """Принимает пары (id, время окончания) арендованных компьютеров и пересчитывает изменившиеся сроки."""
+        sources, deadlines = {}, {}
+        now, wall_now = None, None
+        for key, end_time in rentals:
+            if self._sources.get(key) == end_time and key in self._deadlines:
+                deadlines[key] = self._deadlines[key]
+            else:
+                moment = parse_timestamp(end_time)
+                if moment is None:
+                    continue
+                if now is None:
+                    now, wall_now = self.clock(), self.wall_clock()
+                deadlines[key] = now + (moment - wall_now).total_seconds()
+            sources[key] = end_time
+        self._sources, self._deadlines = sources, deadlines
+        self.tick()
+
+    def tick(self):
+        """Пересчитывает оставшиеся секунды всех аренд. Возвращает id, чье время изменилось или истекло."""
+        now = self.clock()
+        self._remaining = {key: deadline - now for key, deadline in self._deadlines.items()}
+        changed = list(self._remaining)
+        self._deadlines = {key: deadline for key, deadline in self._deadlines.items() if deadline > now}
+        return changed
+
+    def remaining(self, key):
+        """Оставшиеся секунды аренды на момент последнего tick или None, если срок неизвестен."""
+        return self._remaining.get(key)
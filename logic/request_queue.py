@@ -0,0 +1,49 @@
+import heapq
+import itertools
+import threading
+from contextlib import contextmanager
+
+
+class RequestQueue:
+    """Ограничивает число одновременных запросов к одному хосту; ожидающие получают слот по приоритету.
+
+    Меньшее значение priority — более срочный запрос; при равном приоритете соблюдается порядок очереди.
+    """
+
+    def __init__(self, max_concurrent=6):
+        self.max_concurrent = max_concurrent
+        self._active = {}
+        self._waiting = {}
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, host, priority):
+        """Держит слот хоста на время запроса."""
+        self.acquire(host, priority)
+        try:
+            yield
+        finally:
+            self.release(host)
+
+    def acquire(self, host, priority):
+        with self._lock:
+            if self._active.get(host, 0) < self.max_concurrent and not self._waiting.get(host):
+                self._active[host] = self._active.get(host, 0) + 1
+                return
+            ticket = (priority, next(self._order), threading.Event())
+            heapq.heappush(self._waiting.setdefault(host, []), ticket)
+        ticket[2].wait()
+
+    def release(self, host):
+        """Освобождает слот; если есть ожидающие, слот сразу передается самому срочному из них."""
+        with self._lock:
+            waiting = self._waiting.get(host)
+            if waiting:
+                heapq.heappop(waiting)[2].set()
+            else:
+                self._active[host] -= 1
+
+    def waiting(self, host):
+        with self._lock:
+            return len(self._waiting.get(host, ()))
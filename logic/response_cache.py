@@ -0,0 +1,103 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """Кэш GET-ответов с валидаторами ETag/Last-Modified и счетчиками попаданий.
+
+    Размер кэша ограничен: если записей больше max_entries или их тела вместе больше max_bytes, вытесняются
+    дольше всего не использовавшиеся записи (страницы и дневная статистика иначе копились бы всю сессию).
+    """
+
+    def __init__(self, max_entries=256, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(endpoint, params=None, model=None):
+        """Ключ ответа; model входит в него, потому что в кэше хранятся уже разобранные данные."""
+        return endpoint, tuple(sorted((params or {}).items())), model
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def conditional_headers(self, entry):
+        """Возвращает заголовки условного запроса для сохраненного ответа."""
+        headers = {}
+        if entry and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def lookup_body(self, entry, body):
+        """Возвращает закэшированные данные, если тело ответа не изменилось."""
+        if entry and entry["digest"] == self.digest(body):
+            self.record_hit(entry, transferred=True)
+            return entry["data"]
+        return None
+
+    def store(self, key, response, data):
+        entry = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "digest": self.digest(response.content),
+            "size": len(response.content),
+            "data": data,
+        }
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous["size"]
+            self._entries[key] = entry
+            self._size += entry["size"]
+            self.misses += 1
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted["size"]
+                self.evictions += 1
+
+    def record_hit(self, entry, transferred=False):
+        """Учитывает ответ, обслуженный из кэша; при 304 тело не передавалось по сети."""
+        with self._lock:
+            self.hits += 1
+            if not transferred:
+                self.not_modified += 1
+                self.bytes_saved += entry["size"]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        """Возвращает счетчики попаданий и промахов кэша."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "not_modified": self.not_modified,
+                "bytes_saved": self.bytes_saved,
+                "entries": len(self._entries),
+                "size": self._size,
+                "evictions": self.evictions,
+            }
+
+    @staticmethod
+    def digest(body):
+        return hashlib.blake2b(body, digest_size=16).digest()
@@ -0,0 +1,108 @@
+import re
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize(text):
+    """Приводит строку к виду для поиска: без учета регистра, «ё» и «е» не различаются."""
+    return text.casefold().replace("ё", "е")
+
+
+class SearchIndex:
+    """Индекс записей в памяти для поиска по подстроке в указанных полях.
+
+    Запрос делится на слова, запись подходит, если в ней найдены все. Слова из одного-двух символов ищутся по
+    началу слов записи (префиксный индекс), более длинные — как подстрока через индекс триграмм с проверкой
+    кандидатов. Индекс обновляется инкрементально: переиндексируются только добавленные и измененные записи.
+    """
+
+    PREFIX_LENGTH = 2
+
+    def __init__(self, fields, key="id"):
+        self.fields = fields
+        self.key = key
+        self._records = {}
+        self._texts = {}
+        self._trigrams = {}
+        self._prefixes = {}
+
+    def __len__(self):
+        return len(self._records)
+
+    def update(self, records):
+        """Приводит индекс к списку записей: переиндексирует новые и изменившиеся, удаляет отсутствующие."""
+        seen = set()
+        for record in records:
+            key = record[self.key]
+            seen.add(key)
+            if self._records.get(key) is record:
+                continue
+            self._records[key] = record
+            text = self._text(record)
+            if self._texts.get(key) != text:
+                self._remove_text(key)
+                self._add_text(key, text)
+        for key in [key for key in self._records if key not in seen]:
+            self._remove_text(key)
+            del self._records[key]
+
+    def search(self, query):
+        """Возвращает множество ключей подходящих записей; None, если запрос пустой и фильтровать нечего."""
+        terms = normalize(query).split()
+        if not terms:
+            return None
+        keys = None
+        for term in sorted(terms, key=len, reverse=True):
+            matches = self._match(term, keys)
+            keys = matches if keys is None else keys & matches
+            if not keys:
+                return set()
+        return keys
+
+    def _match(self, term, candidates):
+        if len(term) <= self.PREFIX_LENGTH:
+            return set(self._prefixes.get(term, ()))
+        postings = sorted((self._trigrams.get(gram, ()) for gram in _trigrams(term)), key=len)
+        if not postings[0]:
+            return set()
+        keys = set(postings[0]) if candidates is None else candidates & postings[0]
+        for posting in postings[1:]:
+            keys &= posting
+            if not keys:
+                return keys
+        if len(term) == 3:
+            return keys
+        texts = self._texts
+        return {key for key in keys if term in texts[key]}
+
+    def _text(self, record):
+        values = (record[field] for field in self.fields)
+        return "\n".join(normalize(str(value)) for value in values if value is not None)
+
+    def _add_text(self, key, text):
+        self._texts[key] = text
+        for gram in _trigrams(text):
+            self._trigrams.setdefault(gram, set()).add(key)
+        for prefix in _prefixes(text, self.PREFIX_LENGTH):
+            self._prefixes.setdefault(prefix, set()).add(key)
+
+    def _remove_text(self, key):
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        for index, grams in ((self._trigrams, _trigrams(text)), (self._prefixes, _prefixes(text, self.PREFIX_LENGTH))):
+            for gram in grams:
+                keys = index[gram]
+                keys.discard(key)
+                if not keys:
+                    del index[gram]
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _prefixes(text, length):
+    """Начала слов длиной до length символов; словом считается и буквенно-цифровая часть, и весь токен до пробела."""
+    words = set(_WORD.findall(text)) | set(text.split())
+    return {word[:size] for word in words for size in range(1, min(length, len(word)) + 1)}
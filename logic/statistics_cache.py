@@ -0,0 +1,89 @@
+import threading
+import time
+from datetime import date, timedelta
+
+
+def period_bucket(period, today):
+    """Возвращает календарный период, к которому относится запрос за текущий день, месяц или год."""
+    if period == "day":
+        return "day", today
+    if period == "month":
+        return "month", (today.year, today.month)
+    return "year", today.year
+
+
+def days_between(date_from, date_to):
+    """Перечисляет дни диапазона включительно."""
+    return [date_from + timedelta(days=n) for n in range((date_to - date_from).days + 1)]
+
+
+def day_rows(data, day):
+    """Строки дневной статистики из ответа {"date", "items"}; None, если сервер не подтвердил запрошенный день."""
+    if not isinstance(data, dict) or data.get("date") != day.isoformat():
+        return None
+    return data.get("items") or []
+
+
+def merge_statistics(buckets, key, model=None):
+    """Складывает строки статистики нескольких периодов по ключу; числовые поля суммируются.
+
+    Если задан model (класс из logic.records), результат возвращается записями этого класса.
+    """
+    merged = {}
+    for rows in buckets:
+        for row in rows:
+            total = merged.get(row[key])
+            if total is None:
+                merged[row[key]] = dict(row)
+                continue
+            for field in row:
+                value = row[field]
+                if field != key and isinstance(value, (int, float)):
+                    total[field] = (total[field] or 0) + value
+    if model is not None:
+        return [model.from_dict(total) for total in merged.values()]
+    return list(merged.values())
+
+
+class StatisticsCache:
+    """Кэш статистики по (адрес, период).
+
+    Закрытые периоды (прошедший день, месяц или год) больше не меняются и не перезапрашиваются.
+    Текущий период хранится open_ttl секунд.
+    """
+
+    def __init__(self, open_ttl=60.0, clock=time.monotonic, today=date.today):
+        self.open_ttl = open_ttl
+        self.clock = clock
+        self.today = today
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def is_closed(self, bucket):
+        kind, value = bucket
+        today = self.today()
+        if kind == "day":
+            return value < today
+        if kind == "month":
+            return value < (today.year, today.month)
+        return value < today.year
+
+    def get(self, endpoint, bucket):
+        with self._lock:
+            entry = self._entries.get((endpoint, bucket))
+        if entry and (entry["closed"] or self.clock() - entry["fetched_at"] < self.open_ttl):
+            return entry["data"]
+        return None
+
+    def store(self, endpoint, bucket, data):
+        """Сохраняет данные; период считается закрытым, только если он закончился до запроса."""
+        with self._lock:
+            self._entries[(endpoint, bucket)] = {
+                "data": data,
+                "closed": self.is_closed(bucket),
+                "fetched_at": self.clock(),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,152 @@
+import threading
+
+import httpx
+
+from logic.json_codec import loads
+from logic.records import parse_records
+
+
+class Subscription:
+    """Следит за изменениями ресурса: через SSE, если сервер его поддерживает, иначе адаптивным опросом.
+
+    gate — необязательная проверка перед каждым плановым опросом (например, лимит планировщика); если она
+    возвращает False, опрос пропускается до следующего интервала. fetch — необязательная замена обычного
+    GET при опросе: функция сама обновляет данные и возвращает ответ со статусом и флагом changed.
+    """
+
+    def __init__(self, network_layer, endpoint, on_change, on_error=None, headers_factory=None, params=None,
+                 stream_endpoint=None, min_interval=1.0, max_interval=30.0, model=None, gate=None, fetch=None):
+        self.network_layer = network_layer
+        self.endpoint = endpoint
+        self.on_change = on_change
+        self.on_error = on_error
+        self.headers_factory = headers_factory
+        self.params = params
+        self.stream_endpoint = stream_endpoint
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.model = model
+        self.gate = gate
+        self.fetch = fetch
+        self.interval = min_interval
+        self.mode = None
+        self._last_data = None
+        self._failed = False
+        self._response = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Останавливает подписку и прерывает открытый поток событий."""
+        self._stopped.set()
+        response = self._response
+        if response is not None:
+            response.close()
+
+    def _run(self):
+        if self.stream_endpoint and self.stream_endpoint not in self.network_layer.unsupported_streams:
+            self.mode = "stream"
+            while not self._stopped.is_set() and self._listen_stream():
+                self._stopped.wait(max(self.interval, self.network_layer.breaker.retry_after()))
+        self.mode = "polling"
+        while not self._stopped.is_set():
+            if self.gate is None or self.gate():
+                self._poll()
+            self._stopped.wait(self.interval)
+
+    def _headers(self):
+        return self.headers_factory() if self.headers_factory else None
+
+    def _listen_stream(self):
+        """Читает события SSE. Возвращает False, если сервер не поддерживает поток."""
+        if not self.network_layer.breaker.allow():
+            return True
+        try:
+            headers = dict(self._headers() or {}, Accept="text/event-stream")
+            with self.network_layer.client.stream("GET", self.stream_endpoint, headers=headers, params=self.params,
+                                                  timeout=httpx.Timeout(10.0, read=None)) as response:
+                if response.status_code in self.network_layer.RETRY_STATUSES:
+                    self.network_layer.breaker.record_failure()
+                    self.interval = min(self.interval * 2, self.max_interval)
+                    return True
+                self.network_layer.breaker.record_success()
+                if response.status_code != 200 or \
+                        not response.headers.get("content-type", "").startswith("text/event-stream"):
+                    self.network_layer.unsupported_streams.add(self.stream_endpoint)
+                    return False
+                self._response = response
+                self._report_recovery()
+                self._poll()
+                data_lines = []
+                for line in response.iter_lines():
+                    if line.startswith("data:"):
+                        data_lines.append(line[5:].strip())
+                    elif not line and data_lines:
+                        self._handle_event("\n".join(data_lines))
+                        data_lines = []
+        except Exception as e:
+            if not self._stopped.is_set():
+                self.network_layer.breaker.record_failure()
+                self._report_error(f"Ошибка подключения: {e}")
+                self.interval = min(self.interval * 2, self.max_interval)
+        finally:
+            self._response = None
+        return True
+
+    def _handle_event(self, raw_data):
+        """Событие с данными передается сразу, событие-уведомление вызывает повторный запрос."""
+        try:
+            data = loads(raw_data)
+            if isinstance(data, list) and self.model is not None:
+                data = parse_records(self.model, data)
+        except ValueError:
+            data = None
+        if isinstance(data, list):
+            self._deliver(data)
+        else:
+            self._poll()
+
+    def _poll(self):
+        try:
+            if self.fetch is not None:
+                response = self.fetch()
+            else:
+                response = self.network_layer.get(self.endpoint, headers=self._headers(), params=self.params,
+                                                  model=self.model, priority=self.network_layer.PRIORITY_BACKGROUND)
+        except Exception as e:
+            response = {"status": 0, "detail": str(e)}
+
+        if response["status"] != 200:
+            self._report_error(response["detail"])
+            self.interval = max(min(self.interval * 2, self.max_interval), self.network_layer.breaker.retry_after())
+            return
+        self._report_recovery()
+        if "changed" in response:
+            changed = response["changed"]
+        else:
+            changed = not response.get("not_modified") and self._deliver(response["data"])
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * 1.5, self.max_interval)
+
+    def _deliver(self, data):
+        if data is self._last_data or data == self._last_data:
+            return False
+        self._last_data = data
+        if not self._stopped.is_set():
+            self.on_change(data)
+        return True
+
+    def _report_error(self, detail):
+        """Сообщает об ошибке один раз до восстановления связи."""
+        if not self._failed and self.on_error and not self._stopped.is_set():
+            self.on_error(detail)
+        self._failed = True
+
+    def _report_recovery(self):
+        self._failed = False
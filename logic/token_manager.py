@@ -0,0 +1,98 @@
+import base64
+import json
+import threading
+import time
+
+
+DEFAULT_TOKEN_LIFETIME = 30 * 60
+
+
+def decode_token_expiry(token):
+    """Возвращает значение exp из JWT-токена или None, если его нет."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def get_token_lifetime(data, now):
+    """Определяет срок жизни токена в секундах по ответу сервера."""
+    if data.get("expires_in"):
+        return float(data["expires_in"])
+    expiry = decode_token_expiry(data.get("access_token"))
+    if expiry is not None:
+        return max(expiry - now, 0)
+    return DEFAULT_TOKEN_LIFETIME
+
+
+class TokenManager:
+    """Отслеживает срок действия токена и обновляет его заранее в фоне."""
+
+    def __init__(self, refresh_callback, refresh_margin=60, background_lead=120, clock=time.time):
+        self.refresh_callback = refresh_callback
+        self.refresh_margin = refresh_margin
+        self.background_lead = background_lead
+        self.clock = clock
+        self.expires_at = None
+        self._lock = threading.Lock()
+        self._flight = None
+        self._timer = None
+
+    def update(self, data):
+        """Запоминает срок действия полученного токена и планирует обновление."""
+        now = self.clock()
+        lifetime = get_token_lifetime(data, now)
+        self.expires_at = now + lifetime
+        self._schedule_refresh(lifetime)
+
+    def is_expired(self):
+        """Проверяет, истек ли токен (с учетом запаса на обновление)."""
+        return self.expires_at is None or self.clock() > self.expires_at - self.refresh_margin
+
+    def ensure_valid(self):
+        """Обновляет токен, только если он истек."""
+        return self.refresh(force=False)
+
+    def refresh(self, force=True):
+        """Обновляет токен; одновременные вызовы ожидают один общий запрос."""
+        with self._lock:
+            if not force and not self.is_expired():
+                return {"success": True}
+            flight = self._flight
+            leader = flight is None
+            if leader:
+                flight = self._flight = {"done": threading.Event(), "result": None}
+
+        if not leader:
+            flight["done"].wait()
+            return flight["result"]
+
+        try:
+            flight["result"] = self.refresh_callback()
+        except Exception as e:
+            flight["result"] = {"success": False, "error": str(e)}
+        finally:
+            with self._lock:
+                self._flight = None
+            flight["done"].set()
+        return flight["result"]
+
+    def stop(self):
+        """Отменяет запланированное фоновое обновление."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        self.expires_at = None
+
+    def _schedule_refresh(self, lifetime):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if lifetime <= 0:
+            return
+        delay = max(lifetime - self.refresh_margin - self.background_lead, lifetime / 2)
+        self._timer = threading.Timer(delay, self.refresh)
+        self._timer.daemon = True
+        self._timer.start()
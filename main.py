@@ -1,5 +1,9 @@
-from controllers.main_controller import MainController
-
-if __name__ == "__main__":
-    controller = MainController()
+import time
+
+STARTED_AT = time.perf_counter()
+
+from controllers.main_controller import MainController
+
+if __name__ == "__main__":
+    controller = MainController(started_at=STARTED_AT)
     controller.run()
\ No newline at end of file
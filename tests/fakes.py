@@ -0,0 +1,45 @@
+from logic.metrics import Metrics
+
+
+class FakeNetworkLayer:
+    """Подменяет NetworkLayer: на GET и PUT отвечает функция respond(method, endpoint, params, json, headers)."""
+
+    max_connections = 4
+    offline = False
+    PRIORITY_USER, PRIORITY_NORMAL, PRIORITY_BACKGROUND = 0, 1, 2
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.metrics = Metrics()
+        self.unsupported_deltas = set()
+        self.unsupported_batches = set()
+        self.requests = []
+        self.logins = 0
+        self.token = None
+        self.online = True
+
+    def set_token(self, token):
+        self.token = token
+
+    def get_headers(self):
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def get(self, endpoint, headers=None, params=None, use_cache=True, model=None, priority=None):
+        return self._send("GET", endpoint, params, None, headers)
+
+    def put(self, endpoint, headers=None, params=None, json=None):
+        return self._send("PUT", endpoint, params, json, headers)
+
+    def request(self, method, endpoint, headers=None, params=None, json=None, default_detail=None, priority=None):
+        return self._send(method, endpoint, params, json, headers)
+
+    def post(self, endpoint, headers=None, json=None):
+        if not self.online:
+            return {"status": 0, "detail": "Ошибка подключения: [Errno 111] Connection refused"}
+        self.logins += 1
+        self.token = f"token-{self.logins}"
+        return {"status": 200, "data": {"access_token": self.token, "role": "admin", "expires_in": 1800}}
+
+    def _send(self, method, endpoint, params, json, headers):
+        self.requests.append((method, endpoint, params, json, headers))
+        return self.respond(method, endpoint, params, json, headers)
@@ -0,0 +1,98 @@
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+
+class StubRequest:
+    """Запрос, полученный StubServer: метод, путь без query, параметры, заголовки и тело."""
+
+    def __init__(self, method, path, params, headers, body):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class StubServer:
+    """Локальный HTTP/1.1-сервер для тестов и замеров вместо настоящего backend.
+
+    Маршруты задаются парами (метод, путь) -> обработчик. Обработчик получает StubRequest и возвращает
+    (статус, тело, заголовки): bytes и str отправляются как есть, остальное — как JSON. Без маршрута сервер
+    отвечает 404. Все полученные запросы сохраняются в requests.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        handler = type("Handler", (_Handler,), {"stub": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def route(self, method, path, handler):
+        self.routes[(method, path)] = handler
+
+    def reply(self, method, path, status=200, body=None, headers=None):
+        """Маршрут с постоянным ответом."""
+        self.route(method, path, lambda request: (status, body, headers))
+
+    def count(self, method, path):
+        return sum(1 for request in self.requests if request.method == method and request.path == path)
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    stub = None
+
+    def setup(self):
+        super().setup()
+        # Заголовки и тело пишутся отдельно: без TCP_NODELAY ответ на keep-alive соединении ждет ~40 мс (Nagle).
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        url = urlsplit(self.path)
+        request = StubRequest(self.command, url.path, dict(parse_qsl(url.query)), self.headers,
+                              self.rfile.read(length) if length else b"")
+        self.stub.requests.append(request)
+        handler = self.stub.routes.get((request.method, request.path))
+        status, body, headers = handler(request) if handler else (404, {"detail": "Not Found"}, None)
+        headers = dict(headers or {})
+        if status == 304 or body is None:
+            body = b""
+        elif isinstance(body, str):
+            body = body.encode()
+        elif not isinstance(body, bytes):
+            body = json.dumps(body, ensure_ascii=False).encode()
+            headers.setdefault("Content-Type", "application/json")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
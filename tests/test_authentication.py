@@ -0,0 +1,48 @@
+import unittest
+from unittest import mock
+
+from logic.business_logic import BusinessLogic
+from logic.local_cache import LocalCache
+
+from fakes import FakeNetworkLayer
+
+
+class OfflineLoginTest(unittest.TestCase):
+    def setUp(self):
+        self.network_layer = FakeNetworkLayer(lambda *args: {"status": 200, "data": []})
+        self.logic = BusinessLogic(self.network_layer, LocalCache(":memory:"))
+        self.addCleanup(self.logic.close)
+        self.assertTrue(self.logic.authenticate_user("admin", "secret")["success"])
+        self.network_layer.online = False
+
+    def test_remembered_login_works_offline(self):
+        self.assertEqual(self.logic.authenticate_user("admin", "secret"), {"success": True, "offline": True})
+
+    def test_wrong_password_offline_is_reported_as_invalid_credentials(self):
+        result = self.logic.authenticate_user("admin", "wrong")
+        self.assertEqual(result, {"success": False, "error": BusinessLogic.INVALID_OFFLINE_LOGIN_MESSAGE})
+
+    def test_unknown_login_offline_reports_connection_error(self):
+        result = self.logic.authenticate_user("guest", "secret")
+        self.assertFalse(result["success"])
+        self.assertIn("Ошибка подключения", result["error"])
+
+    def test_token_refresh_offline_fails_without_checking_local_login(self):
+        with mock.patch.object(self.logic.local_cache, "check_login") as check_login:
+            result = self.logic.token_manager.refresh()
+        self.assertFalse(result["success"])
+        check_login.assert_not_called()
+        self.logic.token_manager.expires_at = 0
+        with self.assertRaises(Exception):
+            self.logic.refresh_token()
+
+
+class WarmStartTest(unittest.TestCase):
+    def test_restored_collections_come_from_local_cache(self):
+        local_cache = LocalCache(":memory:")
+        local_cache.save("menu", [{"id": 1, "name": "Суп", "price": 100.0}])
+        logic = BusinessLogic(FakeNetworkLayer(lambda *args: {"status": 200, "data": []}), local_cache)
+        self.addCleanup(logic.close)
+        logic.authenticate_user("admin", "secret")
+        self.assertEqual(logic.restored_collections, ["menu"])
+        self.assertEqual(logic.menu_store.records()[0]["name"], "Суп")
@@ -0,0 +1,98 @@
+import unittest
+
+from logic.business_logic import BusinessLogic
+from logic.local_cache import LocalCache
+from logic.records import MenuItem, Order
+
+from fakes import FakeNetworkLayer
+
+MENU = [MenuItem.from_dict({"id": key, "name": f"Блюдо {key}", "price": 100.0}) for key in (1, 2, 3)]
+
+
+class BatchUpdateTest(unittest.TestCase):
+    def make_logic(self, respond):
+        """respond отвечает на изменения; GET возвращает меню «сервера» из self.server_menu."""
+        self.server_menu = MENU
+
+        def serve(method, endpoint, params, json, headers):
+            if method == "GET":
+                return {"status": 200, "data": self.server_menu}
+            return respond(method, endpoint, params, json, headers)
+
+        self.network_layer = FakeNetworkLayer(serve)
+        logic = BusinessLogic(self.network_layer, LocalCache(":memory:"))
+        logic.authenticate_user("admin", "secret")
+        logic.menu_store.replace_all(MENU)
+        self.addCleanup(logic.close)
+        return logic
+
+    def prices(self, logic):
+        return {item["id"]: item["price"] for item in logic.menu_store.records()}
+
+    def gets(self):
+        return [endpoint for method, endpoint, _, _, _ in self.network_layer.requests if method == "GET"]
+
+    def test_failed_items_are_reverted(self):
+        logic = self.make_logic(lambda method, endpoint, params, json, headers: {"status": 200, "data": [
+            {"id": 1, "status": 200}, {"id": 2, "status": 409, "detail": "Конфликт"}]})
+        self.server_menu = [MENU[0].replace(price=150.0)] + MENU[1:]
+        results = logic.update_menu_prices([(1, 150.0), (2, 250.0)])
+        self.assertTrue(results[1]["success"])
+        self.assertEqual(results[2]["error"], "Конфликт")
+        self.assertEqual(self.prices(logic), {1: 150.0, 2: 100.0, 3: 100.0})
+
+    def test_unexpected_response_shape_reverts_all(self):
+        logic = self.make_logic(lambda method, endpoint, params, json, headers: {"status": 200, "data": {"ok": 1}})
+        results = logic.update_menu_prices([(1, 150.0), (2, 250.0)])
+        self.assertFalse(any(result["success"] for result in results.values()))
+        self.assertEqual(self.prices(logic), {1: 100.0, 2: 100.0, 3: 100.0})
+
+    def test_exception_while_sending_reverts_all(self):
+        def respond(method, endpoint, params, json, headers):
+            if endpoint.endswith("/batch"):
+                return {"status": 404, "detail": "Not Found"}
+            if endpoint == "/menu/2/price":
+                raise RuntimeError("connection reset")
+            return {"status": 200, "data": None}
+
+        logic = self.make_logic(respond)
+        notifications = []
+        logic.menu_store.subscribe(notifications.append)
+        notifications.clear()
+        with self.assertRaises(RuntimeError):
+            logic.update_menu_prices([(1, 150.0), (2, 250.0), (3, 350.0)])
+        self.assertEqual(self.prices(logic), {1: 100.0, 2: 100.0, 3: 100.0})
+        self.assertEqual([item["id"] for item in logic.menu_store.records()], [1, 2, 3])
+        self.assertEqual(len(notifications), 2)
+
+    def test_collection_is_reloaded_once_after_batch(self):
+        logic = self.make_logic(lambda method, endpoint, params, json, headers: {"status": 200, "data": [
+            {"id": 1, "status": 200}, {"id": 2, "status": 200}]})
+        self.server_menu = [MENU[0].replace(price=149.5), MENU[1].replace(price=250.0), MENU[2]]
+        notifications = []
+        logic.menu_store.subscribe(notifications.append)
+        notifications.clear()
+        logic.update_menu_prices([(1, 150.0), (2, 250.0)])
+        self.assertEqual(self.gets(), ["/menu"])
+        self.assertEqual(self.network_layer.requests[-1][0], "GET")
+        self.assertEqual(self.prices(logic), {1: 149.5, 2: 250.0, 3: 100.0})
+        self.assertEqual(len(notifications), 2)
+
+    def test_reload_failure_keeps_batch_results(self):
+        logic = self.make_logic(lambda method, endpoint, params, json, headers: {"status": 200, "data": [
+            {"id": 1, "status": 200}]})
+        self.network_layer.respond = lambda method, endpoint, params, json, headers: (
+            {"status": 500, "detail": "Ошибка"} if method == "GET" else
+            {"status": 200, "data": [{"id": 1, "status": 200}]})
+        results = logic.update_menu_prices([(1, 150.0)])
+        self.assertTrue(results[1]["success"])
+        self.assertEqual(self.prices(logic), {1: 150.0, 2: 100.0, 3: 100.0})
+
+    def test_order_batch_syncs_pending_orders_once(self):
+        logic = self.make_logic(lambda method, endpoint, params, json, headers: {"status": 200, "data": [
+            {"id": 7, "status": 200}]})
+        logic.order_store.replace_all([Order.from_dict({"id": 7, "items": [], "status": "paid"})])
+        self.server_menu = {"version": 3, "upserts": [], "deleted": []}
+        logic.update_orders_status([(7, "preparing")])
+        self.assertEqual(self.gets(), ["/orders/pending"])
+        self.assertEqual(logic.order_store.get(7)["status"], "preparing")
@@ -0,0 +1,72 @@
+import unittest
+
+from logic.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=5.0, max_reset_timeout=12.0,
+                                      clock=self.clock)
+        self.states = []
+        self.breaker.subscribe(self.states.append)
+
+    def open_circuit(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+
+    def test_opens_after_threshold_of_consecutive_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.retry_after(), 5.0)
+
+    def test_success_resets_failure_count(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(self.states, [])
+
+    def test_half_open_lets_one_trial_through(self):
+        self.open_circuit()
+        self.clock.now += 5
+        self.assertTrue(self.breaker.allow())
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow())
+        self.assertEqual(self.states, ["open", "half_open", "closed"])
+
+    def test_failed_trial_reopens_with_doubled_timeout_up_to_limit(self):
+        self.open_circuit()
+        for expected in (10.0, 12.0, 12.0):
+            self.clock.now += 100
+            self.assertTrue(self.breaker.allow())
+            self.breaker.record_failure()
+            self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+            self.assertEqual(self.breaker.retry_after(), expected)
+
+    def test_timeout_returns_to_base_after_recovery(self):
+        self.open_circuit()
+        self.clock.now += 5
+        self.breaker.allow()
+        self.breaker.record_failure()
+        self.clock.now += 10
+        self.breaker.allow()
+        self.breaker.record_success()
+        self.open_circuit()
+        self.assertEqual(self.breaker.retry_after(), 5.0)
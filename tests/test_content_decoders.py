@@ -0,0 +1,88 @@
+import unittest
+
+from logic import content_decoders
+from logic.content_decoders import ContentDecoders
+from logic.network_layer import NetworkLayer
+
+from stub_server import StubServer
+
+
+def parse_pairs(content):
+    """Простой текстовый формат для проверки подключаемых декодеров: строки key=value."""
+    return dict(line.split("=", 1) for line in content.decode().splitlines())
+
+
+class ContentDecodersTest(unittest.TestCase):
+    def setUp(self):
+        self.decoders = ContentDecoders()
+
+    @unittest.skipIf(content_decoders.msgpack is not None, "msgpack установлен")
+    def test_accept_is_json_only_by_default(self):
+        self.assertEqual(self.decoders.accept_header(), "application/json")
+
+    @unittest.skipIf(content_decoders.msgpack is None, "msgpack не установлен")
+    def test_msgpack_is_preferred_when_installed(self):
+        self.assertEqual(self.decoders.accept_header(), "application/msgpack, application/json;q=0.9")
+        packed = content_decoders.msgpack.packb([{"id": 1}])
+        self.assertEqual(self.decoders.decode(packed, "application/x-msgpack"), [{"id": 1}])
+
+    def test_registered_type_is_advertised_before_json(self):
+        self.decoders.register("application/x-pairs", parse_pairs)
+        accept = [part.strip() for part in self.decoders.accept_header().split(",")]
+        self.assertIn("application/x-pairs", accept)
+        self.assertEqual(accept[-1], "application/json;q=0.9")
+
+    def test_not_advertised_type_is_still_decoded(self):
+        self.decoders.register("application/x-pairs", parse_pairs, advertise=False)
+        self.assertNotIn("application/x-pairs", self.decoders.accept_header())
+        self.assertEqual(self.decoders.decode(b"id=1", "application/x-pairs"), {"id": "1"})
+
+    def test_content_type_parameters_and_case_are_ignored(self):
+        self.decoders.register("application/x-pairs", parse_pairs)
+        self.assertEqual(self.decoders.decode(b"id=1", "Application/X-Pairs; charset=utf-8"), {"id": "1"})
+        self.assertEqual(self.decoders.decode('{"name": "Чай"}'.encode(), "application/json; charset=utf-8"),
+                         {"name": "Чай"})
+
+    def test_unknown_or_missing_type_falls_back_to_json(self):
+        self.assertEqual(self.decoders.decode(b'[{"id": 1}]', "text/plain"), [{"id": 1}])
+        self.assertEqual(self.decoders.decode(b'[{"id": 1}]', None), [{"id": 1}])
+
+    def test_unknown_type_that_is_not_json_raises(self):
+        with self.assertRaises(ValueError):
+            self.decoders.decode(b"<html></html>", "text/html")
+
+
+class NegotiationTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer()
+        self.addCleanup(self.server.close)
+        self.network_layer = NetworkLayer(base_url=self.server.url)
+        self.addCleanup(self.network_layer.close)
+
+    def test_registered_decoder_is_negotiated(self):
+        self.network_layer.register_decoder("application/x-pairs", parse_pairs)
+        self.server.reply("GET", "/statistics", body=b"orders=12\nrevenue=3400",
+                          headers={"Content-Type": "application/x-pairs"})
+        response = self.network_layer.get("/statistics")
+        self.assertEqual(response, {"status": 200, "data": {"orders": "12", "revenue": "3400"}})
+        self.assertIn("application/x-pairs", self.server.requests[-1].headers["Accept"])
+
+    def test_json_is_accepted_by_default(self):
+        self.server.reply("GET", "/statistics", body={"orders": 12})
+        self.assertEqual(self.network_layer.get("/statistics")["data"], {"orders": 12})
+        self.assertIn("application/json", self.server.requests[-1].headers["Accept"])
+
+    def test_unknown_content_type_is_decoded_as_json(self):
+        self.server.reply("GET", "/statistics", body=b'{"orders": 12}', headers={"Content-Type": "text/plain"})
+        self.assertEqual(self.network_layer.get("/statistics")["data"], {"orders": 12})
+
+    def test_error_detail_from_unknown_content_type(self):
+        self.server.reply("GET", "/statistics", status=400, body=b"Bad Request",
+                          headers={"Content-Type": "text/html"})
+        response = self.network_layer.get("/statistics")
+        self.assertEqual(response["status"], 400)
+        self.assertIsInstance(response["detail"], str)
+
+
+if __name__ == "__main__":
+    unittest.main()
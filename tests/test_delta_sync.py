@@ -0,0 +1,104 @@
+import unittest
+
+from logic.business_logic import BusinessLogic
+from logic.entity_store import EntityStore
+from logic.local_cache import LocalCache
+from logic.network_layer import NetworkLayer
+from logic.records import Computer
+
+from stub_server import StubServer
+
+LOGIN = {"access_token": "token", "role": "admin", "expires_in": 1800}
+
+
+def computer(key, status="available"):
+    return {"id": key, "name": f"PC-{key}", "configuration": "Ryzen 5", "status": status, "rental_end_time": None}
+
+
+class ApplyChangesTest(unittest.TestCase):
+    def setUp(self):
+        self.store = EntityStore()
+        self.store.replace_all(Computer.from_list([computer(1), computer(2), computer(3)]))
+
+    def test_upserts_and_tombstones(self):
+        changed = self.store.apply_changes(Computer.from_list([computer(2, "busy"), computer(4)]), [3])
+        self.assertTrue(changed)
+        self.assertEqual([(record.id, record.status) for record in self.store.records()],
+                         [(1, "available"), (2, "busy"), (4, "available")])
+
+    def test_tombstone_for_unknown_record_is_ignored(self):
+        snapshots = []
+        self.store.subscribe(snapshots.append)
+        snapshots.clear()
+        self.assertFalse(self.store.apply_changes([], [99]))
+        self.assertEqual(snapshots, [])
+        self.assertEqual(len(self.store.records()), 3)
+
+    def test_first_delta_marks_store_loaded(self):
+        store = EntityStore()
+        self.assertTrue(store.apply_changes([], []))
+        self.assertTrue(store.loaded)
+
+
+class SyncCollectionTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer()
+        self.addCleanup(self.server.close)
+        self.server.reply("POST", "/auth/login", body=LOGIN)
+        self.responses = []
+        self.server.route("GET", "/computers", lambda request: (200, self.responses.pop(0), None))
+        self.logic = BusinessLogic(NetworkLayer(base_url=self.server.url), LocalCache(":memory:"))
+        self.addCleanup(self.logic.network_layer.close)
+        self.addCleanup(self.logic.close)
+        self.assertTrue(self.logic.authenticate_user("admin", "secret")["success"])
+
+    def since(self):
+        return [request.params.get("since") for request in self.server.requests if request.path == "/computers"]
+
+    def statuses(self):
+        return {record.id: record.status for record in self.logic.computer_store.records()}
+
+    def test_first_sync_then_delta_with_tombstones(self):
+        self.responses = [
+            {"version": 5, "upserts": [computer(1), computer(2), computer(3)], "deleted": [], "full": True},
+            {"version": 7, "upserts": [computer(2, "busy"), computer(4)], "deleted": [3], "full": False},
+            {"version": 7, "upserts": [], "deleted": [], "full": False},
+        ]
+        self.assertEqual(self.logic.sync_collection("computers"), {"status": 200, "changed": True})
+        self.assertEqual(self.logic.sync_collection("computers"), {"status": 200, "changed": True})
+        self.assertEqual(self.logic.sync_collection("computers"), {"status": 200, "changed": False})
+        self.assertEqual(self.since(), ["0", "5", "7"])
+        self.assertEqual(self.statuses(), {1: "available", 2: "busy", 4: "available"})
+
+    def test_full_resync_replaces_collection(self):
+        self.responses = [
+            {"version": 5, "upserts": [computer(1), computer(2)], "deleted": [], "full": True},
+            {"version": 40, "upserts": [computer(2, "busy"), computer(9)], "deleted": [], "full": True},
+        ]
+        self.logic.sync_collection("computers")
+        self.logic.sync_collection("computers")
+        self.assertEqual(self.statuses(), {2: "busy", 9: "available"})
+        self.assertEqual(self.since(), ["0", "5"])
+
+    def test_plain_list_falls_back_to_full_get(self):
+        self.responses = [[computer(1), computer(2)], [computer(1, "busy")]]
+        self.assertEqual(self.logic.sync_collection("computers"), {"status": 200, "changed": True})
+        self.assertIn("/computers", self.logic.network_layer.unsupported_deltas)
+        self.logic.sync_collection("computers")
+        self.assertEqual(self.since(), ["0", None])
+        self.assertEqual(self.statuses(), {1: "busy"})
+
+    def test_error_keeps_version(self):
+        self.responses = [{"version": 5, "upserts": [computer(1)], "deleted": [], "full": True}]
+        self.logic.sync_collection("computers")
+        self.server.reply("GET", "/computers", status=500, body={"detail": "Ошибка сервера"})
+        self.assertEqual(self.logic.sync_collection("computers")["status"], 500)
+        self.server.route("GET", "/computers", lambda request: (200, self.responses.pop(0), None))
+        self.responses = [{"version": 6, "upserts": [], "deleted": [1], "full": False}]
+        self.logic.sync_collection("computers")
+        self.assertEqual(self.since(), ["0", "5", "5"])
+        self.assertEqual(self.statuses(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import threading
+import unittest
+
+from logic.entity_store import EntityStore
+from logic.records import MenuItem
+
+MENU = [MenuItem.from_dict({"id": key, "name": f"Блюдо {key}", "price": 100.0}) for key in (1, 2, 3)]
+
+
+class EntityStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.store = EntityStore()
+        self.store.replace_all(MENU)
+        self.snapshots = []
+        self.store.subscribe(self.snapshots.append)
+        self.snapshots.clear()
+
+    def ids(self):
+        return [record["id"] for record in self.store.records()]
+
+    def test_patch_revert_restores_record(self):
+        undo = self.store.patch(2, price=150.0)
+        self.assertEqual(self.store.get(2)["price"], 150.0)
+        self.assertEqual(MENU[1]["price"], 100.0)
+        self.store.revert(undo)
+        self.assertIs(self.store.get(2), MENU[1])
+
+    def test_remove_revert_restores_position(self):
+        undo = self.store.remove(2)
+        self.assertEqual(self.ids(), [1, 3])
+        self.store.revert(undo)
+        self.assertEqual(self.ids(), [1, 2, 3])
+
+    def test_upsert_revert_removes_new_record(self):
+        undo = self.store.upsert(MenuItem.from_dict({"id": 4, "name": "Чай", "price": 50.0}))
+        self.store.revert(undo)
+        self.assertEqual(self.ids(), [1, 2, 3])
+
+    def test_batch_notifies_once(self):
+        with self.store.batch():
+            undo = [self.store.patch(key, price=1.0) for key in (1, 2, 3)]
+        with self.store.batch():
+            for entry in reversed(undo):
+                self.store.revert(entry)
+        self.assertEqual(len(self.snapshots), 2)
+        self.assertEqual([record["price"] for record in self.snapshots[-1]], [100.0] * 3)
+
+    def test_apply_changes_notifies_only_on_change(self):
+        self.assertFalse(self.store.apply_changes([MENU[0]], []))
+        self.assertTrue(self.store.apply_changes([], [3]))
+        self.assertEqual(len(self.snapshots), 1)
+
+    def test_concurrent_writers_never_deliver_older_snapshot(self):
+        def write(offset):
+            for key in range(offset, offset + 300):
+                self.store.upsert({"id": key, "name": "", "price": 0.0})
+
+        threads = [threading.Thread(target=write, args=(1000 * n,)) for n in range(1, 5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sizes = [len(snapshot) for snapshot in self.snapshots]
+        self.assertEqual(sizes, sorted(sizes))
+        self.assertEqual(sizes[-1], len(MENU) + 1200)
+
+    def test_listener_writing_to_store_does_not_see_stale_snapshot(self):
+        seen = []
+
+        def writer(records):
+            if len(records) == 4:
+                self.store.upsert({"id": 5, "name": "", "price": 0.0})
+
+        self.store.subscribe(writer)
+        self.store.subscribe(lambda records: seen.append(len(records)))
+        self.store.upsert({"id": 4, "name": "", "price": 0.0})
+        self.assertEqual(seen, [3, 5])
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from logic.exporter import export_rows
+
+COLUMNS = [("ID", lambda record: record["id"])]
+
+
+class ExportRowsTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_csv_export_writes_all_rows(self):
+        path = os.path.join(self.directory.name, "orders.csv")
+        count = export_rows(lambda: ({"id": i} for i in range(3)), COLUMNS, path)
+        self.assertEqual(count, 3)
+        self.assertFalse(os.path.exists(f"{path}.part"))
+
+    def test_cancel_before_file_created(self):
+        cancelled = threading.Event()
+        cancelled.set()
+        written = []
+
+        def writer_without_file(path, header, rows):
+            written.extend(rows)
+
+        path = os.path.join(self.directory.name, "orders.xlsx")
+        with mock.patch("logic.exporter._write_xlsx", writer_without_file):
+            result = export_rows(lambda: [{"id": 1}], COLUMNS, path, cancelled=cancelled)
+        self.assertIsNone(result)
+        self.assertEqual(written, [])
+        self.assertFalse(os.path.exists(path))
+
+    def test_cancel_removes_partial_csv(self):
+        cancelled = threading.Event()
+
+        def records():
+            yield {"id": 1}
+            cancelled.set()
+            yield {"id": 2}
+
+        path = os.path.join(self.directory.name, "orders.csv")
+        self.assertIsNone(export_rows(records, COLUMNS, path, cancelled=cancelled))
+        self.assertEqual(os.listdir(self.directory.name), [])
@@ -0,0 +1,103 @@
+import threading
+import unittest
+from unittest import mock
+
+from logic.business_logic import BusinessLogic
+from logic.local_cache import LocalCache
+from logic.records import MenuItem
+
+from fakes import FakeNetworkLayer
+
+MENU = [{"id": key, "name": f"Блюдо {key}", "price": 100.0} for key in range(1, 251)]
+
+
+class SaveLaterTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = LocalCache(":memory:")
+        self.addCleanup(self.cache.close)
+
+    def test_snapshots_are_coalesced_into_one_write(self):
+        with mock.patch.object(self.cache, "save", wraps=self.cache.save) as save:
+            for price in (100.0, 110.0, 120.0):
+                self.cache.save_later("menu", [{"id": 1, "name": "Чай", "price": price}])
+            self.cache.flush()
+        save.assert_called_once()
+        self.assertEqual(self.cache.load("menu"), [{"id": 1, "name": "Чай", "price": 120.0}])
+
+    def test_timer_writes_in_background(self):
+        self.cache.SAVE_DELAY = 0.01
+        written = threading.Event()
+        save = self.cache.save
+        with mock.patch.object(self.cache, "save", side_effect=lambda *args: (save(*args), written.set())):
+            self.cache.save_later("menu", [{"id": 1, "name": "Чай", "price": 100.0}])
+            self.assertTrue(written.wait(2))
+        self.assertEqual(self.cache.load("menu"), [{"id": 1, "name": "Чай", "price": 100.0}])
+
+    def test_load_sees_pending_snapshot(self):
+        self.cache.save_later("menu", [{"id": 1, "name": "Чай", "price": 100.0}])
+        self.assertEqual(self.cache.load("menu"), [{"id": 1, "name": "Чай", "price": 100.0}])
+
+    def test_close_flushes_pending_snapshot(self):
+        cache = LocalCache(":memory:")
+        cache.save_later("menu", [{"id": 1, "name": "Чай", "price": 100.0}])
+        with mock.patch.object(cache, "save", wraps=cache.save) as save:
+            cache.close()
+        save.assert_called_once_with("menu", [{"id": 1, "name": "Чай", "price": 100.0}])
+
+    def test_store_notification_does_not_write_to_database(self):
+        logic = BusinessLogic(FakeNetworkLayer(lambda *args: {"status": 200, "data": []}), self.cache)
+        with mock.patch.object(self.cache, "save") as save:
+            logic.menu_store.replace_all(MenuItem.from_list(MENU[:3]))
+            save.assert_not_called()
+
+
+class ReplayJournalTest(unittest.TestCase):
+    def respond(self, method, endpoint, params, json, headers):
+        if method == "PUT":
+            return {"status": 200, "data": {}}
+        params = params or {}
+        start = int(params.get("cursor", params.get("offset", 0)))
+        end = start + params.get("limit", 100)
+        return {"status": 200, "data": {
+            "items": MenuItem.from_list(MENU[start:end]),
+            "next_cursor": str(end) if end < len(MENU) else None,
+        }}
+
+    def test_collection_is_reloaded_through_paged_envelope(self):
+        network_layer = FakeNetworkLayer(self.respond)
+        logic = BusinessLogic(network_layer, LocalCache(":memory:"))
+        self.addCleanup(logic.close)
+        logic.authenticate_user("admin", "secret")
+        logic.local_cache.append_journal({
+            "collection": "menu", "key": 200, "method": "PUT", "endpoint": "/menu/200/price",
+            "params": {"new_price": 120.0}, "fields": {"price": 120.0}, "base": {"price": 100.0},
+        })
+
+        result = logic.replay_journal()
+
+        self.assertEqual(result, {"sent": 1, "pending": 0, "conflicts": [], "errors": []})
+        self.assertEqual(len(logic.menu_store.records()), 250)
+        self.assertEqual(logic.menu_store.get(200).price, 120.0)
+        self.assertIn(("PUT", "/menu/200/price", {"new_price": 120.0}),
+                      [request[:3] for request in network_layer.requests])
+
+    def test_offline_keeps_journal(self):
+        network_layer = FakeNetworkLayer(self.respond)
+        logic = BusinessLogic(network_layer, LocalCache(":memory:"))
+        self.addCleanup(logic.close)
+        logic.authenticate_user("admin", "secret")
+        logic.local_cache.append_journal({
+            "collection": "menu", "key": 1, "method": "PUT", "endpoint": "/menu/1/price",
+            "params": {"new_price": 120.0}, "fields": {"price": 120.0}, "base": {"price": 100.0},
+        })
+        network_layer.respond = lambda *args: {"status": 0, "detail": "Ошибка подключения"}
+        network_layer.offline = True
+
+        result = logic.replay_journal()
+
+        self.assertEqual(result["pending"], 1)
+        self.assertEqual(logic.local_cache.journal_size(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import threading
+import time
+import unittest
+
+import httpx
+
+from logic.circuit_breaker import CircuitBreaker, CircuitOpenError
+from logic.network_layer import NetworkLayer
+
+from stub_server import StubServer
+
+BUSY = (503, {"detail": "Service Unavailable"}, None)
+
+
+class RetryTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer()
+        self.addCleanup(self.server.close)
+        self.network_layer = NetworkLayer(base_url=self.server.url, retries=2, backoff=0.001, failure_threshold=3)
+        self.addCleanup(self.network_layer.close)
+
+    def flaky(self, failures, body):
+        """Маршрут, который failures раз отвечает 503, а затем body."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return BUSY if len(calls) <= failures else (200, body, None)
+        return handler
+
+    def test_get_is_retried_until_success(self):
+        self.server.route("GET", "/computers", self.flaky(2, [{"id": 1}]))
+        response = self.network_layer.send("GET", "/computers")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{"id": 1}])
+        self.assertEqual(self.server.count("GET", "/computers"), 3)
+        self.assertEqual(self.network_layer.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_post_and_delete_are_not_retried(self):
+        self.server.route("POST", "/computers", self.flaky(1, {"id": 1}))
+        self.server.route("DELETE", "/computers/1", self.flaky(1, None))
+        self.assertEqual(self.network_layer.post("/computers", json={})["status"], 503)
+        self.assertEqual(self.network_layer.delete("/computers/1")["status"], 503)
+        self.assertEqual(self.server.count("POST", "/computers"), 1)
+        self.assertEqual(self.server.count("DELETE", "/computers/1"), 1)
+
+    def test_breaker_opens_after_threshold_and_fails_fast(self):
+        self.server.route("GET", "/computers", lambda request: BUSY)
+        self.assertEqual(self.network_layer.send("GET", "/computers").status_code, 503)
+        self.assertEqual(self.server.count("GET", "/computers"), 3)
+        self.assertEqual(self.network_layer.breaker.state, CircuitBreaker.OPEN)
+
+        with self.assertRaises(CircuitOpenError):
+            self.network_layer.send("GET", "/computers")
+        response = self.network_layer.get("/computers")
+        self.assertEqual(response["status"], 0)
+        self.assertIn("Сервер недоступен", response["detail"])
+        self.assertEqual(self.server.count("GET", "/computers"), 3)
+        self.assertTrue(self.network_layer.offline)
+        self.assertGreater(self.network_layer.breaker.retry_after(), 0)
+
+
+class SingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer()
+        self.addCleanup(self.server.close)
+        self.network_layer = NetworkLayer(base_url=self.server.url)
+        self.addCleanup(self.network_layer.close)
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+        self.server.route("GET", "/orders/pending", self.slow)
+        self.results = []
+
+    def slow(self, request):
+        self.release.wait(5)
+        return 200, [{"id": 1}], None
+
+    def wait_for(self, condition):
+        deadline = time.monotonic() + 2
+        while not condition():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.005)
+
+    def coalesced(self):
+        return sum(entry["coalesced"] for entry in self.network_layer.metrics.snapshot()["requests"])
+
+    def fetch(self, **kwargs):
+        thread = threading.Thread(target=lambda: self.results.append(
+            self.network_layer.get("/orders/pending", **kwargs)))
+        thread.start()
+        return thread
+
+    def test_concurrent_gets_share_one_request(self):
+        threads = [self.fetch()]
+        self.wait_for(lambda: self.server.count("GET", "/orders/pending") == 1)
+        threads.append(self.fetch())
+        self.wait_for(lambda: self.coalesced() == 1)
+        self.release.set()
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(self.server.count("GET", "/orders/pending"), 1)
+        self.assertEqual([result["data"] for result in self.results], [[{"id": 1}], [{"id": 1}]])
+
+    def test_different_priorities_are_not_coalesced(self):
+        threads = [self.fetch(priority=NetworkLayer.PRIORITY_BACKGROUND)]
+        self.wait_for(lambda: self.server.count("GET", "/orders/pending") == 1)
+        threads.append(self.fetch(priority=NetworkLayer.PRIORITY_USER))
+        self.wait_for(lambda: self.server.count("GET", "/orders/pending") == 2)
+        self.release.set()
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(self.coalesced(), 0)
+        self.assertEqual(len(self.results), 2)
+
+    def test_default_priority_matches_normal(self):
+        threads = [self.fetch()]
+        self.wait_for(lambda: self.server.count("GET", "/orders/pending") == 1)
+        threads.append(self.fetch(priority=NetworkLayer.PRIORITY_NORMAL))
+        self.wait_for(lambda: self.coalesced() == 1)
+        self.release.set()
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(self.server.count("GET", "/orders/pending"), 1)
+
+
+class UnreachableServerTest(unittest.TestCase):
+    def test_connection_errors_are_retried_then_reported_offline(self):
+        network_layer = NetworkLayer(base_url="http://127.0.0.1:1", retries=1, backoff=0.001)
+        self.addCleanup(network_layer.close)
+        with self.assertRaises(httpx.ConnectError):
+            network_layer.send("GET", "/computers")
+        self.assertTrue(network_layer.offline)
+        statuses = network_layer.metrics.snapshot()["requests"][0]["statuses"]
+        self.assertEqual(statuses, {"0": 2})
+        self.assertIn("Ошибка подключения", network_layer.get("/computers")["detail"])
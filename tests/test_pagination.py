@@ -0,0 +1,61 @@
+import unittest
+
+from logic.business_logic import BusinessLogic
+from logic.local_cache import LocalCache
+from logic.records import MenuItem
+
+from fakes import FakeNetworkLayer
+
+MENU = [{"id": key, "name": f"Блюдо {key}", "price": 100.0} for key in range(1, 251)]
+
+
+def records(rows):
+    return MenuItem.from_list(rows)
+
+
+class IterPagesTest(unittest.TestCase):
+    def make_logic(self, respond):
+        self.network_layer = FakeNetworkLayer(respond)
+        logic = BusinessLogic(self.network_layer, LocalCache(":memory:"))
+        self.addCleanup(logic.close)
+        logic.authenticate_user("admin", "secret")
+        return logic
+
+    def pages(self, logic):
+        return [len(page) for page in logic.iter_menu()]
+
+    def gets(self):
+        return [params for method, endpoint, params, _, _ in self.network_layer.requests if method == "GET"]
+
+    def test_offset_pages_until_short_page(self):
+        logic = self.make_logic(lambda method, endpoint, params, json, headers: {
+            "status": 200, "data": records(MENU[params["offset"]:params["offset"] + params["limit"]])})
+        self.assertEqual(self.pages(logic), [100, 100, 50])
+        self.assertEqual(len(logic.menu_store.records()), 250)
+
+    def test_server_ignoring_offset_is_not_requested_forever(self):
+        logic = self.make_logic(lambda method, endpoint, params, json, headers: {
+            "status": 200, "data": records(MENU[:100])})
+        notifications = []
+        logic.menu_store.subscribe(notifications.append)
+        self.assertEqual(self.pages(logic), [100])
+        self.assertEqual(len(self.gets()), 2)
+        self.assertEqual(len(logic.menu_store.records()), 100)
+        self.assertEqual(len(notifications), 1)
+
+    def test_cursor_pages(self):
+        def respond(method, endpoint, params, json, headers):
+            start = int(params.get("cursor", 0))
+            end = start + params["limit"]
+            return {"status": 200, "data": {"items": records(MENU[start:end]),
+                                            "next_cursor": str(end) if end < len(MENU) else None}}
+
+        logic = self.make_logic(respond)
+        self.assertEqual(self.pages(logic), [100, 100, 50])
+        self.assertEqual([params.get("cursor") for params in self.gets()], [None, "100", "200"])
+
+    def test_repeated_cursor_page_stops(self):
+        logic = self.make_logic(lambda method, endpoint, params, json, headers: {
+            "status": 200, "data": {"items": records(MENU[:100]), "next_cursor": "same"}})
+        self.assertEqual(self.pages(logic), [100])
+        self.assertEqual(len(self.gets()), 2)
@@ -0,0 +1,139 @@
+import unittest
+
+from PyQt6.QtWidgets import QApplication
+
+from logic.rate_limiter import RateLimiter
+from ui.poll_scheduler import PollScheduler
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_burst_then_refill(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=2.0, clock=clock)
+        self.assertEqual([limiter.try_acquire() for _ in range(3)], [True, True, False])
+        clock.now += 0.5
+        self.assertEqual([limiter.try_acquire() for _ in range(2)], [True, False])
+        self.assertEqual((limiter.granted, limiter.rejected), (3, 2))
+
+    def test_tokens_do_not_accumulate_over_burst(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=2.0, burst=3, clock=clock)
+        clock.now += 60
+        self.assertEqual(sum(limiter.try_acquire() for _ in range(10)), 3)
+
+    def test_rate_holds_over_time(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=4.0, clock=clock)
+        granted = 0
+        for _ in range(1000):
+            clock.now += 0.01
+            granted += limiter.try_acquire()
+        self.assertLessEqual(granted, 4 + 4 * 10)
+
+
+class PollSchedulerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.active = True
+        self.scheduler = PollScheduler(is_active=lambda: self.active, max_rps=2.0, jitter=0, clock=self.clock)
+        self.runs = []
+
+    def register(self, name, interval, **kwargs):
+        return self.scheduler.register(name, lambda: self.runs.append(name), interval, **kwargs)
+
+    def advance(self, seconds):
+        self.clock.now += seconds
+        self.scheduler.tick()
+
+    def test_jobs_run_on_their_interval(self):
+        self.register("orders", 5, network=False)
+        self.register("menu", 10, network=False)
+        for _ in range(20):
+            self.advance(1)
+        self.assertEqual(self.runs.count("orders"), 4)
+        self.assertEqual(self.runs.count("menu"), 2)
+
+    def test_invisible_job_is_skipped(self):
+        visible = [False]
+        self.register("orders", 5, visible=lambda: visible[0])
+        for _ in range(20):
+            self.advance(1)
+        self.assertEqual(self.runs, [])
+        visible[0] = True
+        for _ in range(5):
+            self.advance(1)
+        self.assertEqual(self.runs, ["orders"])
+
+    def test_paused_scheduler_runs_nothing(self):
+        self.register("orders", 1)
+        self.active = False
+        for _ in range(5):
+            self.advance(1)
+        self.assertEqual(self.runs, [])
+        self.assertTrue(self.scheduler.paused)
+
+    def test_rate_limit_caps_network_jobs(self):
+        for number in range(10):
+            self.register(f"job{number}", 1)
+        for _ in range(10):
+            self.advance(1)
+        # Два запроса в секунду плюс начальный запас лимита.
+        self.assertLessEqual(len(self.runs), 2 * 10 + 2)
+        self.assertGreaterEqual(len(self.runs), 2 * 10)
+
+    def test_local_jobs_do_not_use_rate_limit(self):
+        for number in range(10):
+            self.register(f"clock{number}", 1, network=False)
+        self.advance(1)
+        self.assertEqual(len(self.runs), 10)
+        self.assertEqual(self.scheduler.limiter.granted, 0)
+
+    def test_higher_priority_runs_first_when_limited(self):
+        self.register("low", 1, priority=0)
+        self.register("high", 1, priority=5)
+        self.register("middle", 1, priority=2)
+        self.advance(1)
+        self.assertEqual(self.runs, ["high", "middle"])
+
+    def test_background_is_deferred_when_paused_or_limited(self):
+        self.assertTrue(self.scheduler.allow_background())
+        self.assertTrue(self.scheduler.allow_background())
+        self.assertFalse(self.scheduler.allow_background())
+
+        self.clock.now += 1
+        self.active = False
+        self.scheduler.tick()
+        self.assertFalse(self.scheduler.allow_background())
+
+        self.active = True
+        self.scheduler.tick()
+        self.assertTrue(self.scheduler.allow_background())
+
+    def test_background_shares_limit_with_jobs(self):
+        self.register("orders", 1)
+        self.register("menu", 1)
+        self.advance(1)
+        self.assertEqual(self.runs, ["orders", "menu"])
+        self.assertFalse(self.scheduler.allow_background())
+
+    def test_removed_job_does_not_run(self):
+        remove = self.register("orders", 1, network=False)
+        remove()
+        self.advance(2)
+        self.assertEqual(self.runs, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
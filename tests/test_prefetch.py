@@ -0,0 +1,80 @@
+import threading
+import time
+import unittest
+
+from logic.business_logic import BusinessLogic
+from logic.local_cache import LocalCache
+from logic.records import Computer, MenuItem, Order, Staff
+
+from fakes import FakeNetworkLayer
+
+DATA = {
+    "/users/staffs": Staff.from_list([{"id": 1, "login": "admin"}]),
+    "/computers": Computer.from_list([{"id": 1, "name": "PC-1", "status": "free"}]),
+    "/orders/pending": Order.from_list([{"id": 1, "items": [{"name": "Чай", "quantity": 1}], "status": "new"}]),
+    "/menu": {"items": MenuItem.from_list([{"id": 1, "name": "Чай", "price": 100.0}]), "next_cursor": None},
+}
+
+
+class PrefetchTest(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.addCleanup(self.release.set)
+        self.slow = set()
+        self.network_layer = FakeNetworkLayer(self.respond)
+        self.logic = BusinessLogic(self.network_layer, LocalCache(":memory:"))
+        self.addCleanup(self.logic.close)
+        self.logic.authenticate_user("admin", "secret")
+
+    def respond(self, method, endpoint, params, json, headers):
+        if endpoint in self.slow:
+            self.started.set()
+            self.release.wait(5)
+        if endpoint == "/users/staffs":
+            return {"status": 500, "detail": "Ошибка сервера"}
+        return {"status": 200, "data": DATA[endpoint]}
+
+    def test_all_collections_are_loaded(self):
+        results = self.logic.prefetch(budget=2)
+        self.assertEqual(results, {"staff": "Ошибка сервера", "computers": "ok", "orders": "ok", "menu": "ok"})
+        self.assertEqual([record.id for record in self.logic.computer_store.records()], [1])
+        self.assertEqual([record.id for record in self.logic.order_store.records()], [1])
+        self.assertEqual([record.name for record in self.logic.menu_store.records()], ["Чай"])
+        self.assertFalse(self.logic.staff_store.loaded)
+        menu_params = [params for _, endpoint, params, _, _ in self.network_layer.requests if endpoint == "/menu"]
+        self.assertEqual(menu_params, [{"offset": 0, "limit": self.logic.PAGE_SIZE}])
+
+    def test_slow_collection_does_not_exceed_budget(self):
+        self.slow.add("/orders/pending")
+        started = time.monotonic()
+        results = self.logic.prefetch(budget=0.2)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(results["orders"], "timeout")
+        self.assertEqual(results["computers"], "ok")
+        self.assertTrue(self.logic.computer_store.loaded)
+        self.assertFalse(self.logic.order_store.loaded)
+
+        # Ответ, пришедший после бюджета, все равно попадает в хранилище.
+        self.release.set()
+        deadline = time.monotonic() + 2
+        while not self.logic.order_store.loaded and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(self.logic.order_store.loaded)
+
+    def test_cancel_prefetch(self):
+        self.slow.add("/orders/pending")
+        threading.Thread(target=lambda: self.started.wait(2) and self.logic.cancel_prefetch()).start()
+        started = time.monotonic()
+        results = self.logic.prefetch(budget=5)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(results["orders"], "cancelled")
+
+        # Ответ после отмены не попадает в хранилище.
+        self.release.set()
+        time.sleep(0.2)
+        self.assertFalse(self.logic.order_store.loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
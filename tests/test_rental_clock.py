@@ -0,0 +1,168 @@
+import tracemalloc
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+from logic import metrics, rental_clock
+from logic.business_logic import BusinessLogic
+from logic.local_cache import LocalCache
+from logic.records import Computer
+from logic.rental_clock import RentalDeadlines, parse_timestamp
+from ui.computer_window import ComputerManagementWidget
+
+from fakes import FakeNetworkLayer
+
+UTC = timezone.utc
+
+
+class ParseTimestampTest(unittest.TestCase):
+    def test_accepts_server_variants(self):
+        expected = datetime(2026, 5, 1, 12, 30, 15, 123456, tzinfo=UTC)
+        for value in ("2026-05-01T12:30:15.123456Z", "2026-05-01T12:30:15.123456+00:00",
+                      "2026-05-01T15:30:15.123456+0300", "2026-05-01T12:30:15.123456789Z",
+                      " 2026-05-01T12:30:15.123456z "):
+            self.assertEqual(parse_timestamp(value), expected, value)
+
+    def test_short_fraction_and_no_fraction(self):
+        self.assertEqual(parse_timestamp("2026-05-01T12:30:15.5Z").microsecond, 500000)
+        self.assertEqual(parse_timestamp("2026-05-01T12:30:15Z"), datetime(2026, 5, 1, 12, 30, 15, tzinfo=UTC))
+
+    def test_naive_time_is_local(self):
+        moment = parse_timestamp("2026-05-01T12:30:15.000001")
+        self.assertIsNotNone(moment.tzinfo)
+        self.assertEqual(moment.replace(tzinfo=None), datetime(2026, 5, 1, 12, 30, 15, 1))
+
+    def test_invalid_values(self):
+        for value in (None, "", "  ", "завтра", "2026-13-01T00:00:00", 1714566615):
+            self.assertIsNone(parse_timestamp(value), value)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class RentalDeadlinesTest(unittest.TestCase):
+    WALL = datetime(2026, 5, 1, 12, 0, tzinfo=UTC)
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.deadlines = RentalDeadlines(clock=self.clock, wall_clock=self.wall_clock)
+
+    def wall_clock(self):
+        return self.WALL + timedelta(seconds=self.clock.now - 1000.0)
+
+    def end_time(self, seconds):
+        return (self.WALL + timedelta(seconds=seconds)).isoformat()
+
+    def test_remaining_counts_down_on_tick(self):
+        self.deadlines.update([(1, self.end_time(90)), (2, self.end_time(300))])
+        self.assertEqual(self.deadlines.remaining(1), 90)
+        self.clock.now += 30
+        self.assertEqual(sorted(self.deadlines.tick()), [1, 2])
+        self.assertEqual(self.deadlines.remaining(1), 60)
+        self.assertEqual(self.deadlines.remaining(2), 270)
+        self.assertIsNone(self.deadlines.remaining(3))
+
+    def test_invalid_end_time_is_skipped(self):
+        self.deadlines.update([(1, "не время"), (2, self.end_time(60))])
+        self.assertIsNone(self.deadlines.remaining(1))
+        self.assertEqual(self.deadlines.remaining(2), 60)
+
+    def test_only_changed_strings_are_parsed_again(self):
+        rentals = [(key, self.end_time(60 * key)) for key in range(1, 4)]
+        with mock.patch.object(rental_clock, "parse_timestamp", wraps=parse_timestamp) as parse:
+            self.deadlines.update(rentals)
+            self.assertEqual(parse.call_count, 3)
+            self.clock.now += 10
+            self.deadlines.tick()
+            self.deadlines.update(rentals)
+            self.assertEqual(parse.call_count, 3)
+            rentals[1] = (2, self.end_time(600))
+            self.deadlines.update(rentals)
+            self.assertEqual(parse.call_count, 4)
+        self.assertEqual(self.deadlines.remaining(1), 50)
+        self.assertEqual(self.deadlines.remaining(2), 590)
+
+    def test_removed_rental_is_forgotten(self):
+        self.deadlines.update([(1, self.end_time(60)), (2, self.end_time(60))])
+        self.deadlines.update([(2, self.end_time(60))])
+        self.assertIsNone(self.deadlines.remaining(1))
+        self.assertEqual(self.deadlines.tick(), [2])
+
+    def test_expired_rental_is_reported_once_then_dropped(self):
+        self.deadlines.update([(1, self.end_time(5)), (2, self.end_time(60))])
+        self.clock.now += 10
+        self.assertEqual(sorted(self.deadlines.tick()), [1, 2])
+        self.assertEqual(self.deadlines.remaining(1), -5)
+        self.clock.now += 1
+        self.assertEqual(self.deadlines.tick(), [2])
+        self.assertIsNone(self.deadlines.remaining(1))
+
+
+class CountdownRegressionTest(unittest.TestCase):
+    """Часы обновлений экрана компьютеров не добавляют таймеров и не увеличивают память."""
+
+    WALL = datetime(2026, 5, 1, tzinfo=UTC)
+    RENTED, FREE = 40, 20
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        logic = BusinessLogic(FakeNetworkLayer(lambda *args: {"status": 200, "data": []}), LocalCache(":memory:"))
+        self.addCleanup(logic.close)
+        self.widget = ComputerManagementWidget(logic)
+        self.addCleanup(self.widget.deleteLater)
+        self.now = 0
+        self.widget.rental_deadlines = RentalDeadlines(
+            clock=lambda: self.now, wall_clock=lambda: self.WALL + timedelta(seconds=self.now))
+
+    def computers(self):
+        """Список с сервера: у каждого арендованного компьютера по окончании аренды начинается новая."""
+        computers = []
+        for key in range(self.RENTED + self.FREE):
+            data = {"id": key, "name": f"PC-{key}", "configuration": "Ryzen 5", "status": "available"}
+            if key < self.RENTED:
+                length = 600 + key * 30
+                end = (self.now // length + 1) * length
+                data.update(status="rented", rental_end_time=(self.WALL + timedelta(seconds=end)).isoformat())
+            computers.append(Computer.from_dict(data))
+        return computers
+
+    def run_for(self, seconds, refresh_every=10):
+        for _ in range(seconds):
+            self.now += 1
+            if self.now % refresh_every == 0:
+                self.widget.set_computers(self.computers())
+                self.widget.search_box.pool.waitForDone()
+                self.app.processEvents()
+            self.widget.update_countdowns()
+
+    def traced_memory(self):
+        # Окна последних замеров Metrics ограничены по размеру, но заполняются дольше, чем длится тест.
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, metrics.__file__)])
+        return sum(trace.size for trace in snapshot.traces)
+
+    def test_hours_of_refreshes_keep_timers_and_memory_flat(self):
+        timers = len(self.widget.findChildren(QTimer))
+        self.run_for(30 * 60)
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        before = self.traced_memory()
+        self.run_for(2 * 60 * 60)
+        growth = self.traced_memory() - before
+
+        self.assertEqual(len(self.widget.findChildren(QTimer)), timers)
+        self.assertLess(growth, 64 * 1024)
+        deadlines = self.widget.rental_deadlines
+        self.assertLessEqual(len(deadlines._deadlines), self.RENTED)
+        self.assertLessEqual(len(deadlines._sources), self.RENTED)
+        self.assertTrue(all(deadlines.remaining(key) > 0 for key in range(self.RENTED)))
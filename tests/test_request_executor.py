@@ -0,0 +1,69 @@
+import time
+import unittest
+
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QThreadPool, QTimer
+
+from logic.metrics import Metrics
+from ui.request_executor import EventLoopMonitor, RequestExecutor
+
+
+class RequestExecutorTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.pool = QThreadPool()
+        self.executor = RequestExecutor(pool=self.pool)
+        self.results = []
+
+    def finish(self):
+        self.pool.waitForDone()
+        self.app.processEvents()
+
+    def test_resubmit_after_run_before_signal_delivery(self):
+        self.executor.submit(lambda: 1, self.results.append, key="staffs")
+        self.pool.waitForDone()
+        self.executor.submit(lambda: 2, self.results.append, key="staffs")
+        self.finish()
+        self.assertEqual(self.results, [2])
+        self.assertFalse(self.executor.is_pending("staffs"))
+
+    def test_error_without_handler_is_dropped(self):
+        loading = []
+        self.executor.loading_changed.connect(loading.append)
+        self.executor.submit(lambda: 1 / 0)
+        self.finish()
+        self.assertEqual(loading, [True, False])
+
+    def test_error_goes_to_handler(self):
+        errors = []
+        self.executor.submit(lambda: 1 / 0, self.results.append, errors.append)
+        self.finish()
+        self.assertEqual(self.results, [])
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+
+
+class EventLoopMonitorTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_blocked_loop_is_counted_as_stall(self):
+        metrics = Metrics()
+        monitor = EventLoopMonitor(interval=10, threshold=20.0, metrics=metrics)
+        lags = []
+        monitor.stalled.connect(lags.append)
+        loop = QEventLoop()
+        monitor.start()
+        QTimer.singleShot(50, lambda: time.sleep(0.1))
+        QTimer.singleShot(250, loop.quit)
+        loop.exec()
+        monitor.stop()
+
+        self.assertGreaterEqual(monitor.stall_count, 1)
+        self.assertGreaterEqual(monitor.max_lag, 80)
+        self.assertGreaterEqual(max(lags), 80)
+        stalls = next(entry for entry in metrics.snapshot()["timings"] if entry["kind"] == "event_loop_stall")
+        self.assertEqual(stalls["count"], monitor.stall_count)
+        self.assertAlmostEqual(stalls["max"] * 1000, monitor.max_lag)
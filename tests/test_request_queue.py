@@ -0,0 +1,76 @@
+import threading
+import time
+import unittest
+
+from logic.request_queue import RequestQueue
+
+HOST = "club.local"
+
+
+class RequestQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.queue = RequestQueue(max_concurrent=1)
+        self.order = []
+        self.threads = []
+
+    def wait_for(self, condition):
+        deadline = time.monotonic() + 2
+        while not condition():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.001)
+
+    def enqueue(self, label, priority):
+        """Запускает поток, ждущий слота, и дожидается, пока он встанет в очередь."""
+        def run():
+            with self.queue.slot(HOST, priority):
+                self.order.append(label)
+        waiting = self.queue.waiting(HOST)
+        thread = threading.Thread(target=run)
+        thread.start()
+        self.threads.append(thread)
+        self.wait_for(lambda: self.queue.waiting(HOST) == waiting + 1)
+
+    def finish(self):
+        for thread in self.threads:
+            thread.join(2)
+
+    def test_free_slot_is_taken_immediately(self):
+        queue = RequestQueue(max_concurrent=2)
+        queue.acquire(HOST, 2)
+        queue.acquire(HOST, 2)
+        self.assertEqual(queue.waiting(HOST), 0)
+
+    def test_waiters_get_slot_by_priority(self):
+        self.queue.acquire(HOST, 1)
+        self.enqueue("background", 2)
+        self.enqueue("normal", 1)
+        self.enqueue("user", 0)
+        self.queue.release(HOST)
+        self.finish()
+        self.assertEqual(self.order, ["user", "normal", "background"])
+        self.assertEqual(self.queue.waiting(HOST), 0)
+
+    def test_equal_priority_is_first_in_first_out(self):
+        self.queue.acquire(HOST, 1)
+        for label in ("a", "b", "c"):
+            self.enqueue(label, 1)
+        self.queue.release(HOST)
+        self.finish()
+        self.assertEqual(self.order, ["a", "b", "c"])
+
+    def test_hosts_are_limited_separately(self):
+        self.queue.acquire(HOST, 1)
+        self.queue.acquire("cdn.local", 1)
+        self.assertEqual(self.queue.waiting("cdn.local"), 0)
+
+    def test_new_request_does_not_overtake_waiters(self):
+        self.queue.acquire(HOST, 2)
+        self.enqueue("waiting", 2)
+        self.queue.release(HOST)
+        self.finish()
+        self.queue.acquire(HOST, 0)
+        self.assertEqual(self.order, ["waiting"])
+
+
+if __name__ == "__main__":
+    unittest.main()
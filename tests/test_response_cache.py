@@ -0,0 +1,66 @@
+import unittest
+
+import httpx
+
+from logic.network_layer import NetworkLayer
+from logic.records import MenuItem
+from logic.response_cache import ResponseCache
+
+from stub_server import StubServer
+
+MENU = [{"id": 1, "name": "Суп", "price": 100.0}]
+
+
+def response(size):
+    return httpx.Response(200, content=b"x" * size, headers={"ETag": '"v1"'})
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResponseCache(max_entries=2)
+        for name in ("a", "b"):
+            cache.store(name, response(10), name)
+        cache.get("a")
+        cache.store("c", response(10), "c")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual([cache.get(name)["data"] for name in ("a", "c")], ["a", "c"])
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_size_limit_evicts_oldest_bodies(self):
+        cache = ResponseCache(max_bytes=100)
+        for name in ("a", "b", "c"):
+            cache.store(name, response(40), name)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["size"], 80)
+        cache.store("b", response(90), "b")
+        self.assertEqual(cache.stats()["entries"], 1)
+        self.assertEqual(cache.stats()["size"], 90)
+
+    def test_model_is_part_of_key(self):
+        self.assertNotEqual(ResponseCache.make_key("/menu", {"offset": 0}),
+                            ResponseCache.make_key("/menu", {"offset": 0}, MenuItem))
+
+
+class ConditionalGetTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer()
+        self.addCleanup(self.server.close)
+        self.server.route("GET", "/menu", lambda request: (
+            (304, None, None) if request.headers.get("If-None-Match") == '"v1"' else (200, MENU, {"ETag": '"v1"'})))
+        self.network_layer = NetworkLayer(base_url=self.server.url)
+        self.addCleanup(self.network_layer.close)
+
+    def test_not_modified_returns_data_parsed_for_the_same_model(self):
+        raw = self.network_layer.get("/menu")
+        records = self.network_layer.get("/menu", model=MenuItem)
+        self.assertEqual(raw["data"], MENU)
+        self.assertIsInstance(records["data"][0], MenuItem)
+        self.assertNotIn("not_modified", records)
+
+        cached_raw = self.network_layer.get("/menu")
+        cached_records = self.network_layer.get("/menu", model=MenuItem)
+        self.assertTrue(cached_raw["not_modified"] and cached_records["not_modified"])
+        self.assertIsInstance(cached_raw["data"][0], dict)
+        self.assertIsInstance(cached_records["data"][0], MenuItem)
+        conditional = [request.headers.get("If-None-Match") for request in self.server.requests]
+        self.assertEqual(conditional, [None, None, '"v1"', '"v1"'])
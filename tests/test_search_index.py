@@ -0,0 +1,52 @@
+import unittest
+
+from logic.search_index import SearchIndex, normalize
+
+STAFF = [
+    {"id": 1, "login": "Пётр", "email": "petr@club.ru", "phone": "+79001112233"},
+    {"id": 2, "login": "Алёна", "email": "alena@club.ru", "phone": None},
+    {"id": 3, "login": "sergey", "email": "SERGEY@mail.com", "phone": "+79004445566"},
+]
+
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = SearchIndex(("login", "email", "phone"))
+        self.index.update(STAFF)
+
+    def test_normalize_ignores_case_and_yo(self):
+        self.assertEqual(normalize("ЁЛКА"), "елка")
+
+    def test_empty_query_means_no_filter(self):
+        self.assertIsNone(self.index.search("   "))
+
+    def test_substring_is_case_and_yo_insensitive(self):
+        self.assertEqual(self.index.search("ПЕТР"), {1})
+        self.assertEqual(self.index.search("алена"), {2})
+        self.assertEqual(self.index.search("mail.com"), {3})
+
+    def test_short_terms_match_word_prefixes(self):
+        self.assertEqual(self.index.search("se"), {3})
+        self.assertEqual(self.index.search("+7"), {1, 3})
+        self.assertEqual(self.index.search("rg"), set())
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.index.search("club петр"), {1})
+        self.assertEqual(self.index.search("club sergey"), set())
+
+    def test_trigram_candidates_are_verified(self):
+        index = SearchIndex(("name",))
+        index.update([{"id": 1, "name": "abcd bcde"}])
+        self.assertEqual(index.search("abcde"), set())
+
+    def test_update_reindexes_changed_and_drops_removed(self):
+        self.index.update([dict(STAFF[0], login="Павел"), STAFF[2]])
+        self.assertEqual(self.index.search("петр"), set())
+        self.assertEqual(self.index.search("павел"), {1})
+        self.assertEqual(self.index.search("club"), {1})
+        self.assertEqual(len(self.index), 2)
+
+    def test_removed_record_leaves_no_postings(self):
+        self.index.update([])
+        self.assertEqual(self.index._trigrams, {})
+        self.assertEqual(self.index._prefixes, {})
@@ -0,0 +1,60 @@
+import unittest
+from datetime import date, timedelta
+
+from logic.business_logic import BusinessLogic
+from logic.local_cache import LocalCache
+from logic.records import FoodStat
+
+from fakes import FakeNetworkLayer
+
+TODAY = date(2024, 5, 10)
+
+
+def food(name, count):
+    return {"name": name, "order_count": count, "total_revenue": float(count)}
+
+
+class StatisticsRangeTest(unittest.TestCase):
+    def make_logic(self, respond):
+        self.network_layer = FakeNetworkLayer(respond)
+        logic = BusinessLogic(self.network_layer, LocalCache(":memory:"))
+        logic.statistics_cache.today = lambda: TODAY
+        logic.authenticate_user("admin", "secret")
+        self.addCleanup(logic.close)
+        return logic
+
+    def test_days_confirmed_by_server_are_summed(self):
+        logic = self.make_logic(lambda method, endpoint, params, json, headers: {
+            "status": 200, "data": {"date": params["date"], "items": [food("Суп", 2)]}})
+        stats = logic.get_food_statistics_range(TODAY - timedelta(days=3), TODAY)
+        self.assertEqual(len(self.network_layer.requests), 4)
+        self.assertEqual([(stat["name"], stat["order_count"]) for stat in stats], [("Суп", 8)])
+        self.assertIsInstance(stats[0], FoodStat)
+
+    def test_server_ignoring_date_disables_range(self):
+        logic = self.make_logic(
+            lambda method, endpoint, params, json, headers: {"status": 200, "data": [food("Суп", 2)]})
+        with self.assertRaisesRegex(Exception, "не поддерживает"):
+            logic.get_food_statistics_range(TODAY - timedelta(days=3), TODAY)
+        sent = len(self.network_layer.requests)
+        with self.assertRaisesRegex(Exception, "не поддерживает"):
+            logic.get_food_statistics_range(TODAY - timedelta(days=1), TODAY)
+        self.assertEqual(len(self.network_layer.requests), sent)
+
+    def test_other_day_in_response_is_rejected(self):
+        logic = self.make_logic(lambda method, endpoint, params, json, headers: {
+            "status": 200, "data": {"date": TODAY.isoformat(), "items": [food("Суп", 2)]}})
+        with self.assertRaisesRegex(Exception, "не поддерживает"):
+            logic.get_food_statistics_range(TODAY - timedelta(days=3), TODAY)
+
+    def test_period_statistics_retry_after_401(self):
+        def respond(method, endpoint, params, json, headers):
+            if headers["Authorization"] == "Bearer revoked":
+                return {"status": 401, "detail": "Token expired"}
+            return {"status": 200, "data": [FoodStat.from_dict(food("Суп", 1))]}
+
+        logic = self.make_logic(respond)
+        self.network_layer.token = logic.token = "revoked"
+        stats = logic.get_food_statistics("day")
+        self.assertEqual(stats[0]["order_count"], 1)
+        self.assertEqual(len(self.network_layer.requests), 2)
@@ -0,0 +1,81 @@
+import json
+import threading
+import unittest
+
+from logic.network_layer import NetworkLayer
+from logic.subscription import Subscription
+
+from stub_server import StubServer
+
+COMPUTERS = [{"id": 1, "name": "PC-1", "status": "available"}]
+RENTED = [{"id": 1, "name": "PC-1", "status": "rented"}]
+
+
+class SubscriptionTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer()
+        self.addCleanup(self.server.close)
+        self.network_layer = NetworkLayer(base_url=self.server.url, backoff=0.01)
+        self.addCleanup(self.network_layer.close)
+        self.changes = []
+        self.errors = []
+        self.changed = threading.Event()
+
+    def on_change(self, data):
+        self.changes.append(data)
+        self.changed.set()
+
+    def subscribe(self, **kwargs):
+        subscription = self.network_layer.subscribe("/computers", self.on_change, self.errors.append, **kwargs)
+        self.addCleanup(subscription.stop)
+        return subscription
+
+    def wait_for(self, condition, timeout=5.0):
+        while not condition():
+            self.changed.clear()
+            if not self.changed.wait(timeout):
+                self.fail("подписка не получила данных")
+
+    def test_stream_events_are_delivered(self):
+        self.server.reply("GET", "/computers", body=COMPUTERS)
+        self.server.reply("GET", "/computers/stream", body=f"data: {json.dumps(RENTED)}\n\n",
+                          headers={"Content-Type": "text/event-stream"})
+        subscription = self.subscribe()
+        self.wait_for(lambda: RENTED in self.changes)
+
+        self.assertEqual(subscription.mode, "stream")
+        self.assertEqual(self.changes[:2], [COMPUTERS, RENTED])
+        stream = next(request for request in self.server.requests if request.path == "/computers/stream")
+        self.assertEqual(stream.headers["Accept"], "text/event-stream")
+        self.assertNotIn("/computers/stream", self.network_layer.unsupported_streams)
+
+    def test_missing_stream_falls_back_to_polling(self):
+        self.server.reply("GET", "/computers", body=COMPUTERS)
+        subscription = self.subscribe(min_interval=0.05)
+        self.wait_for(lambda: self.changes)
+
+        self.assertEqual(subscription.mode, "polling")
+        self.assertIn("/computers/stream", self.network_layer.unsupported_streams)
+        self.assertEqual(self.changes, [COMPUTERS])
+
+        self.server.reply("GET", "/computers", body=RENTED)
+        self.wait_for(lambda: len(self.changes) == 2)
+        self.assertEqual(self.changes[1], RENTED)
+        self.assertEqual(self.server.count("GET", "/computers/stream"), 1)
+        self.assertEqual(self.errors, [])
+
+    def test_errors_back_off_up_to_max_interval(self):
+        self.server.reply("GET", "/computers", status=500, body={"detail": "Internal Server Error"})
+        subscription = Subscription(self.network_layer, "/computers", self.on_change, self.errors.append,
+                                    min_interval=0.1, max_interval=0.4)
+        intervals = []
+        for _ in range(4):
+            subscription._poll()
+            intervals.append(subscription.interval)
+        self.assertEqual(intervals, [0.2, 0.4, 0.4, 0.4])
+        self.assertEqual(self.errors, ["Internal Server Error"])
+
+        self.server.reply("GET", "/computers", body=COMPUTERS)
+        subscription._poll()
+        self.assertEqual(subscription.interval, 0.1)
+        self.assertEqual(self.changes, [COMPUTERS])
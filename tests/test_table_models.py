@@ -0,0 +1,60 @@
+import unittest
+
+from PyQt6.QtCore import QCoreApplication
+
+from ui.table_models import Column, RecordTableModel
+
+RECORDS = [{"id": key, "name": f"Запись {key}"} for key in range(10)]
+
+
+class RecordTableModelTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def make_model(self, batch_size=None):
+        model = RecordTableModel([Column("ID", "id"), Column("Название", "name")], batch_size=batch_size)
+        model.set_records(RECORDS)
+        return model
+
+    def keys(self, model):
+        return [record["id"] for record in model.records()]
+
+    def test_set_records_updates_changed_rows_only(self):
+        model = self.make_model()
+        changed = []
+        model.dataChanged.connect(lambda first, last: changed.append((first.row(), last.row())))
+        model.set_records(RECORDS[:5] + [dict(RECORDS[5], name="Новое")] + RECORDS[6:])
+        self.assertEqual(changed, [(5, 5)])
+
+    def test_filter_keeps_source_order(self):
+        model = self.make_model()
+        model.set_filter({7, 2, 5})
+        self.assertEqual(self.keys(model), [2, 5, 7])
+        model.set_filter(None)
+        self.assertEqual(self.keys(model), list(range(10)))
+
+    def test_filter_is_paged_and_ignores_unknown_keys(self):
+        model = self.make_model(batch_size=2)
+        model.has_more_remote = True
+        requested = []
+        model.more_requested.connect(lambda: requested.append(True))
+        model.set_filter({1, 3, 5, 42})
+        self.assertEqual(self.keys(model), [1, 3])
+        self.assertTrue(model.canFetchMore())
+        model.fetchMore()
+        self.assertEqual(self.keys(model), [1, 3, 5])
+        self.assertFalse(model.canFetchMore())
+        self.assertEqual(requested, [])
+
+    def test_filter_matching_most_records(self):
+        model = self.make_model(batch_size=3)
+        model.set_filter(set(range(1, 10)))
+        self.assertEqual(self.keys(model), [1, 2, 3])
+        self.assertTrue(model.canFetchMore())
+
+    def test_new_records_respect_active_filter(self):
+        model = self.make_model()
+        model.set_filter({1, 11})
+        model.set_records(RECORDS + [{"id": 11, "name": "Запись 11"}, {"id": 12, "name": "Запись 12"}])
+        self.assertEqual(self.keys(model), [1, 11])
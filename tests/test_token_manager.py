@@ -0,0 +1,107 @@
+import base64
+import json
+import threading
+import time
+import unittest
+
+from logic.business_logic import BusinessLogic
+from logic.local_cache import LocalCache
+from logic.token_manager import DEFAULT_TOKEN_LIFETIME, TokenManager, decode_token_expiry, get_token_lifetime
+
+from fakes import FakeNetworkLayer
+
+
+def make_jwt(payload):
+    encoded = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+    return f"header.{encoded}.signature"
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TokenLifetimeTest(unittest.TestCase):
+    def test_expires_in_wins(self):
+        self.assertEqual(get_token_lifetime({"expires_in": 600, "access_token": make_jwt({"exp": 1})}, 0), 600)
+
+    def test_lifetime_from_jwt_exp(self):
+        self.assertEqual(decode_token_expiry(make_jwt({"exp": 1500})), 1500)
+        self.assertEqual(get_token_lifetime({"access_token": make_jwt({"exp": 1500})}, 1000), 500)
+
+    def test_default_lifetime_for_opaque_token(self):
+        self.assertIsNone(decode_token_expiry("opaque"))
+        self.assertEqual(get_token_lifetime({"access_token": "opaque"}, 0), DEFAULT_TOKEN_LIFETIME)
+
+
+class TokenManagerTest(unittest.TestCase):
+    def make_manager(self, callback):
+        self.clock = FakeClock()
+        manager = TokenManager(callback, refresh_margin=60, clock=self.clock)
+        self.addCleanup(manager.stop)
+        return manager
+
+    def test_ensure_valid_refreshes_only_when_expired(self):
+        calls = []
+        manager = self.make_manager(lambda: calls.append(1) or {"success": True})
+        manager.update({"expires_in": 600})
+        self.assertEqual(manager.ensure_valid(), {"success": True})
+        self.assertEqual(calls, [])
+        self.clock.now += 541
+        manager.ensure_valid()
+        self.assertEqual(calls, [1])
+
+    def test_concurrent_refreshes_share_one_request(self):
+        calls = []
+        release = threading.Event()
+
+        def refresh():
+            calls.append(1)
+            release.wait(5)
+            return {"success": True, "call": len(calls)}
+
+        manager = self.make_manager(refresh)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(manager.ensure_valid())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        while not calls:
+            time.sleep(0.001)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"success": True, "call": 1}] * 8)
+
+    def test_failed_refresh_is_reported_and_retried(self):
+        attempts = []
+
+        def refresh():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError("connection refused")
+            return {"success": True}
+
+        manager = self.make_manager(refresh)
+        self.assertEqual(manager.refresh(), {"success": False, "error": "connection refused"})
+        self.assertEqual(manager.refresh(), {"success": True})
+
+
+class SessionLoginCountTest(unittest.TestCase):
+    def test_thirty_minute_session_logs_in_twice(self):
+        network_layer = FakeNetworkLayer(lambda *args: {"status": 200, "data": []})
+        logic = BusinessLogic(network_layer, LocalCache(":memory:"))
+        self.addCleanup(logic.close)
+        clock = FakeClock()
+        logic.token_manager.clock = clock
+        logic.authenticate_user("admin", "secret")
+        for _ in range(30 * 60 // 5):
+            clock.now += 5
+            logic.refresh_menu()
+        # Токен живет 30 минут и обновляется за минуту до истечения: один вход и одно обновление.
+        self.assertEqual(network_layer.logins, 2)
+        self.assertGreater(len(network_layer.requests), 300)
@@ -0,0 +1,14 @@
+from PyQt6.QtWidgets import QMessageBox
+
+
+def show_batch_results(parent, results, success_message, error_message):
+    """Показывает итог пакетной операции: сколько записей обработано и ошибки по каждой неудачной."""
+    failed = {key: result["error"] for key, result in results.items() if not result["success"]}
+    if not failed:
+        QMessageBox.information(parent, "Успех", f"{success_message}: {len(results)}.")
+        return
+    details = "\n".join(f"#{key}: {error}" for key, error in failed.items())
+    QMessageBox.warning(
+        parent, "Ошибка",
+        f"{error_message}: {len(failed)} из {len(results)}.\n{details}"
+    )
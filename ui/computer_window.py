@@ -1,165 +1,175 @@
-from PyQt6.QtCore import QTimer
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QMessageBox, QDialog, \
-    QInputDialog
-from datetime import datetime, timedelta
-
-from ui.add_computer_dialog import AddComputerDialog
-
-
-def calculate_remaining_time(rental_end_time):
-    """Вычисляет оставшееся время аренды."""
-    end_time = datetime.strptime(rental_end_time, "%Y-%m-%dT%H:%M:%S.%f")
-    remaining_time = end_time - datetime.now()
-    return max(remaining_time, timedelta(seconds=0))
-
-
-def format_remaining_time(remaining_time):
-    """Форматирует оставшееся время аренды."""
-    minutes, seconds = divmod(remaining_time.total_seconds(), 60)
-    return f"{int(minutes)} мин {int(seconds)} сек"
-
-
-class ComputerManagementWidget(QWidget):
-    def __init__(self, business_logic):
-        super().__init__()
-        self.business_logic = business_logic
-        self.setLayout(QVBoxLayout())
-
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["ID", "Название", "Конфигурация", "Статус/Действие"])
-        self.layout().addWidget(self.table)
-
-        self.add_computer_button = QPushButton("Добавить компьютер")
-        self.add_computer_button.clicked.connect(self.add_computer)
-        self.layout().addWidget(self.add_computer_button)
-
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_rental_timers)
-        self.timer.start(1000)
-
-        self.computers = []
-
-    def showEvent(self, event):
-        """Загружается данные при открытии виджета."""
-        super().showEvent(event)
-        self.load_computers()
-
-    def hideEvent(self, event):
-        """Событие скрытия виджета."""
-        super().hideEvent(event)
-        self.timer.stop()
-
-    def load_computers(self):
-        """Загружает список компьютеров через BusinessLogic и обновляет таблицу."""
-        try:
-            self.computers = self.business_logic.get_computers()
-            self.populate_table()
-        except Exception as e:
-            print(f"Ошибка загрузки компьютеров: {e}")
-
-    def update_rental_timers(self):
-        """Обновляет таблицу с компьютерами каждые N секунд."""
-        self.load_computers()
-
-    def populate_table(self):
-        """Заполняет таблицу компьютеров."""
-        self.table.setRowCount(len(self.computers))
-        for row, computer in enumerate(self.computers):
-            self.table.setItem(row, 0, QTableWidgetItem(str(computer["id"])))
-            self.table.setItem(row, 1, QTableWidgetItem(computer["name"]))
-            self.table.setItem(row, 2, QTableWidgetItem(computer["configuration"]))
-
-            if computer["status"] == "rented" and computer["rental_end_time"]:
-                remaining_time = calculate_remaining_time(computer["rental_end_time"])
-                if remaining_time.total_seconds() > 0:
-                    countdown_label = QTableWidgetItem(format_remaining_time(remaining_time))
-                    self.table.setItem(row, 3, countdown_label)
-                    self.start_countdown(row, computer["rental_end_time"])
-                else:
-                    self.table.setItem(row, 3, QTableWidgetItem("Аренда завершена"))
-            else:
-                edit_button = QPushButton("Редактировать")
-                edit_button.clicked.connect(lambda _, c_id=computer["id"]: self.edit_computer(c_id))
-                delete_button = QPushButton("Удалить")
-                delete_button.clicked.connect(lambda _, c_id=computer["id"]: self.delete_computer(c_id))
-
-                button_layout = QVBoxLayout()
-                button_layout.addWidget(edit_button)
-                button_layout.addWidget(delete_button)
-
-                button_widget = QWidget()
-                button_widget.setLayout(button_layout)
-                self.table.setCellWidget(row, 3, button_widget)
-
-            self.table.setRowHeight(row, 80)
-
-        self.table.resizeColumnsToContents()
-
-    def start_countdown(self, row, rental_end_time):
-        """Запускает обратный отсчет для отображения времени аренды."""
-        timer = QTimer(self)
-        timer.timeout.connect(lambda: self.update_countdown(row, rental_end_time))
-        timer.start(1000)
-
-    def update_countdown(self, row, rental_end_time):
-        """Обновляет оставшееся время аренды."""
-        remaining_time = calculate_remaining_time(rental_end_time)
-        if remaining_time.total_seconds() > 0:
-            self.table.item(row, 3).setText(format_remaining_time(remaining_time))
-        else:
-            self.table.item(row, 3).setText("Аренда завершена")
-
-    def add_computer(self):
-        """Открывает диалог для добавления компьютера."""
-        dialog = AddComputerDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            data = dialog.get_data()
-            name = data["name"]
-            configuration = data["configuration"]
-
-            if not name or not configuration:
-                QMessageBox.warning(self, "Ошибка", "Название и конфигурация компьютера не могут быть пустыми.")
-                return
-
-            try:
-                self.business_logic.add_computer(name, configuration)
-                QMessageBox.information(self, "Успех", "Компьютер успешно добавлен.")
-                self.load_computers()
-            except Exception as e:
-                QMessageBox.critical(self, "Ошибка", f"Не удалось добавить компьютер: {e}")
-
-    def edit_computer(self, computer_id):
-        """Редактирует конфигурацию компьютера."""
-        current_computer = next((c for c in self.computers if c["id"] == computer_id), None)
-        if not current_computer:
-            QMessageBox.critical(self, "Ошибка", "Компьютер не найден.")
-            return
-
-        new_configuration, ok = QInputDialog.getText(
-            self, "Редактировать компьютер",
-            "Введите новую конфигурацию:",
-            text=current_computer["configuration"]
-        )
-        if ok and new_configuration.strip():
-            try:
-                self.business_logic.update_computer_configuration(computer_id, new_configuration.strip())
-                QMessageBox.information(self, "Успех", "Конфигурация компьютера успешно обновлена.")
-                self.load_computers()
-            except Exception as e:
-                QMessageBox.critical(self, "Ошибка", f"Не удалось обновить конфигурацию: {e}")
-
-    def delete_computer(self, computer_id):
-        """Удаляет компьютер."""
-        reply = QMessageBox.question(
-            self, "Удаление компьютера",
-            "Вы уверены, что хотите удалить этот компьютер?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                self.business_logic.delete_computer(computer_id)
-                QMessageBox.information(self, "Успех", "Компьютер успешно удален.")
-                self.load_computers()
-            except Exception as e:
-                QMessageBox.critical(self, "Ошибка", f"Не удалось удалить компьютер: {e}")
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QMessageBox, QDialog, QInputDialog, QLabel
+from functools import partial
+
+from logic.rental_clock import RentalDeadlines
+from ui.add_computer_dialog import AddComputerDialog
+from ui.request_executor import RequestExecutor
+from ui.search_box import SearchBox
+from ui.table_models import Column, RecordTableModel, RecordTableView
+
+
+def is_rented(computer):
+    """Проверяет, арендован ли компьютер."""
+    return computer["status"] == "rented" and bool(computer["rental_end_time"])
+
+
+def computer_actions(computer):
+    """Кнопки действий для свободного компьютера."""
+    if is_rented(computer):
+        return None
+    return [("edit", "Редактировать"), ("delete", "Удалить")]
+
+
+def format_remaining_time(remaining_seconds):
+    """Форматирует оставшееся время аренды."""
+    minutes, seconds = divmod(max(remaining_seconds, 0), 60)
+    return f"{int(minutes)} мин {int(seconds)} сек"
+
+
+class ComputerManagementWidget(QWidget):
+    computers_received = pyqtSignal(object)
+    load_failed = pyqtSignal(str)
+
+    def __init__(self, business_logic):
+        super().__init__()
+        self.business_logic = business_logic
+        self.setLayout(QVBoxLayout())
+        self.executor = RequestExecutor(self)
+
+        self.loading_label = QLabel("Загрузка...")
+        self.loading_label.hide()
+        self.executor.loading_changed.connect(self.loading_label.setVisible)
+        self.layout().addWidget(self.loading_label)
+
+        self.model = RecordTableModel([
+            Column("ID", "id"),
+            Column("Название", "name"),
+            Column("Конфигурация", "configuration"),
+            Column("Статус/Действие", "status", display=self.status_text, actions=computer_actions),
+        ], batch_size=self.business_logic.PAGE_SIZE, parent=self)
+        self.search_box = SearchBox(self.model, ("id", "name", "configuration"), self.business_logic.metrics,
+                                    "Поиск по названию или конфигурации", self)
+        self.layout().addWidget(self.search_box)
+        self.table = RecordTableView(self.model, action_column=3, row_height=80)
+        self.table.action_triggered.connect(self.on_action)
+        self.layout().addWidget(self.table)
+
+        self.add_computer_button = QPushButton("Добавить компьютер")
+        self.add_computer_button.clicked.connect(self.add_computer)
+        self.layout().addWidget(self.add_computer_button)
+
+        self.computers = []
+        self.rental_deadlines = RentalDeadlines()
+        self.computers_received.connect(self.set_computers)
+        self.business_logic.computer_store.subscribe(self.computers_received.emit)
+        self.load_failed.connect(
+            lambda detail: QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки компьютеров: {detail}"))
+        self.subscription = None
+        self.scheduler = None
+
+    def attach_scheduler(self, scheduler):
+        """Регистрирует обратный отсчет аренды в общем планировщике; фоновый опрос подчиняется его лимиту."""
+        self.scheduler = scheduler
+        scheduler.register("countdown", self.update_countdowns, 1, priority=1, visible=self.isVisible, network=False)
+
+    def showEvent(self, event):
+        """Загружается данные при открытии виджета."""
+        super().showEvent(event)
+        if self.subscription is None:
+            gate = self.scheduler.allow_background if self.scheduler else None
+            self.subscription = self.business_logic.subscribe_computers(self.load_failed.emit, gate=gate)
+
+    def hideEvent(self, event):
+        """Событие скрытия виджета."""
+        super().hideEvent(event)
+        if self.subscription is not None:
+            self.subscription.stop()
+            self.subscription = None
+
+    def set_computers(self, computers):
+        """Сохраняет полученный список компьютеров и обновляет изменившиеся строки таблицы."""
+        with self.business_logic.metrics.timed("populate_table", type(self).__name__):
+            self.computers = computers
+            self.rental_deadlines.update(
+                (computer["id"], computer["rental_end_time"]) for computer in computers if is_rented(computer)
+            )
+            self.search_box.index_records(computers)
+            self.model.set_records(computers)
+
+    def status_text(self, computer):
+        """Текст последней колонки для арендованного компьютера."""
+        remaining_seconds = self.rental_deadlines.remaining(computer["id"])
+        if remaining_seconds is not None and remaining_seconds > 0:
+            return format_remaining_time(remaining_seconds)
+        return "Аренда завершена" if is_rented(computer) else ""
+
+    def update_countdowns(self):
+        """Пересчитывает оставшееся время для всех арендованных компьютеров одним таймером."""
+        self.model.refresh_column(3, self.rental_deadlines.tick())
+
+    def on_action(self, action, computer):
+        """Обрабатывает нажатие кнопки в строке таблицы."""
+        if action == "edit":
+            self.edit_computer(computer["id"])
+        elif action == "delete":
+            self.delete_computer(computer["id"])
+
+    def add_computer(self):
+        """Открывает диалог для добавления компьютера."""
+        dialog = AddComputerDialog(self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            data = dialog.get_data()
+            name = data["name"]
+            configuration = data["configuration"]
+
+            if not name or not configuration:
+                QMessageBox.warning(self, "Ошибка", "Название и конфигурация компьютера не могут быть пустыми.")
+                return
+
+            self.executor.submit(
+                partial(self.business_logic.add_computer, name, configuration),
+                lambda _: self.on_computer_changed("Компьютер успешно добавлен."),
+                lambda e: QMessageBox.critical(self, "Ошибка", f"Не удалось добавить компьютер: {e}")
+            )
+
+    def edit_computer(self, computer_id):
+        """Редактирует конфигурацию компьютера."""
+        current_computer = next((c for c in self.computers if c["id"] == computer_id), None)
+        if not current_computer:
+            QMessageBox.critical(self, "Ошибка", "Компьютер не найден.")
+            return
+
+        new_configuration, ok = QInputDialog.getText(
+            self, "Редактировать компьютер",
+            "Введите новую конфигурацию:",
+            text=current_computer["configuration"]
+        )
+        if ok and new_configuration.strip():
+            self.executor.submit(
+                partial(self.business_logic.update_computer_configuration, computer_id, new_configuration.strip()),
+                lambda sent: self.on_computer_changed("Конфигурация компьютера успешно обновлена.", sent),
+                lambda e: QMessageBox.critical(self, "Ошибка", f"Не удалось обновить конфигурацию: {e}")
+            )
+
+    def delete_computer(self, computer_id):
+        """Удаляет компьютер."""
+        reply = QMessageBox.question(
+            self, "Удаление компьютера",
+            "Вы уверены, что хотите удалить этот компьютер?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.executor.submit(
+                partial(self.business_logic.delete_computer, computer_id),
+                lambda sent: self.on_computer_changed("Компьютер успешно удален.", sent),
+                lambda e: QMessageBox.critical(self, "Ошибка", f"Не удалось удалить компьютер: {e}")
+            )
+
+    def on_computer_changed(self, message, sent=True):
+        """Сообщает об успешном изменении; таблица уже обновлена из хранилища."""
+        if sent is False:
+            QMessageBox.warning(self, "Нет связи", self.business_logic.QUEUED_MESSAGE)
+        else:
+            QMessageBox.information(self, "Успех", message)
+
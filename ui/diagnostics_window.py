@@ -0,0 +1,118 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFileDialog, QMessageBox
+
+from ui.table_models import Column, RecordTableModel, RecordTableView
+
+
+def format_ms(seconds):
+    return "" if seconds is None else f"{seconds * 1000:.1f}"
+
+
+def format_bytes(size):
+    if size < 1024:
+        return f"{size} Б"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} КБ"
+    return f"{size / 1024 / 1024:.1f} МБ"
+
+
+class DiagnosticsWidget(QWidget):
+    """Скрытый экран диагностики: задержки запросов по endpoint, время заполнения таблиц, задержки цикла событий и
+    кэш ответов."""
+
+    REFRESH_INTERVAL = 2
+
+    def __init__(self, business_logic):
+        super().__init__()
+        self.business_logic = business_logic
+        self.metrics = business_logic.metrics
+        self.setLayout(QVBoxLayout())
+
+        self.requests_model = RecordTableModel([
+            Column("Метод", "method"),
+            Column("Endpoint", "endpoint"),
+            Column("Запросов", "count"),
+            Column("Коды ответа", display=lambda entry: ", ".join(
+                f"{status}: {count}" for status, count in entry["statuses"].items())),
+            Column("Получено", "received", display=lambda entry: format_bytes(entry["received"])),
+            Column("Объединено", "coalesced"),
+            Column("p50, мс", display=lambda entry: format_ms(entry["latency"]["p50"]),
+                   sort_value=lambda entry: entry["latency"]["p50"] or 0),
+            Column("p95, мс", display=lambda entry: format_ms(entry["latency"]["p95"]),
+                   sort_value=lambda entry: entry["latency"]["p95"] or 0),
+            Column("p99, мс", display=lambda entry: format_ms(entry["latency"]["p99"]),
+                   sort_value=lambda entry: entry["latency"]["p99"] or 0),
+        ], key="key")
+        self.layout().addWidget(QLabel("Запросы к серверу"))
+        self.layout().addWidget(RecordTableView(self.requests_model))
+
+        self.timings_model = RecordTableModel([
+            Column("Операция", "kind"),
+            Column("Экран / endpoint", "name"),
+            Column("Количество", "count"),
+            Column("p50, мс", "p50", display=lambda entry: format_ms(entry["p50"])),
+            Column("p95, мс", "p95", display=lambda entry: format_ms(entry["p95"])),
+            Column("p99, мс", "p99", display=lambda entry: format_ms(entry["p99"])),
+            Column("Макс., мс", "max", display=lambda entry: format_ms(entry["max"])),
+            Column("Всего, мс", "sum", display=lambda entry: format_ms(entry["sum"])),
+        ], key="key")
+        self.layout().addWidget(QLabel("Операции приложения (populate_table — время в потоке интерфейса)"))
+        self.layout().addWidget(RecordTableView(self.timings_model))
+
+        self.event_loop_label = QLabel()
+        self.layout().addWidget(self.event_loop_label)
+        self.cache_label = QLabel()
+        self.layout().addWidget(self.cache_label)
+
+        buttons = QHBoxLayout()
+        for title, handler in (("Обновить", self.refresh), ("Экспорт JSON", self.export_json),
+                               ("Экспорт Prometheus", self.export_prometheus), ("Сбросить", self.reset)):
+            button = QPushButton(title)
+            button.clicked.connect(handler)
+            buttons.addWidget(button)
+        self.layout().addLayout(buttons)
+
+    def attach_scheduler(self, scheduler):
+        scheduler.register("diagnostics", self.refresh, self.REFRESH_INTERVAL, visible=self.isVisible, network=False)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def refresh(self):
+        """Перечитывает счетчики и обновляет таблицы."""
+        snapshot = self.metrics.snapshot()
+        self.requests_model.set_records(
+            [dict(entry, key=(entry["method"], entry["endpoint"])) for entry in snapshot["requests"]])
+        self.timings_model.set_records(
+            [dict(entry, key=(entry["kind"], entry["name"])) for entry in snapshot["timings"]])
+        stalls = next((entry for entry in snapshot["timings"] if entry["kind"] == "event_loop_stall"), None)
+        self.event_loop_label.setText(
+            f"Цикл событий GUI: задержек {stalls['count']}, максимум {format_ms(stalls['max'])} мс, "
+            f"p99 {format_ms(stalls['p99'])} мс" if stalls else "Цикл событий GUI: задержек не было")
+        cache = self.business_logic.network_layer.cache.stats()
+        self.cache_label.setText(
+            f"Кэш ответов: попаданий {cache['hits']}, промахов {cache['misses']} "
+            f"({cache['hit_ratio']:.0%}), 304: {cache['not_modified']}, "
+            f"сэкономлено {format_bytes(cache['bytes_saved'])}, записей {cache['entries']} "
+            f"({format_bytes(cache['size'])}), вытеснено {cache['evictions']}")
+
+    def reset(self):
+        self.metrics.reset()
+        self.refresh()
+
+    def export_json(self):
+        self.save_text("metrics.json", "JSON (*.json)", self.metrics.to_json())
+
+    def export_prometheus(self):
+        self.save_text("metrics.prom", "Prometheus (*.prom *.txt)", self.metrics.to_prometheus())
+
+    def save_text(self, default_name, file_filter, text):
+        """Сохраняет выгрузку метрик в выбранный файл."""
+        path, _ = QFileDialog.getSaveFileName(self, "Экспорт метрик", default_name, file_filter)
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text)
+        except OSError as e:
+            QMessageBox.critical(self, "Ошибка", f"Не удалось сохранить метрики: {e}")
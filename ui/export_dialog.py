@@ -0,0 +1,47 @@
+import threading
+from functools import partial
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog
+
+from logic.exporter import export_rows
+
+
+class _ExportProgress(QObject):
+    rows_written = pyqtSignal(int)
+
+
+def export_columns(columns):
+    """Колонки таблицы для экспорта: сырое значение поля, если оно есть, иначе текст ячейки; кнопки пропускаются."""
+    return [(column.title, (lambda record, field=column.field: record[field]) if column.field else column.display)
+            for column in columns if not column.actions]
+
+
+def export_to_file(parent, executor, make_records, columns, default_name):
+    """Спрашивает имя файла и в фоне выгружает в него записи, показывая прогресс с возможностью отмены."""
+    path, _ = QFileDialog.getSaveFileName(parent, "Экспорт", default_name, "CSV (*.csv);;Excel (*.xlsx)")
+    if not path:
+        return
+
+    dialog = QProgressDialog("Подготовка экспорта...", "Отмена", 0, 0, parent)
+    dialog.setWindowTitle("Экспорт")
+    dialog.setWindowModality(Qt.WindowModality.WindowModal)
+    cancelled = threading.Event()
+    dialog.canceled.connect(cancelled.set)
+    progress = _ExportProgress(dialog)
+    progress.rows_written.connect(lambda count: dialog.setLabelText(f"Выгружено строк: {count}"))
+    dialog.show()
+
+    def on_finished(count):
+        dialog.close()
+        if count is not None:
+            QMessageBox.information(parent, "Успех", f"Выгружено строк: {count}.")
+
+    def on_failed(error):
+        dialog.close()
+        QMessageBox.critical(parent, "Ошибка", f"Не удалось выполнить экспорт: {error}")
+
+    executor.submit(
+        partial(export_rows, make_records, columns, path, progress.rows_written.emit, cancelled),
+        on_finished, on_failed
+    )
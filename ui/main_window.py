@@ -1,57 +1,140 @@
-from PyQt6.QtWidgets import QMainWindow, QListWidget, QStackedWidget, QHBoxLayout, QWidget, QLabel
-
-from ui.computer_window import ComputerManagementWidget
-from ui.menu_window import MenuManagementWidget
-from ui.order_window import OrderManagementWidget
-from ui.staff_window import StaffWidget
-from ui.statictic_computer_window import ComputerUsageStatisticsWidget
-from ui.statistic_menu_window import FoodStatisticsWidget
-
-
-class MainWindow(QMainWindow):
-    def __init__(self, business_logic):
-        super().__init__()
-        self.business_logic = business_logic
-        self.setWindowTitle("Панель управления")
-        self.resize(1200, 800)
-
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        layout = QHBoxLayout(central_widget)
-
-        self.menu_list = QListWidget()
-        self.content_stack = QStackedWidget()
-
-        self.menu_list.addItem("Сотрудники")
-        self.menu_list.addItem("Компьютеры")
-        self.menu_list.addItem("Заказы")
-        self.menu_list.addItem("Меню")
-        self.menu_list.addItem("Статистика заказов")
-        self.menu_list.addItem("Статистика использования компьютеров")
-        self.menu_list.addItem("Выход")
-        self.menu_list.setMaximumWidth(300)
-
-        self.menu_list.currentRowChanged.connect(self.switch_view)
-
-        self.staff_widget = StaffWidget(self.business_logic)
-        self.computers_widget = ComputerManagementWidget(self.business_logic)
-        self.orders_widget = OrderManagementWidget(self.business_logic)
-        self.menu_widget = MenuManagementWidget(self.business_logic)
-        self.order_stats_widget = FoodStatisticsWidget(self.business_logic)
-        self.computer_usage_stats_widget = ComputerUsageStatisticsWidget(self.business_logic)
-
-        self.content_stack.addWidget(self.staff_widget)
-        self.content_stack.addWidget(self.computers_widget)
-        self.content_stack.addWidget(self.orders_widget)
-        self.content_stack.addWidget(self.menu_widget)
-        self.content_stack.addWidget(self.order_stats_widget)
-        self.content_stack.addWidget(self.computer_usage_stats_widget)
-
-        layout.addWidget(self.menu_list)
-        layout.addWidget(self.content_stack)
-
-    def switch_view(self, index):
-        if index == 6:
-            self.close()
-        else:
-            self.content_stack.setCurrentIndex(index)
+import importlib
+
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QKeySequence, QShortcut
+from PyQt6.QtWidgets import QMainWindow, QListWidget, QStackedWidget, QHBoxLayout, QWidget, QLabel, QMessageBox
+
+from logic.circuit_breaker import CircuitBreaker
+from ui.poll_scheduler import PollScheduler
+from ui.request_executor import RequestExecutor
+
+
+class MainWindow(QMainWindow):
+    server_state_changed = pyqtSignal(str)
+
+    # Экраны создаются и импортируются при первом выборе в меню.
+    SCREENS = [
+        ("Сотрудники", "ui.staff_window", "StaffWidget", "staff_widget"),
+        ("Компьютеры", "ui.computer_window", "ComputerManagementWidget", "computers_widget"),
+        ("Заказы", "ui.order_window", "OrderManagementWidget", "orders_widget"),
+        ("Меню", "ui.menu_window", "MenuManagementWidget", "menu_widget"),
+        ("Статистика заказов", "ui.statistic_menu_window", "FoodStatisticsWidget", "order_stats_widget"),
+        ("Статистика использования компьютеров", "ui.statictic_computer_window", "ComputerUsageStatisticsWidget",
+         "computer_usage_stats_widget"),
+    ]
+    # Экран диагностики не показывается в меню и открывается сочетанием клавиш.
+    DIAGNOSTICS_SHORTCUT = "Ctrl+Shift+D"
+
+    def __init__(self, business_logic, scheduler=None):
+        super().__init__()
+        self.business_logic = business_logic
+        if scheduler is None:
+            scheduler = PollScheduler(self.is_shown, parent=self)
+            scheduler.start()
+        self.scheduler = scheduler
+        self.setWindowTitle("Панель управления")
+        self.resize(1200, 800)
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QHBoxLayout(central_widget)
+
+        self.menu_list = QListWidget()
+        self.content_stack = QStackedWidget()
+
+        for title, _, _, _ in self.SCREENS:
+            self.menu_list.addItem(title)
+        self.menu_list.addItem("Выход")
+        self.menu_list.setMaximumWidth(300)
+
+        self.menu_list.currentRowChanged.connect(self.switch_view)
+
+        self.screens = {}
+        self.diagnostics_widget = None
+        QShortcut(QKeySequence(self.DIAGNOSTICS_SHORTCUT), self, activated=self.show_diagnostics)
+
+        layout.addWidget(self.menu_list)
+        layout.addWidget(self.content_stack)
+
+        self.executor = RequestExecutor(self)
+        self.pending_changes_label = QLabel()
+        self.statusBar().addPermanentWidget(self.pending_changes_label)
+        self.scheduler.register("sync", self.sync_pending_changes, 10, priority=-1)
+
+        self.server_state_label = QLabel()
+        self.server_state_label.setStyleSheet("color: #b00020;")
+        self.statusBar().addPermanentWidget(self.server_state_label)
+        self.server_state_changed.connect(self.show_server_state)
+        breaker = self.business_logic.network_layer.breaker
+        breaker.subscribe(self.server_state_changed.emit)
+        self.show_server_state(breaker.state)
+
+        self.menu_list.setCurrentRow(0)
+
+    def is_shown(self):
+        """Окно на экране: не скрыто и не свернуто."""
+        return self.isVisible() and not self.isMinimized()
+
+    def show_server_state(self, state):
+        """Показывает в строке состояния, что сервер недоступен и запросы приостановлены."""
+        messages = {
+            CircuitBreaker.OPEN: "Нет связи с сервером: запросы приостановлены",
+            CircuitBreaker.HALF_OPEN: "Проверка связи с сервером...",
+        }
+        self.server_state_label.setText(messages.get(state, ""))
+        self.server_state_label.setVisible(state in messages)
+        if state == CircuitBreaker.CLOSED:
+            self.sync_pending_changes()
+
+    def sync_pending_changes(self):
+        """Отправляет в фоне изменения, сделанные без связи с сервером."""
+        count = self.business_logic.pending_changes()
+        self.show_pending_changes(count)
+        if count and not self.executor.is_pending("sync"):
+            self.executor.submit(
+                self.business_logic.replay_journal, self.on_changes_synced,
+                lambda e: self.statusBar().showMessage(f"Не удалось отправить изменения: {e}", 5000),
+                key="sync"
+            )
+
+    def on_changes_synced(self, result):
+        """Сообщает об итогах отправки накопленных изменений и о конфликтах."""
+        self.show_pending_changes(result["pending"])
+        problems = result["conflicts"] + result["errors"]
+        if problems:
+            QMessageBox.warning(self, "Синхронизация",
+                                "Не все изменения, сделанные без связи, применены:\n" + "\n".join(problems))
+        elif result["sent"]:
+            self.statusBar().showMessage(f"Отправлено изменений, сделанных без связи: {result['sent']}", 5000)
+
+    def show_pending_changes(self, count):
+        self.pending_changes_label.setText(f"Ожидают отправки: {count}")
+        self.pending_changes_label.setVisible(count > 0)
+
+    def switch_view(self, index):
+        if index == len(self.SCREENS):
+            self.close()
+        else:
+            self.content_stack.setCurrentWidget(self.get_screen(index))
+
+    def show_diagnostics(self):
+        """Открывает скрытый экран диагностики; выбор пункта меню возвращает к обычным экранам."""
+        if self.diagnostics_widget is None:
+            from ui.diagnostics_window import DiagnosticsWidget
+            self.diagnostics_widget = DiagnosticsWidget(self.business_logic)
+            self.diagnostics_widget.attach_scheduler(self.scheduler)
+            self.content_stack.addWidget(self.diagnostics_widget)
+        self.content_stack.setCurrentWidget(self.diagnostics_widget)
+
+    def get_screen(self, index):
+        """Возвращает экран по номеру пункта меню, создавая его при первом обращении."""
+        if index not in self.screens:
+            _, module_name, class_name, attribute = self.SCREENS[index]
+            widget_class = getattr(importlib.import_module(module_name), class_name)
+            widget = widget_class(self.business_logic)
+            if hasattr(widget, "attach_scheduler"):
+                widget.attach_scheduler(self.scheduler)
+            setattr(self, attribute, widget)
+            self.screens[index] = widget
+            self.content_stack.addWidget(widget)
+        return self.screens[index]
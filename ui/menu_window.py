@@ -1,119 +1,196 @@
-from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QPushButton,
-    QMessageBox, QDialog, QInputDialog
-)
-from PyQt6.QtCore import QTimer
-
-from ui.add_menu_dialog import AddMenuItemDialog
-
-
-class MenuManagementWidget(QWidget):
-    def __init__(self, business_logic):
-        super().__init__()
-        self.business_logic = business_logic
-        self.setLayout(QVBoxLayout())
-
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["ID", "Название", "Цена", "Действие"])
-        self.layout().addWidget(self.table)
-
-        self.add_dish_button = QPushButton("Добавить блюдо")
-        self.add_dish_button.clicked.connect(self.add_menu_item)
-        self.layout().addWidget(self.add_dish_button)
-
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.load_menu)
-        self.timer.start(10000)
-
-        self.menu_items = []
-
-    def showEvent(self, event):
-        """Событие, вызываемое при открытии виджета."""
-        super().showEvent(event)
-        self.load_menu()
-
-    def hideEvent(self, event):
-        """Событие, вызываемое при закрытии виджета."""
-        super().hideEvent(event)
-        self.timer.stop()
-
-    def load_menu(self):
-        """Загружает меню через BusinessLogic и обновляет таблицу."""
-        try:
-            self.menu_items = self.business_logic.get_menu()
-            self.populate_table(self.menu_items)
-        except Exception as e:
-            QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки меню: {e}")
-
-    def populate_table(self, menu_items):
-        """Заполняет таблицу меню."""
-        self.table.setRowCount(len(menu_items))
-        for row, item in enumerate(menu_items):
-            self.table.setItem(row, 0, QTableWidgetItem(str(item["id"])))
-            self.table.setItem(row, 1, QTableWidgetItem(item["name"]))
-            self.table.setItem(row, 2, QTableWidgetItem(f'{item["price"]:.2f} руб.'))
-
-            edit_button = QPushButton("Изменить цену")
-            edit_button.clicked.connect(lambda _, i_id=item["id"]: self.edit_price(i_id))
-
-            delete_button = QPushButton("Удалить")
-            delete_button.clicked.connect(lambda _, i_id=item["id"]: self.delete_dish(i_id))
-
-            button_layout = QVBoxLayout()
-            button_layout.addWidget(edit_button)
-            button_layout.addWidget(delete_button)
-
-            button_widget = QWidget()
-            button_widget.setLayout(button_layout)
-            self.table.setCellWidget(row, 3, button_widget)
-
-            self.table.setRowHeight(row, 80)
-
-        self.table.resizeColumnsToContents()
-
-    def edit_price(self, item_id):
-        """Изменяет цену блюда."""
-        current_price = next((item["price"] for item in self.menu_items if item["id"] == item_id), 0)
-        new_price, ok = QInputDialog.getDouble(
-            self, "Изменить цену", "Введите новую цену:",
-            value=current_price, min=0.0, decimals=2
-        )
-        if not ok or new_price == current_price:
-            return
-
-        try:
-            self.business_logic.update_menu_price(item_id, new_price)
-            QMessageBox.information(self, "Успех", "Цена успешно обновлена.")
-            self.load_menu()
-        except Exception as e:
-            QMessageBox.critical(self, "Ошибка", f"Не удалось обновить цену: {e}")
-
-    def delete_dish(self, item_id):
-        """Удаляет блюдо из меню."""
-        reply = QMessageBox.question(
-            self, "Удаление блюда", "Вы уверены, что хотите удалить это блюдо?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                self.business_logic.delete_menu_item(item_id)
-                QMessageBox.information(self, "Успех", "Блюдо успешно удалено.")
-                self.load_menu()
-            except Exception as e:
-                QMessageBox.critical(self, "Ошибка", f"Не удалось удалить блюдо: {e}")
-
-    def add_menu_item(self):
-        """Открывает диалог для добавления нового блюда."""
-        dialog = AddMenuItemDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            data = dialog.get_data()
-            name = data["name"]
-            price = data["price"]
-
-            try:
-                self.business_logic.add_menu_item(name, float(price))
-                QMessageBox.information(self, "Успех", "Блюдо успешно добавлено.")
-                self.load_menu()
-            except Exception as e:
-                QMessageBox.critical(self, "Ошибка", f"Не удалось добавить блюдо: {e}")
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QPushButton,
+    QMessageBox, QDialog, QInputDialog, QLabel
+)
+from PyQt6.QtCore import pyqtSignal
+
+from functools import partial
+
+from ui.add_menu_dialog import AddMenuItemDialog
+from ui.batch_results import show_batch_results
+from ui.request_executor import RequestExecutor
+from ui.search_box import SearchBox
+from ui.table_models import Column, RecordTableModel, RecordTableView
+
+
+class MenuManagementWidget(QWidget):
+    menu_received = pyqtSignal(object)
+
+    def __init__(self, business_logic):
+        super().__init__()
+        self.business_logic = business_logic
+        self.setLayout(QVBoxLayout())
+        self.executor = RequestExecutor(self)
+
+        self.loading_label = QLabel("Загрузка...")
+        self.loading_label.hide()
+        self.executor.loading_changed.connect(self.loading_label.setVisible)
+        self.layout().addWidget(self.loading_label)
+
+        self.model = RecordTableModel([
+            Column("ID", "id"),
+            Column("Название", "name"),
+            Column("Цена", "price", display=lambda item: f'{item["price"]:.2f} руб.'),
+            Column("Действие", display=lambda item: "",
+                   actions=lambda item: [("edit_price", "Изменить цену"), ("delete", "Удалить")]),
+        ], batch_size=self.business_logic.PAGE_SIZE)
+        self.model.more_requested.connect(self.load_next_page)
+        self.search_box = SearchBox(self.model, ("id", "name"), self.business_logic.metrics, "Поиск блюда", self)
+        self.layout().addWidget(self.search_box)
+        self.table = RecordTableView(self.model, action_column=3, row_height=80)
+        self.table.action_triggered.connect(self.on_action)
+        self.layout().addWidget(self.table)
+
+        self.edit_selected_button = QPushButton("Изменить цену выбранных")
+        self.edit_selected_button.clicked.connect(self.edit_selected_prices)
+        self.layout().addWidget(self.edit_selected_button)
+
+        self.add_dish_button = QPushButton("Добавить блюдо")
+        self.add_dish_button.clicked.connect(self.add_menu_item)
+        self.layout().addWidget(self.add_dish_button)
+
+        self.menu_items = []
+        self.pages = None
+        self.menu_received.connect(self.set_menu_items)
+        self.business_logic.menu_store.subscribe(self.menu_received.emit)
+
+    def showEvent(self, event):
+        """Событие, вызываемое при открытии виджета."""
+        super().showEvent(event)
+        self.load_menu()
+
+    def attach_scheduler(self, scheduler):
+        """Регистрирует периодическое обновление меню, пока экран открыт."""
+        scheduler.register("menu", self.refresh_menu, 10, visible=self.isVisible)
+
+    def load_menu(self):
+        """Загружает первую страницу меню; остальные подгружаются при прокрутке."""
+        self.executor.cancel("menu")
+        self.pages = self.business_logic.iter_menu()
+        self.model.reset_paging()
+        self.load_next_page()
+
+    def load_next_page(self):
+        """Загружает следующую страницу меню в фоне; таблица обновится из хранилища."""
+        if self.pages is None or self.executor.is_pending("menu"):
+            return
+        self.executor.submit(
+            partial(next, self.pages, None), self.on_page_loaded,
+            lambda e: QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки меню: {e}"),
+            key="menu"
+        )
+
+    def on_page_loaded(self, page):
+        """Запоминает, есть ли еще страницы на сервере."""
+        self.model.has_more_remote = page is not None
+        if page is None:
+            self.pages = None
+
+    def refresh_menu(self):
+        """Периодически перечитывает загруженные страницы меню.
+
+        Обновление идет под своим ключом, чтобы не отменять загрузку следующей страницы и не мешать ей; пока
+        страница загружается или предыдущее обновление не завершилось, новое не запускается.
+        """
+        if not self.executor.is_pending("menu") and not self.executor.is_pending("menu-refresh"):
+            self.executor.submit(
+                self.business_logic.refresh_menu, None,
+                lambda e: QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки меню: {e}"),
+                key="menu-refresh"
+            )
+
+    def set_menu_items(self, menu_items):
+        """Сохраняет полученное меню и перерисовывает таблицу."""
+        self.menu_items = menu_items
+        self.populate_table(self.menu_items)
+
+    def populate_table(self, menu_items):
+        """Заполняет таблицу меню."""
+        with self.business_logic.metrics.timed("populate_table", type(self).__name__):
+            self.search_box.index_records(menu_items)
+            self.model.set_records(menu_items)
+
+    def on_action(self, action, item):
+        """Обрабатывает нажатие кнопки в строке таблицы."""
+        if action == "edit_price":
+            self.edit_price(item["id"])
+        elif action == "delete":
+            self.delete_dish(item["id"])
+
+    def edit_price(self, item_id):
+        """Изменяет цену блюда."""
+        current_price = next((item["price"] for item in self.menu_items if item["id"] == item_id), 0)
+        new_price, ok = QInputDialog.getDouble(
+            self, "Изменить цену", "Введите новую цену:",
+            value=current_price, min=0.0, decimals=2
+        )
+        if not ok or new_price == current_price:
+            return
+
+        self.executor.submit(
+            partial(self.business_logic.update_menu_price, item_id, new_price),
+            lambda sent: self.on_menu_changed("Цена успешно обновлена.", sent),
+            lambda e: QMessageBox.critical(self, "Ошибка", f"Не удалось обновить цену: {e}")
+        )
+
+    def edit_selected_prices(self):
+        """Устанавливает новую цену всем выделенным блюдам одним пакетом."""
+        items = self.table.selected_records()
+        if not items:
+            QMessageBox.warning(self, "Ошибка", "Выберите блюда для изменения цены.")
+            return
+        new_price, ok = QInputDialog.getDouble(
+            self, "Изменить цену", f"Введите новую цену для выбранных блюд ({len(items)}):",
+            value=items[0]["price"], min=0.0, decimals=2
+        )
+        if not ok:
+            return
+
+        changes = [(item["id"], new_price) for item in items if item["price"] != new_price]
+        if not changes:
+            return
+        self.executor.submit(
+            partial(self.business_logic.update_menu_prices, changes),
+            lambda results: show_batch_results(self, results, "Цены обновлены", "Не удалось обновить цену"),
+            lambda e: QMessageBox.critical(self, "Ошибка", f"Не удалось обновить цену: {e}")
+        )
+
+    def delete_dish(self, item_id):
+        """Удаляет блюдо из меню."""
+        reply = QMessageBox.question(
+            self, "Удаление блюда", "Вы уверены, что хотите удалить это блюдо?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.executor.submit(
+                partial(self.business_logic.delete_menu_item, item_id),
+                lambda sent: self.on_menu_changed("Блюдо успешно удалено.", sent),
+                lambda e: QMessageBox.critical(self, "Ошибка", f"Не удалось удалить блюдо: {e}")
+            )
+
+    def add_menu_item(self):
+        """Открывает диалог для добавления нового блюда."""
+        dialog = AddMenuItemDialog(self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            data = dialog.get_data()
+            name = data["name"]
+            price = data["price"]
+
+            try:
+                price = float(price)
+            except ValueError as e:
+                QMessageBox.critical(self, "Ошибка", f"Не удалось добавить блюдо: {e}")
+                return
+
+            self.executor.submit(
+                partial(self.business_logic.add_menu_item, name, price),
+                lambda _: self.on_menu_changed("Блюдо успешно добавлено."),
+                lambda e: QMessageBox.critical(self, "Ошибка", f"Не удалось добавить блюдо: {e}")
+            )
+
+    def on_menu_changed(self, message, sent=True):
+        """Сообщает об успешном изменении; таблица уже обновлена из хранилища."""
+        if sent is False:
+            QMessageBox.warning(self, "Нет связи", self.business_logic.QUEUED_MESSAGE)
+        else:
+            QMessageBox.information(self, "Успех", message)
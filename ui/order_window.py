@@ -1,5 +1,13 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QMessageBox
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QMessageBox, QLabel, QPushButton
+from PyQt6.QtCore import Qt, pyqtSignal
+
+from functools import partial
+
+from logic.exporter import iter_records
+from ui.batch_results import show_batch_results
+from ui.export_dialog import export_columns, export_to_file
+from ui.request_executor import RequestExecutor
+from ui.table_models import Column, RecordTableModel, RecordTableView
 
 
 def get_next_status(current_status):
@@ -12,70 +20,119 @@ def get_next_status(current_status):
     return status_transitions.get(current_status)
 
 
+def format_order_items(order):
+    """Форматирует состав заказа по одной позиции в строке."""
+    return "\n".join([f"{item['name']} - {item['quantity']} шт." for item in order["items"]])
+
+
+def order_actions(order):
+    """Кнопка перевода заказа в следующий статус."""
+    next_status = get_next_status(order["status"])
+    if next_status:
+        return [(next_status, f"Перевести в {next_status}")]
+    return None
+
+
 class OrderManagementWidget(QWidget):
+    orders_received = pyqtSignal(object)
+    load_failed = pyqtSignal(str)
+
     def __init__(self, business_logic):
         super().__init__()
         self.business_logic = business_logic
         self.setLayout(QVBoxLayout())
+        self.executor = RequestExecutor(self)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["ID", "Клиент", "Состав", "Статус", "Действие"])
+        self.loading_label = QLabel("Загрузка...")
+        self.loading_label.hide()
+        self.executor.loading_changed.connect(self.loading_label.setVisible)
+        self.layout().addWidget(self.loading_label)
+
+        self.model = RecordTableModel([
+            Column("ID", "id"),
+            Column("Клиент", "user_id"),
+            Column("Состав", display=format_order_items),
+            Column("Статус", "status", alignment=Qt.AlignmentFlag.AlignCenter),
+            Column("Действие", display=lambda order: "", actions=order_actions),
+        ], batch_size=self.business_logic.PAGE_SIZE)
+        self.table = RecordTableView(self.model, action_column=4, fit_rows=True)
+        self.table.action_triggered.connect(lambda new_status, order: self.change_order_status(order["id"], new_status))
         self.layout().addWidget(self.table)
 
+        self.advance_button = QPushButton("Перевести выбранные в следующий статус")
+        self.advance_button.clicked.connect(self.advance_selected_orders)
+        self.layout().addWidget(self.advance_button)
+
+        self.export_button = QPushButton("Экспорт истории заказов")
+        self.export_button.clicked.connect(self.export_order_history)
+        self.layout().addWidget(self.export_button)
+
         self.orders = []
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.load_orders)
+        self.orders_received.connect(self.set_orders)
+        self.business_logic.order_store.subscribe(self.orders_received.emit)
+        self.load_failed.connect(
+            lambda detail: QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки заказов: {detail}"))
+        self.subscription = None
+        self.scheduler = None
+
+    def attach_scheduler(self, scheduler):
+        """Фоновый опрос заказов подчиняется паузам и лимиту запросов общего планировщика."""
+        self.scheduler = scheduler
 
     def showEvent(self, event):
         """Событие, вызываемое при открытии виджета."""
         super().showEvent(event)
-        self.load_orders()
-        self.timer.start(10000)
+        if self.subscription is None:
+            gate = self.scheduler.allow_background if self.scheduler else None
+            self.subscription = self.business_logic.subscribe_pending_orders(self.load_failed.emit, gate=gate)
 
     def hideEvent(self, event):
         """Событие, вызываемое при закрытии виджета."""
         super().hideEvent(event)
-        self.timer.stop()
+        if self.subscription is not None:
+            self.subscription.stop()
+            self.subscription = None
 
-    def load_orders(self):
-        """Загружает список заказов через BusinessLogic и обновляет таблицу."""
-        try:
-            self.orders = self.business_logic.get_pending_orders()
-            self.populate_table(self.orders)
-        except Exception as e:
-            QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки заказов: {e}")
+    def set_orders(self, orders):
+        """Сохраняет полученные заказы и перерисовывает таблицу."""
+        self.orders = orders
+        self.populate_table(self.orders)
 
     def populate_table(self, orders):
         """Заполняет таблицу заказов."""
-        self.table.setRowCount(len(orders))
-        for row, order in enumerate(orders):
-            self.table.setItem(row, 0, QTableWidgetItem(str(order["id"])))
-            self.table.setItem(row, 1, QTableWidgetItem(str(order["user_id"])))
-
-            items = "\n".join([f"{item['name']} - {item['quantity']} шт." for item in order["items"]])
-            self.table.setItem(row, 2, QTableWidgetItem(items))
-
-            status_item = QTableWidgetItem(order["status"])
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 3, status_item)
-
-            next_status = get_next_status(order["status"])
-            if next_status:
-                change_status_button = QPushButton(f"Перевести в {next_status}")
-                change_status_button.clicked.connect(lambda _, o_id=order["id"], ns=next_status: self.change_order_status(o_id, ns))
-                self.table.setCellWidget(row, 4, change_status_button)
-            else:
-                self.table.setItem(row, 4, QTableWidgetItem(""))
-
-        self.table.resizeColumnsToContents()
-        self.table.resizeRowsToContents()
+        with self.business_logic.metrics.timed("populate_table", type(self).__name__):
+            self.model.set_records(orders)
 
     def change_order_status(self, order_id, new_status):
         """Изменяет статус заказа."""
-        try:
-            self.business_logic.update_order_status(order_id, new_status)
+        self.executor.submit(
+            partial(self.business_logic.update_order_status, order_id, new_status),
+            lambda sent: self.on_order_status_changed(order_id, new_status, sent),
+            lambda e: QMessageBox.critical(self, "Ошибка", f"Не удалось обновить статус заказа: {e}")
+        )
+
+    def on_order_status_changed(self, order_id, new_status, sent=True):
+        """Сообщает об изменении статуса; таблица уже обновлена из хранилища."""
+        if sent is False:
+            QMessageBox.warning(self, "Нет связи", self.business_logic.QUEUED_MESSAGE)
+        else:
             QMessageBox.information(self, "Успех", f"Статус заказа #{order_id} обновлен до '{new_status}'.")
-            self.load_orders()
-        except Exception as e:
-            QMessageBox.critical(self, "Ошибка", f"Не удалось обновить статус заказа: {e}")
+
+    def advance_selected_orders(self):
+        """Переводит все выделенные заказы в следующий статус одним пакетом."""
+        changes = [(order["id"], get_next_status(order["status"])) for order in self.table.selected_records()
+                   if get_next_status(order["status"])]
+        if not changes:
+            QMessageBox.warning(self, "Ошибка", "Выберите заказы для перевода в следующий статус.")
+            return
+        self.executor.submit(
+            partial(self.business_logic.update_orders_status, changes),
+            lambda results: show_batch_results(self, results, "Статусы заказов обновлены",
+                                               "Не удалось обновить статус заказов"),
+            lambda e: QMessageBox.critical(self, "Ошибка", f"Не удалось обновить статус заказов: {e}")
+        )
+
+    def export_order_history(self):
+        """Постранично выгружает всю историю заказов в CSV или XLSX."""
+        export_to_file(self, self.executor, lambda: iter_records(self.business_logic.iter_order_history()),
+                       export_columns(self.model.columns), "orders.csv")
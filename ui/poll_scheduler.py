@@ -0,0 +1,116 @@
+import math
+import random
+import time
+
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtGui import QCursor
+
+from logic.rate_limiter import RateLimiter
+
+
+class PollJob:
+    """Периодическое обновление, зарегистрированное в PollScheduler."""
+
+    def __init__(self, name, callback, interval, priority=0, visible=None, network=True):
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.priority = priority
+        self.visible = visible
+        self.network = network
+        self.next_due = None
+        self.runs = 0
+
+
+class PollScheduler(QObject):
+    """Единый планировщик периодических обновлений экранов.
+
+    Задачи выравниваются по сетке своего интервала со случайным для каждого клиента сдвигом: обновления с кратными
+    интервалами срабатывают в один такт, а разные копии приложения не приходят к серверу одновременно. Пока окно
+    скрыто или свернуто, задачи не выполняются; при бездействии пользователя и задержках цикла событий сетевые
+    обновления замедляются. Сетевые задачи вместе с фоновыми опросами подписок (allow_background) не превышают
+    max_rps запросов в секунду; при нехватке лимита первыми выполняются задачи с большим приоритетом, а среди
+    равных — дольше ждущие.
+    """
+
+    TICK = 250
+    IDLE_TIMEOUT = 300
+    IDLE_SLOWDOWN = 4
+    STALL_THRESHOLD = 100.0
+    MAX_LOAD_FACTOR = 8.0
+
+    def __init__(self, is_active=None, max_rps=4.0, jitter=1.0, clock=time.monotonic, parent=None):
+        super().__init__(parent)
+        self.is_active = is_active or (lambda: True)
+        self.clock = clock
+        self.limiter = RateLimiter(max_rps, clock=clock)
+        self.phase = random.uniform(0, jitter)
+        self.load_factor = 1.0
+        self.paused = False
+        self.jobs = []
+        self._last_input = clock()
+        self._cursor = None
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+
+    def start(self):
+        self.timer.start(self.TICK)
+
+    def stop(self):
+        self.timer.stop()
+
+    def register(self, name, callback, interval, priority=0, visible=None, network=True):
+        """Добавляет периодическую задачу; возвращает функцию, снимающую ее с учета.
+
+        visible — условие, при котором задача нужна (например, экран открыт); network=False для задач без
+        запросов к серверу, например обновления таймеров, — они не расходуют лимит и не замедляются.
+        """
+        job = PollJob(name, callback, interval, priority, visible, network)
+        job.next_due = self._next_due(job, self.clock())
+        self.jobs.append(job)
+        return lambda: self.jobs.remove(job)
+
+    def allow_background(self):
+        """Разрешение на фоновый опрос из другого потока: не на паузе и есть запас лимита запросов."""
+        return not self.paused and self.limiter.try_acquire()
+
+    def report_stall(self, lag):
+        """Учитывает задержку цикла событий (мс): при заметных задержках сетевые обновления реже."""
+        if lag >= self.STALL_THRESHOLD:
+            self.load_factor = min(self.load_factor * 1.5, self.MAX_LOAD_FACTOR)
+
+    def is_idle(self):
+        """Пользователь давно не двигал мышь (без фильтра событий на все приложение, чтобы не замедлять GUI)."""
+        return self.clock() - self._last_input > self.IDLE_TIMEOUT
+
+    def interval_of(self, job):
+        """Текущий интервал задачи с учетом бездействия пользователя и нагрузки."""
+        if not job.network:
+            return job.interval
+        return job.interval * self.load_factor * (self.IDLE_SLOWDOWN if self.is_idle() else 1)
+
+    def _next_due(self, job, now):
+        interval = self.interval_of(job)
+        return self.phase + (math.floor((now - self.phase) / interval) + 1) * interval
+
+    def tick(self):
+        """Выполняет подошедшие задачи в порядке приоритета."""
+        now = self.clock()
+        self.paused = not self.is_active()
+        if self.paused:
+            return
+        cursor = QCursor.pos()
+        if cursor != self._cursor:
+            self._cursor = cursor
+            self._last_input = now
+        self.load_factor = max(1.0, self.load_factor * 0.95)
+        due = sorted((job for job in self.jobs if job.next_due <= now), key=lambda job: (-job.priority, job.next_due))
+        for job in due:
+            if job.visible is not None and not job.visible():
+                job.next_due = self._next_due(job, now)
+                continue
+            if job.network and not self.limiter.try_acquire():
+                continue
+            job.next_due = self._next_due(job, now)
+            job.runs += 1
+            job.callback()
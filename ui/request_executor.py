@@ -0,0 +1,134 @@
+import time
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Qt, pyqtSignal
+
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(object, object, object)
+
+
+class _RequestTask(QRunnable):
+    """Задача пула; ее временем жизни управляет RequestExecutor, а не пул (autoDelete выключен)."""
+
+    def __init__(self, func):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.func = func
+        self.cancelled = False
+        self.signals = _TaskSignals()
+
+    def run(self):
+        result, error = None, None
+        if not self.cancelled:
+            try:
+                result = self.func()
+            except Exception as e:
+                error = e
+        self.signals.finished.emit(self, result, error)
+
+
+class RequestExecutor(QObject):
+    """Выполняет запросы к BusinessLogic в пуле потоков и возвращает результат в GUI-поток."""
+
+    loading_changed = pyqtSignal(bool)
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self._tasks = {}
+        self._latest = {}
+
+    def submit(self, func, on_success=None, on_error=None, key=None):
+        """Ставит запрос в очередь; новый запрос с тем же ключом отменяет предыдущий.
+
+        Ошибка запроса без on_error отбрасывается, как и результат без on_success.
+        """
+        if key is not None and key in self._latest:
+            self.cancel(key)
+
+        task = _RequestTask(func)
+        task.signals.finished.connect(self._on_finished)
+        self._tasks[task] = (on_success, on_error, key)
+        if key is not None:
+            self._latest[key] = task
+        if len(self._tasks) == 1:
+            self.loading_changed.emit(True)
+        self.pool.start(task)
+        return task
+
+    def is_pending(self, key):
+        """Проверяет, выполняется ли запрос с указанным ключом."""
+        return key in self._latest
+
+    def cancel(self, key):
+        """Отменяет запрос с указанным ключом; его результат будет отброшен."""
+        task = self._latest.pop(key, None)
+        if task is None:
+            return
+        task.cancelled = True
+        if self.pool.tryTake(task):
+            self._forget(task)
+
+    def cancel_all(self):
+        """Отменяет все запросы, ожидающие результата."""
+        for key in list(self._latest):
+            self.cancel(key)
+
+    def _on_finished(self, task, result, error):
+        if task not in self._tasks:
+            return
+        on_success, on_error, key = self._tasks[task]
+        if key is not None and self._latest.get(key) is task:
+            del self._latest[key]
+        self._forget(task)
+        if task.cancelled:
+            return
+        if error is not None:
+            if on_error:
+                on_error(error)
+        elif on_success:
+            on_success(result)
+
+    def _forget(self, task):
+        del self._tasks[task]
+        if not self._tasks:
+            self.loading_changed.emit(False)
+
+
+class EventLoopMonitor(QObject):
+    """Измеряет, насколько долго блокируется цикл событий GUI-потока.
+
+    Задержки дольше threshold мс учитываются в metrics как операция event_loop_stall и видны на экране диагностики.
+    """
+
+    stalled = pyqtSignal(float)
+
+    def __init__(self, interval=20, threshold=5.0, metrics=None, parent=None):
+        super().__init__(parent)
+        self.interval = interval
+        self.threshold = threshold
+        self.metrics = metrics
+        self.max_lag = 0.0
+        self.stall_count = 0
+        self._last_tick = None
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._tick)
+
+    def start(self):
+        self._last_tick = time.perf_counter()
+        self.timer.start(self.interval)
+
+    def stop(self):
+        self.timer.stop()
+
+    def _tick(self):
+        now = time.perf_counter()
+        lag = (now - self._last_tick) * 1000 - self.interval
+        self._last_tick = now
+        self.max_lag = max(self.max_lag, lag)
+        if lag > self.threshold:
+            self.stall_count += 1
+            if self.metrics is not None:
+                self.metrics.record_timing("event_loop_stall", "GUI", lag / 1000)
+            self.stalled.emit(lag)
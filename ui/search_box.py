@@ -0,0 +1,58 @@
+from functools import partial
+
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QLineEdit
+
+from logic.search_index import SearchIndex
+from ui.request_executor import RequestExecutor
+
+
+class SearchBox(QLineEdit):
+    """Строка поиска над таблицей: фильтрует строки модели по индексу загруженных записей без запросов к серверу.
+
+    Индекс обновляется и опрашивается в собственном потоке, по одной задаче за раз (более новая задача того же вида
+    отменяет ожидающую), поэтому построение индекса большой коллекции не блокирует интерфейс. В GUI-потоке только
+    применяется готовый фильтр.
+    """
+
+    def __init__(self, model, fields, metrics, placeholder="Поиск...", parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.metrics = metrics
+        self.owner = type(parent).__name__
+        self.index = SearchIndex(fields, key=model.key)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.executor = RequestExecutor(self, self.pool)
+        self.setPlaceholderText(placeholder)
+        self.setClearButtonEnabled(True)
+        self.textChanged.connect(self.apply)
+
+    def index_records(self, records):
+        """Обновляет индекс в фоне; если в строке есть запрос, фильтр пересчитывается по новым записям."""
+        self.executor.submit(partial(self._update, records, self.text()), self.show_matches, key="index")
+
+    def apply(self, text):
+        """Фильтрует таблицу по введенному тексту; пустой запрос снимает фильтр сразу."""
+        self.executor.cancel("search")
+        self.model.reset_paging()
+        if not text.strip():
+            self.show_matches(None)
+            return
+        self.executor.submit(partial(self._search, text), self.show_matches, key="search")
+
+    def show_matches(self, keys):
+        """Применяет найденные ключи к модели (None — показать все записи)."""
+        if keys is None and self.model.filter_keys is None:
+            return
+        with self.metrics.timed("search_filter", self.owner):
+            self.model.set_filter(keys)
+
+    def _update(self, records, text):
+        with self.metrics.timed("search_index", self.owner):
+            self.index.update(records)
+        return self._search(text)
+
+    def _search(self, text):
+        with self.metrics.timed("search", self.owner):
+            return self.index.search(text)
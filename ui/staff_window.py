@@ -1,98 +1,143 @@
-from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QLineEdit, QMessageBox, QInputDialog
-)
-
-from functools import partial
-
-from ui.add_staff_dialog import AddStaffDialog
-
-
-class StaffWidget(QWidget):
-    def __init__(self, business_logic):
-        super().__init__()
-        self.business_logic = business_logic
-        self.setLayout(QVBoxLayout())
-
-        self.table = QTableWidget(self)
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["ID", "Логин", "Email", "Телефон", "Действие"])
-        self.layout().addWidget(self.table)
-
-        self.add_button = QPushButton("Добавить сотрудника", self)
-        self.add_button.clicked.connect(self.open_add_staff_dialog)
-        self.layout().addWidget(self.add_button)
-
-    def showEvent(self, event):
-        """Событие, вызываемое при отображении виджета."""
-        super().showEvent(event)
-        self.load_staffs()
-
-    def load_staffs(self):
-        """Загружает список сотрудников через BusinessLogic и обновляет таблицу."""
-        try:
-            staffs = self.business_logic.get_staffs()
-            self.populate_table(staffs)
-        except Exception as e:
-            QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки списка сотрудников: {e}")
-
-    def populate_table(self, staffs):
-        """Заполняет таблицу данными сотрудников."""
-        self.table.setRowCount(len(staffs))
-        for row, staff in enumerate(staffs):
-            self.table.setItem(row, 0, QTableWidgetItem(str(staff["id"])))
-            self.table.setItem(row, 1, QTableWidgetItem(staff["login"]))
-            self.table.setItem(row, 2, QTableWidgetItem(staff["email"]))
-            self.table.setItem(row, 3, QTableWidgetItem(staff["phone"]))
-
-            if self.business_logic.is_my_login(staff["login"]):
-                button = QPushButton("Сменить пароль", self)
-                button.clicked.connect(partial(self.change_password, staff["id"]))
-            else:
-                button = QPushButton("Удалить", self)
-                button.clicked.connect(partial(self.delete_staff, staff["id"]))
-            self.table.setCellWidget(row, 4, button)
-
-        self.table.resizeColumnsToContents()
-
-    def open_add_staff_dialog(self):
-        """Открывает диалог для добавления нового сотрудника."""
-        dialog = AddStaffDialog()
-        if dialog.exec():
-            data = dialog.get_data()
-            try:
-                result = self.business_logic.add_staff(data)
-                if result["success"]:
-                    QMessageBox.information(self, "Успех", result["message"])
-                    self.load_staffs()
-                else:
-                    QMessageBox.critical(self, "Ошибка", result["error"])
-            except Exception as e:
-                QMessageBox.critical(self, "Ошибка", f"Ошибка при добавлении сотрудника: {e}")
-
-    def delete_staff(self, staff_id):
-        """Удаляет сотрудника."""
-        confirm = QMessageBox.question(self, "Подтверждение", "Вы уверены, что хотите удалить сотрудника?")
-        if confirm == QMessageBox.StandardButton.Yes:
-            try:
-                result = self.business_logic.delete_staff(staff_id)
-                if result["success"]:
-                    QMessageBox.information(self, "Успех", result["message"])
-                    self.load_staffs()
-                else:
-                    QMessageBox.critical(self, "Ошибка", result["error"])
-            except Exception as e:
-                QMessageBox.critical(self, "Ошибка", f"Ошибка при удалении сотрудника: {e}")
-
-    def change_password(self, staff_id):
-        """Изменяет пароль для текущего пользователя."""
-        new_password, ok = QInputDialog.getText(self, "Смена пароля", "Введите новый пароль:", QLineEdit.EchoMode.Password)
-        if ok and new_password:
-            try:
-                result = self.business_logic.change_password(staff_id, new_password)
-                if result["success"]:
-                    QMessageBox.information(self, "Успех", "Пароль успешно изменен.")
-                else:
-                    QMessageBox.critical(self, "Ошибка", result["error"])
-            except Exception as e:
-                print(e)
-                QMessageBox.critical(self, "Ошибка", f"Ошибка при смене пароля: {e}")
\ No newline at end of file
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLineEdit, QMessageBox, QInputDialog, QLabel
+
+from PyQt6.QtCore import pyqtSignal
+
+from functools import partial
+
+from ui.add_staff_dialog import AddStaffDialog
+from ui.request_executor import RequestExecutor
+from ui.search_box import SearchBox
+from ui.table_models import Column, RecordTableModel, RecordTableView
+
+
+class StaffWidget(QWidget):
+    staffs_received = pyqtSignal(object)
+
+    def __init__(self, business_logic):
+        super().__init__()
+        self.business_logic = business_logic
+        self.setLayout(QVBoxLayout())
+        self.executor = RequestExecutor(self)
+
+        self.loading_label = QLabel("Загрузка...", self)
+        self.loading_label.hide()
+        self.executor.loading_changed.connect(self.loading_label.setVisible)
+        self.layout().addWidget(self.loading_label)
+
+        self.model = RecordTableModel([
+            Column("ID", "id"),
+            Column("Логин", "login"),
+            Column("Email", "email"),
+            Column("Телефон", "phone"),
+            Column("Действие", display=lambda staff: "", actions=self.staff_actions),
+        ], batch_size=self.business_logic.PAGE_SIZE, parent=self)
+        self.model.more_requested.connect(self.load_next_page)
+        self.search_box = SearchBox(self.model, ("id", "login", "email", "phone"), self.business_logic.metrics,
+                                    "Поиск по логину, email или телефону", self)
+        self.layout().addWidget(self.search_box)
+        self.table = RecordTableView(self.model, action_column=4, parent=self)
+        self.table.action_triggered.connect(self.on_action)
+        self.layout().addWidget(self.table)
+
+        self.add_button = QPushButton("Добавить сотрудника", self)
+        self.add_button.clicked.connect(self.open_add_staff_dialog)
+        self.layout().addWidget(self.add_button)
+
+        self.staffs = []
+        self.pages = None
+        self.staffs_received.connect(self.set_staffs)
+        self.business_logic.staff_store.subscribe(self.staffs_received.emit)
+
+    def showEvent(self, event):
+        """Событие, вызываемое при отображении виджета."""
+        super().showEvent(event)
+        self.load_staffs()
+
+    def load_staffs(self):
+        """Загружает первую страницу сотрудников; остальные подгружаются при прокрутке."""
+        self.executor.cancel("staffs")
+        self.pages = self.business_logic.iter_staffs()
+        self.model.reset_paging()
+        self.load_next_page()
+
+    def load_next_page(self):
+        """Загружает следующую страницу сотрудников в фоне; таблица обновится из хранилища."""
+        if self.pages is None or self.executor.is_pending("staffs"):
+            return
+        self.executor.submit(
+            partial(next, self.pages, None), self.on_page_loaded,
+            lambda e: QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки списка сотрудников: {e}"),
+            key="staffs"
+        )
+
+    def on_page_loaded(self, page):
+        """Запоминает, есть ли еще страницы на сервере."""
+        self.model.has_more_remote = page is not None
+        if page is None:
+            self.pages = None
+
+    def set_staffs(self, staffs):
+        """Сохраняет полученный список сотрудников и перерисовывает таблицу."""
+        self.staffs = staffs
+        self.populate_table(self.staffs)
+
+    def populate_table(self, staffs):
+        """Заполняет таблицу данными сотрудников."""
+        with self.business_logic.metrics.timed("populate_table", type(self).__name__):
+            self.search_box.index_records(staffs)
+            self.model.set_records(staffs)
+
+    def staff_actions(self, staff):
+        """Свою учетную запись можно только сменить пароль, чужую — удалить."""
+        if self.business_logic.is_my_login(staff["login"]):
+            return [("change_password", "Сменить пароль")]
+        return [("delete", "Удалить")]
+
+    def on_action(self, action, staff):
+        """Обрабатывает нажатие кнопки в строке таблицы."""
+        if action == "change_password":
+            self.change_password(staff["id"])
+        elif action == "delete":
+            self.delete_staff(staff["id"])
+
+    def open_add_staff_dialog(self):
+        """Открывает диалог для добавления нового сотрудника."""
+        dialog = AddStaffDialog()
+        if dialog.exec():
+            data = dialog.get_data()
+            self.executor.submit(
+                partial(self.business_logic.add_staff, data), self.on_staff_changed,
+                lambda e: QMessageBox.critical(self, "Ошибка", f"Ошибка при добавлении сотрудника: {e}")
+            )
+
+    def delete_staff(self, staff_id):
+        """Удаляет сотрудника."""
+        confirm = QMessageBox.question(self, "Подтверждение", "Вы уверены, что хотите удалить сотрудника?")
+        if confirm == QMessageBox.StandardButton.Yes:
+            self.executor.submit(
+                partial(self.business_logic.delete_staff, staff_id), self.on_staff_changed,
+                lambda e: QMessageBox.critical(self, "Ошибка", f"Ошибка при удалении сотрудника: {e}")
+            )
+
+    def on_staff_changed(self, result):
+        """Показывает результат добавления или удаления сотрудника."""
+        if result["success"]:
+            QMessageBox.information(self, "Успех", result["message"])
+        else:
+            QMessageBox.critical(self, "Ошибка", result["error"])
+
+    def change_password(self, staff_id):
+        """Изменяет пароль для текущего пользователя."""
+        new_password, ok = QInputDialog.getText(self, "Смена пароля", "Введите новый пароль:", QLineEdit.EchoMode.Password)
+        if ok and new_password:
+            self.executor.submit(
+                partial(self.business_logic.change_password, staff_id, new_password), self.on_password_changed,
+                lambda e: QMessageBox.critical(self, "Ошибка", f"Ошибка при смене пароля: {e}")
+            )
+
+    def on_password_changed(self, result):
+        """Показывает результат смены пароля."""
+        if result["success"]:
+            QMessageBox.information(self, "Успех", "Пароль успешно изменен.")
+        else:
+            QMessageBox.critical(self, "Ошибка", result["error"])
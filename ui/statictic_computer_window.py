@@ -1,42 +1,88 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QComboBox, QPushButton, QTableWidget, QMessageBox, QTableWidgetItem
-
-
-class ComputerUsageStatisticsWidget(QWidget):
-    def __init__(self, business_logic):
-        super().__init__()
-        self.business_logic = business_logic
-        self.setLayout(QVBoxLayout())
-
-        self.period_filter = QComboBox()
-        self.period_filter.addItems(["За текущий день", "За текущий месяц", "За текущий год"])
-        self.layout().addWidget(self.period_filter)
-
-        self.load_button = QPushButton("Загрузить")
-        self.load_button.clicked.connect(self.load_statistics)
-        self.layout().addWidget(self.load_button)
-
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Компьютер", "Количество аренд", "Общее время аренды (часов)"])
-        self.layout().addWidget(self.table)
-
-    def load_statistics(self):
-        """Загружает статистику использования компьютеров."""
-        period_map = {"За текущий день": "day", "За текущий месяц": "month", "За текущий год": "year"}
-        selected_period = self.period_filter.currentText()
-        period = period_map[selected_period]
-
-        try:
-            stats = self.business_logic.get_computer_usage_statistics(period)
-            self.populate_table(stats)
-        except Exception as e:
-            QMessageBox.critical(self, "Ошибка", f"Не удалось загрузить статистику: {e}")
-
-    def populate_table(self, stats):
-        """Заполняет таблицу статистики."""
-        self.table.setRowCount(len(stats))
-        for row, stat in enumerate(stats):
-            self.table.setItem(row, 0, QTableWidgetItem(stat["computer_name"]))
-            self.table.setItem(row, 1, QTableWidgetItem(str(stat["rental_count"])))
-            self.table.setItem(row, 2, QTableWidgetItem(f"{stat['total_rental_hours']:.2f}"))
-        self.table.resizeColumnsToContents()
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton, QMessageBox, QLabel, \
+    QDateEdit
+from PyQt6.QtCore import QDate
+
+from functools import partial
+
+from ui.export_dialog import export_columns, export_to_file
+from ui.request_executor import RequestExecutor
+from ui.table_models import Column, RecordTableModel, RecordTableView
+
+
+class ComputerUsageStatisticsWidget(QWidget):
+    def __init__(self, business_logic):
+        super().__init__()
+        self.business_logic = business_logic
+        self.setLayout(QVBoxLayout())
+        self.executor = RequestExecutor(self)
+
+        self.period_filter = QComboBox()
+        self.period_filter.addItems(["За текущий день", "За текущий месяц", "За текущий год", "Произвольный период"])
+        self.period_filter.currentTextChanged.connect(self.update_range_visibility)
+        self.layout().addWidget(self.period_filter)
+
+        self.range_widget = QWidget()
+        self.range_widget.setLayout(QHBoxLayout())
+        self.range_widget.layout().setContentsMargins(0, 0, 0, 0)
+        self.date_from = QDateEdit(QDate.currentDate().addDays(-6))
+        self.date_to = QDateEdit(QDate.currentDate())
+        for label, date_edit in (("С", self.date_from), ("По", self.date_to)):
+            date_edit.setCalendarPopup(True)
+            date_edit.setMaximumDate(QDate.currentDate())
+            self.range_widget.layout().addWidget(QLabel(label))
+            self.range_widget.layout().addWidget(date_edit)
+        self.range_widget.hide()
+        self.layout().addWidget(self.range_widget)
+
+        self.load_button = QPushButton("Загрузить")
+        self.load_button.clicked.connect(self.load_statistics)
+        self.layout().addWidget(self.load_button)
+
+        self.export_button = QPushButton("Экспорт")
+        self.export_button.clicked.connect(self.export_statistics)
+        self.layout().addWidget(self.export_button)
+
+        self.loading_label = QLabel("Загрузка...")
+        self.loading_label.hide()
+        self.executor.loading_changed.connect(self.loading_label.setVisible)
+        self.layout().addWidget(self.loading_label)
+
+        self.model = RecordTableModel([
+            Column("Компьютер", "computer_name"),
+            Column("Количество аренд", "rental_count"),
+            Column("Общее время аренды (часов)", "total_rental_hours",
+                   display=lambda stat: f"{stat['total_rental_hours']:.2f}"),
+        ], key="computer_name")
+        self.table = RecordTableView(self.model)
+        self.layout().addWidget(self.table)
+
+    def current_request(self):
+        """Возвращает запрос статистики для выбранного периода."""
+        period_map = {"За текущий день": "day", "За текущий месяц": "month", "За текущий год": "year"}
+        selected_period = self.period_filter.currentText()
+        if selected_period in period_map:
+            return partial(self.business_logic.get_computer_usage_statistics, period_map[selected_period])
+        return partial(self.business_logic.get_computer_usage_statistics_range,
+                       self.date_from.date().toPyDate(), self.date_to.date().toPyDate())
+
+    def load_statistics(self):
+        """Загружает статистику использования компьютеров."""
+        self.executor.submit(
+            self.current_request(), self.populate_table,
+            lambda e: QMessageBox.critical(self, "Ошибка", f"Не удалось загрузить статистику: {e}"),
+            key="statistics"
+        )
+
+    def export_statistics(self):
+        """Выгружает статистику за выбранный период в CSV или XLSX."""
+        export_to_file(self, self.executor, self.current_request(), export_columns(self.model.columns),
+                       "computer_usage.csv")
+
+    def update_range_visibility(self, selected_period):
+        """Показывает выбор дат только для произвольного периода."""
+        self.range_widget.setVisible(selected_period == "Произвольный период")
+
+    def populate_table(self, stats):
+        """Заполняет таблицу статистики."""
+        with self.business_logic.metrics.timed("populate_table", type(self).__name__):
+            self.model.set_records(stats)
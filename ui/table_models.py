@@ -0,0 +1,318 @@
+import heapq
+from itertools import islice
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QPersistentModelIndex, QEvent, QRect, QTimer, \
+    QSortFilterProxyModel, pyqtSignal
+from PyQt6.QtWidgets import QTableView, QAbstractItemView, QStyledItemDelegate, QStyleOptionButton, QStyle, \
+    QHeaderView, QApplication
+
+from logic.record_diff import diff_records
+
+
+ACTIONS_ROLE = Qt.ItemDataRole.UserRole + 1
+RECORD_ROLE = Qt.ItemDataRole.UserRole + 2
+SORT_ROLE = Qt.ItemDataRole.UserRole + 3
+
+
+class Column:
+    """Описание колонки таблицы: заголовок, текст ячейки, значение для сортировки и кнопки действий."""
+
+    def __init__(self, title, field=None, display=None, sort_value=None, actions=None, alignment=None):
+        self.title = title
+        self.field = field
+        self.display = display or (lambda record: "" if record[field] is None else str(record[field]))
+        self.sort_value = sort_value or ((lambda record: record[field] or "") if field else self.display)
+        self.actions = actions
+        self.alignment = alignment
+
+    def snapshot(self, record):
+        """Все, что видно в ячейке; используется для поиска изменившихся колонок."""
+        return self.display(record), self.actions(record) if self.actions else None
+
+
+class RecordTableModel(QAbstractTableModel):
+    """Табличная модель над списком записей с ключом; обновления применяются точечно.
+
+    Если задан batch_size, строки показываются порциями по мере прокрутки (canFetchMore/fetchMore),
+    а когда локальные записи закончились и has_more_remote истинно, модель просит следующую страницу
+    сигналом more_requested.
+
+    filter_keys — множество ключей записей, которые нужно показывать (None — все записи); пока фильтр задан,
+    следующие страницы с сервера не запрашиваются. Подходящие записи находятся по позициям ключей, и из них берется
+    только текущая порция строк, поэтому смена фильтра не перебирает всю коллекцию.
+    """
+
+    more_requested = pyqtSignal()
+
+    def __init__(self, columns, key="id", batch_size=None, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.key = key
+        self.batch_size = batch_size
+        self.has_more_remote = False
+        self.filter_keys = None
+        self._limit = batch_size
+        self._all_records = []
+        self._keys = []
+        self._positions = {}
+        self._matched_count = 0
+        self._records = []
+        self._rows = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.columns[section].title
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self._records[index.row()]
+        column = self.columns[index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column.actions and column.actions(record):
+                return None
+            return column.display(record)
+        if role == ACTIONS_ROLE:
+            return column.actions(record) if column.actions else None
+        if role == RECORD_ROLE:
+            return record
+        if role == SORT_ROLE:
+            return column.sort_value(record)
+        if role == Qt.ItemDataRole.TextAlignmentRole and column.alignment is not None:
+            return column.alignment
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.batch_size is None:
+            return False
+        return self._matched_count > len(self._records) or (self.has_more_remote and self.filter_keys is None)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.batch_size is None:
+            return
+        self._limit = len(self._records) + self.batch_size
+        if self._matched_count > len(self._records):
+            self._apply(self._visible())
+        elif self.has_more_remote and self.filter_keys is None:
+            self.more_requested.emit()
+
+    def reset_paging(self):
+        """Возвращает показ к первой порции строк."""
+        self._limit = self.batch_size
+
+    def records(self):
+        return list(self._records)
+
+    def record(self, row):
+        return self._records[row]
+
+    def row_of(self, key):
+        return self._rows.get(key)
+
+    def set_records(self, records):
+        """Сравнивает новые записи с текущими по ключу и сообщает представлению только об изменениях."""
+        self._all_records = records
+        self._keys = [record[self.key] for record in records]
+        self._positions = {key: position for position, key in enumerate(self._keys)}
+        self._apply(self._visible())
+
+    def set_filter(self, keys):
+        """Показывает только записи с ключами из keys; None снимает фильтр."""
+        self.filter_keys = keys
+        self._apply(self._visible())
+
+    def _visible(self):
+        """Записи для показа: подходящие под фильтр в исходном порядке, не больше текущей порции."""
+        records, keys = self._all_records, self.filter_keys
+        if keys is None:
+            self._matched_count = len(records)
+            return records if self._limit is None else records[:self._limit]
+        positions = self._positions
+        count = len(keys) if positions.keys() >= keys else len(positions.keys() & keys)
+        self._matched_count = count
+        if self._limit is None:
+            rows = sorted(positions[key] for key in keys if key in positions)
+        elif count * count > self._limit * len(records):
+            # Подходит большая часть записей: быстрее пройти их по порядку, пока не наберется порция.
+            rows = islice((row for row, key in enumerate(self._keys) if key in keys), self._limit)
+        else:
+            rows = heapq.nsmallest(self._limit, (positions[key] for key in keys if key in positions))
+        return [records[row] for row in rows]
+
+    def _apply(self, records):
+        diff = diff_records(self._records, records, self.key)
+        if not self._records or len(diff["removed"]) > len(self._records) // 2:
+            self.beginResetModel()
+            self._records = list(records)
+            self._reindex()
+            self.endResetModel()
+            return
+
+        for row in sorted((self._rows[key] for key in diff["removed"]), reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._records[row]
+            self.endRemoveRows()
+        if diff["removed"]:
+            self._reindex()
+
+        new_by_key = {record[self.key]: record for record in records}
+        for key in diff["changed"]:
+            row = self._rows[key]
+            old_record, new_record = self._records[row], new_by_key[key]
+            self._records[row] = new_record
+            changed = [c for c, column in enumerate(self.columns)
+                       if column.snapshot(old_record) != column.snapshot(new_record)]
+            if changed:
+                self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+
+        if diff["added"]:
+            self._insert_added(records, set(diff["added"]))
+
+    def _insert_added(self, records, added):
+        """Вставляет новые записи на их места в порядке records, соседние — одной вставкой."""
+        row, run = 0, []
+        for record in records:
+            if record[self.key] in added:
+                run.append(record)
+                continue
+            if run:
+                self._insert_rows(row, run)
+                row += len(run)
+                run = []
+            row += 1
+        if run:
+            self._insert_rows(row, run)
+        self._reindex()
+
+    def _insert_rows(self, row, records):
+        self.beginInsertRows(QModelIndex(), row, row + len(records) - 1)
+        self._records[row:row] = records
+        self.endInsertRows()
+
+    def refresh_column(self, column, keys):
+        """Сообщает о смене значения колонки для записей с указанными ключами (например, таймера)."""
+        rows = [self._rows[key] for key in keys if key in self._rows]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), column), self.index(max(rows), column))
+
+    def _reindex(self):
+        self._rows = {record[self.key]: row for row, record in enumerate(self._records)}
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Рисует кнопки действий в ячейке вместо настоящих QPushButton и сообщает о нажатиях."""
+
+    action_triggered = pyqtSignal(str, object)
+
+    MARGIN = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pressed = None
+
+    def paint(self, painter, option, index):
+        actions = index.data(ACTIONS_ROLE)
+        if not actions:
+            super().paint(painter, option, index)
+            return
+        style = option.widget.style() if option.widget else QApplication.style()
+        for number, (action, label) in enumerate(actions):
+            button = QStyleOptionButton()
+            button.rect = self.button_rect(option.rect, number, len(actions))
+            button.text = label
+            button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            if self._pressed == (QPersistentModelIndex(index), number):
+                button.state |= QStyle.StateFlag.State_Sunken
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        actions = index.data(ACTIONS_ROLE)
+        if not actions or event.type() not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+
+        position = event.position().toPoint()
+        number = next((n for n in range(len(actions))
+                       if self.button_rect(option.rect, n, len(actions)).contains(position)), None)
+        pressed = (QPersistentModelIndex(index), number)
+        if event.type() == QEvent.Type.MouseButtonPress:
+            self._pressed = pressed if number is not None else None
+        else:
+            was_pressed, self._pressed = self._pressed, None
+            if number is not None and was_pressed == pressed:
+                record = index.data(RECORD_ROLE)
+                QTimer.singleShot(0, lambda: self.action_triggered.emit(actions[number][0], record))
+        if option.widget:
+            option.widget.viewport().update(option.rect)
+        return number is not None
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        actions = index.data(ACTIONS_ROLE)
+        if actions:
+            width = max(option.fontMetrics.horizontalAdvance(label) for _, label in actions) + 4 * self.MARGIN
+            height = len(actions) * (option.fontMetrics.height() + 10) + self.MARGIN * (len(actions) + 1)
+            size.setWidth(max(size.width(), width))
+            size.setHeight(max(size.height(), height))
+        return size
+
+    def button_rect(self, rect, number, count):
+        """Делит ячейку по вертикали на одинаковые кнопки."""
+        height = (rect.height() - self.MARGIN * (count + 1)) // count
+        top = rect.top() + self.MARGIN + number * (height + self.MARGIN)
+        return QRect(rect.left() + self.MARGIN, top, rect.width() - 2 * self.MARGIN, height)
+
+
+class RecordTableView(QTableView):
+    """Таблица над RecordTableModel с сортировкой, фильтрацией через прокси и кнопками-делегатами."""
+
+    action_triggered = pyqtSignal(str, object)
+
+    # Подгонка ширины колонок откладывается, чтобы серия обновлений (например, ввод в строку поиска) вызвала ее
+    # один раз, а не на каждое изменение.
+    RESIZE_DELAY = 150
+
+    def __init__(self, model, action_column=None, row_height=None, fit_rows=False, parent=None):
+        super().__init__(parent)
+        self.source_model = model
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(model)
+        self.proxy.setSortRole(SORT_ROLE)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.proxy.setFilterKeyColumn(-1)
+        self.setModel(self.proxy)
+        self.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.setSortingEnabled(True)
+        self.horizontalHeader().setResizeContentsPrecision(100)
+
+        if row_height:
+            self.verticalHeader().setDefaultSectionSize(row_height)
+        if fit_rows:
+            self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+
+        self.delegate = None
+        if action_column is not None:
+            self.delegate = ActionButtonDelegate(self)
+            self.delegate.action_triggered.connect(self.action_triggered)
+            self.setItemDelegateForColumn(action_column, self.delegate)
+
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(self.RESIZE_DELAY)
+        self.resize_timer.timeout.connect(self.resizeColumnsToContents)
+        model.modelReset.connect(self.resize_timer.start)
+        model.rowsInserted.connect(self.resize_timer.start)
+
+    def selected_records(self):
+        """Возвращает записи выделенных строк в порядке их отображения."""
+        rows = sorted(index.row() for index in self.selectionModel().selectedRows())
+        return [self.proxy.index(row, 0).data(RECORD_ROLE) for row in rows]